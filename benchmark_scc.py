@@ -0,0 +1,64 @@
+# Course: CS261 - Data Structures
+# Author: Mohamed Al-Hussein
+# Assignment: 06
+# Description: Benchmark of sequential and parallel strongly connected components on random graphs.
+
+import argparse
+import os
+import random
+import time
+
+from d_graph import DirectedGraph
+
+
+def random_graph(v_count: int, degree: float, seed: int) -> DirectedGraph:
+    """
+    Returns a random graph on the csr backend with about degree outgoing edges per vertex.
+
+    With an average degree a little above 1 the graph holds one large component alongside many small ones, which is
+    typical of call graphs.
+    """
+
+    rng: random.Random = random.Random(seed)
+    edges: set = set()
+    for _ in range(int(v_count * degree)):
+        src, dst = rng.randrange(v_count), rng.randrange(v_count)
+        if src != dst:
+            edges.add((src, dst, 1))
+
+    return DirectedGraph.from_edges(sorted(edges), v_count=v_count, backend="csr")
+
+
+def timed(function, *args) -> (float, object):
+    """Returns the seconds taken by a call of function, along with its result."""
+
+    start: float = time.perf_counter()
+    result = function(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description="Compare sequential and parallel SCC search.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000],
+                        help="numbers of vertices to benchmark")
+    parser.add_argument("--degree", type=float, default=1.5, help="average number of outgoing edges per vertex")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="number of worker processes")
+    parser.add_argument("--seed", type=int, default=0)
+    args: argparse.Namespace = parser.parse_args()
+
+    print(f"{'vertices':>10} {'edges':>10} {'components':>10} {'sequential':>11} {'parallel':>11} {'speedup':>8}")
+    for v_count in args.sizes:
+        d_graph: DirectedGraph = random_graph(v_count, args.degree, args.seed)
+        sequential_time, sequential = timed(d_graph.connected_components)
+        parallel_time, parallel = timed(d_graph.connected_components, args.workers)
+
+        # The parallel search lists vertices in ascending order, and may order unrelated components differently.
+        if sorted(map(sorted, sequential)) != sorted(parallel):
+            raise AssertionError(f"components differ for {v_count} vertices")
+
+        print(f"{v_count:>10} {d_graph.edge_count:>10} {len(parallel):>10} {sequential_time:>10.3f}s "
+              f"{parallel_time:>10.3f}s {sequential_time / parallel_time:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,8 +3,24 @@
 # Assignment: 06
 # Description: Directed graph implementation.
 
+from array import array
 from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import chain, compress
+from multiprocessing import shared_memory
+import bisect
 import heapq
+import math
+import mmap as mmap_module
+import os
+import tempfile
+import weakref
+
+from export import dot_id, vertex_subset, write_lines
+from graph_file import DIRECTED, read_arrays, write_arrays
+from journal import Journal, journaled
+from shared_arrays import share_arrays, shared_views
+from traversal import breadth_first, depth_first, level_bfs
 
 
 class DirectedGraph:
@@ -14,8 +30,17 @@ class DirectedGraph:
     - loops not allowed
     - only positive edge weights
     - vertex names are integers
+
+    Edges are kept in one of the following storage backends:
+    - "dense": adjacency matrix (default)
+    - "sparse": per-vertex adjacency dicts, for large graphs with few edges
+    - "csr": read-only compressed sparse row arrays, for frozen graphs
+    - "mapped": adjacency matrix in a memory-mapped temporary file, for dense graphs that don't fit in memory
     """
 
+    # Journal that records every change to the graph, if the graph was opened through one.
+    _journal: Journal = None
+
     def __init__(self, start_edges=None):
         """
         Store graph info as adjacency matrix
@@ -52,6 +77,132 @@ class DirectedGraph:
         out = f"GRAPH ({self.v_count} vertices):\n{out}"
         return out
 
+    def __getstate__(self) -> dict:
+        """Pickles the graph without its journal, which stays with the process that opened it."""
+
+        state: dict = dict(self.__dict__)
+        state.pop("_journal", None)
+
+        return state
+
+    @classmethod
+    def from_edges(cls, edges, v_count: int = None, backend: str = "dense") -> "DirectedGraph":
+        """
+        Returns a new graph holding the given (src, dst, weight) edges in the given backend ("dense", "sparse", "csr"
+        or "mapped").
+
+        If v_count is not given, the graph gets just enough vertices to hold every edge. Edges are checked with the
+        same rules as add_edge() and storage is allocated once for the whole batch. A "csr" graph is read-only once
+        built, and a "mapped" graph keeps its matrix in a temporary file instead of in memory.
+        """
+
+        if backend not in _BACKENDS:
+            raise ValueError(f"unknown backend: {backend!r}")
+
+        if not isinstance(edges, (list, tuple)):
+            edges = list(edges)
+
+        if v_count is None:
+            v_count = 0
+            for src, dst, _ in edges:
+                v_count = max(v_count, src + 1, dst + 1)
+
+        d_graph: DirectedGraph = cls()
+        d_graph.v_count = v_count
+        batch: dict = d_graph._edge_batch(edges)
+
+        # Compressed rows must be filled in ascending (src, dst) order.
+        batch_edges = ((src, dst, weight) for (src, dst), weight in batch.items())
+        if backend == "csr":
+            batch_edges = sorted(batch_edges)
+
+        d_graph._store = _BACKENDS[backend].from_edges(v_count, batch_edges)
+
+        return d_graph
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> "DirectedGraph":
+        """
+        Returns a graph read from a file written by save(), held by the read-only "csr" backend.
+
+        If mmap is True, the arrays are memory-mapped rather than read, so loading takes milliseconds whatever the
+        size of the graph, and processes that load the same file share its pages. Raises ValueError if the file does
+        not hold a directed graph.
+        """
+
+        d_graph: DirectedGraph = cls()
+        d_graph._store = _CSRStorage.load(path, mmap)
+        d_graph.v_count = len(d_graph._store.offsets) - 1
+
+        return d_graph
+
+    def save(self, path: str) -> None:
+        """
+        Writes the graph to path as compressed sparse rows in the binary graph file format.
+
+        Removed vertices are written as vertices without edges, so call compact() first to leave them out.
+        """
+
+        store: _CSRStorage = self._csr_store()
+        write_arrays(path, DIRECTED, self.v_count, [store.offsets, store.targets, store.weights,
+                                                     store.in_offsets, store.in_sources, store.in_weights])
+
+    @classmethod
+    def _from_snapshot(cls, path: str, metadata: dict) -> "DirectedGraph":
+        """Returns a graph rebuilt from a snapshot written by _snapshot() and its metadata."""
+
+        d_graph: DirectedGraph = cls.load(path, mmap=False)
+        d_graph.set_backend(metadata["backend"])
+        if metadata["removed"]:
+            d_graph._removed = set(metadata["removed"])
+
+        return d_graph
+
+    def _snapshot(self, path: str) -> dict:
+        """Saves the graph to path for a journal, and returns the metadata needed to rebuild it."""
+
+        self.save(path)
+        return {"backend": self.backend, "removed": sorted(self._removed)}
+
+    @property
+    def backend(self) -> str:
+        """Name of the storage backend currently holding the graph's edges."""
+
+        return self._store.name
+
+    @journaled
+    def set_backend(self, backend: str) -> None:
+        """
+        Moves all edges of the graph into the given storage backend ("dense", "sparse" or "csr").
+
+        Does nothing if the graph already uses that backend.
+        """
+
+        if backend not in _BACKENDS:
+            raise ValueError(f"unknown backend: {backend!r}")
+
+        if backend != self.backend:
+            self._store = _BACKENDS[backend].from_edges(self.v_count, self._store.edges())
+
+    @property
+    def adj_matrix(self) -> []:
+        """
+        Adjacency matrix of the graph, where adj_matrix[src][dst] holds the weight of the edge from src to dst or 0.
+
+        The nested lists are built from the backend on demand and are only a snapshot of the graph. Its rows are
+        read-only and raise TypeError when written to, so use add_edge() and remove_edge() to change the graph.
+        """
+
+        return list(self._store.rows())
+
+    @adj_matrix.setter
+    def adj_matrix(self, matrix: []) -> None:
+        """Replaces the edges of the graph with those of a dense adjacency matrix."""
+
+        self._store = _DenseStorage(matrix)
+        self.v_count = len(matrix)
+        self._removed = frozenset()
+
     def add_vertex(self) -> int:
         """
         Adds new vertex to the graph.
@@ -59,18 +210,25 @@ class DirectedGraph:
         Returns new number of vertices in graph.
         """
 
-        # Extend matrix by one column.
-        for row in self.adj_matrix:
-            row.append(0)
+        return self.add_vertices(1)
+
+    @journaled
+    def add_vertices(self, n: int) -> int:
+        """
+        Adds n new vertices to the graph, allocating storage for all of them at once.
+
+        Returns new number of vertices in graph.
+        """
 
-        # Extend matrix by one row.
-        self.adj_matrix.append([0] * (self.v_count + 1))
+        if n > 0:
+            self._store.add_vertices(n)
 
-        # Update vertex count.
-        self.v_count += 1
+            # Update vertex count.
+            self.v_count += n
 
         return self.v_count
 
+    @journaled
     def add_edge(self, src: int, dst: int, weight=1) -> None:
         """
         Adds a new edge to the graph, connecting src vertex to dst vertex.
@@ -81,8 +239,20 @@ class DirectedGraph:
 
         # Only update weight if src and dst exist and don't point to same vertex and weight is positive.
         if self._is_valid_edge(src, dst) and weight >= 1:
-            self.adj_matrix[src][dst] = weight
+            self._store.set_weight(src, dst, weight)
+
+    @journaled(iterable="edges")
+    def add_edges(self, edges) -> None:
+        """
+        Adds all (src, dst, weight) edges to the graph in one batch.
+
+        Edges are checked with the same rules as add_edge(): invalid edges are skipped, and if an edge appears more
+        than once its last weight is kept.
+        """
+
+        self._store.set_weights((src, dst, weight) for (src, dst), weight in self._edge_batch(edges).items())
 
+    @journaled
     def remove_edge(self, src: int, dst: int) -> None:
         """
         Removes an edge between src and dst vertices.
@@ -92,11 +262,60 @@ class DirectedGraph:
 
         # Only remove edge if vertices exist.
         if self._is_valid_edge(src, dst):
-            self.adj_matrix[src][dst] = 0
+            self._store.remove_edge(src, dst)
+
+    @journaled
+    def remove_vertex(self, v: int) -> None:
+        """
+        Removes vertex v and all of its incoming and outgoing edges.
+
+        If vertex does not exist, does nothing and returns to caller.
+
+        Only the edges of v are touched. Its id is left behind as a tombstone, so the ids of other vertices don't
+        change and the id is not reused; call compact() to renumber the remaining vertices.
+        """
+
+        if not self._has_vertex(v):
+            return
+
+        self._store.clear_vertex(v)
+        if not self._removed:
+            self._removed = set()
+        self._removed.add(v)
+
+    @journaled
+    def compact(self) -> []:
+        """
+        Renumbers the remaining vertices to fill the ids left by removed vertices, keeping their relative order.
+
+        Returns a list mapping each old vertex id to its new id, or to -1 if the vertex was removed.
+        """
+
+        if not self._removed:
+            return list(range(self.v_count))
+
+        mapping: list = [-1] * self.v_count
+        v_count: int = 0
+        for v in range(self.v_count):
+            if v not in self._removed:
+                mapping[v] = v_count
+                v_count += 1
+
+        # The mapping keeps vertices in order, so the edges stay in ascending (src, dst) order.
+        self._store = _BACKENDS[self.backend].from_edges(
+            v_count, ((mapping[src], mapping[dst], weight) for src, dst, weight in self._store.edges())
+        )
+        self.v_count = v_count
+        self._removed = frozenset()
+
+        return mapping
 
     def get_vertices(self) -> []:
         """Returns a list of vertices of the graph."""
 
+        if self._removed:
+            return [v for v in range(self.v_count) if v not in self._removed]
+
         return [_ for _ in range(self.v_count)]
 
     def get_edges(self) -> []:
@@ -105,15 +324,24 @@ class DirectedGraph:
         in graph.
         """
 
-        edges: list = list()
+        return list(self.iter_edges())
 
-        for i in range(self.v_count):
-            for j in range(self.v_count):
-                # Edge exists between vertex i and j.
-                if self.adj_matrix[i][j] > 0:
-                    edges.append((i, j, self.adj_matrix[i][j]))
+    def iter_edges(self):
+        """Lazily yield (src, dst, weight) for every edge in the graph, in ascending (src, dst) order."""
+
+        return self._store.edges()
 
-        return edges
+    @property
+    def vertex_count(self) -> int:
+        """Number of vertices in the graph, not counting removed vertices."""
+
+        return self.v_count - len(self._removed)
+
+    @property
+    def edge_count(self) -> int:
+        """Number of edges in the graph, kept up to date as edges are added and removed."""
+
+        return self._store.edge_count
 
     def is_valid_path(self, path: []) -> bool:
         """
@@ -126,7 +354,7 @@ class DirectedGraph:
         if len(path) == 0:
             return True
         elif len(path) == 1:
-            if 0 <= path[0] < self.v_count:
+            if self._has_vertex(path[0]):
                 return True
             else:
                 return False
@@ -155,15 +383,20 @@ class DirectedGraph:
         visited: list = list()
 
         # Check if v_start is in graph.
-        if not 0 <= v_start < self.v_count:
+        if not self._has_vertex(v_start):
             return visited
 
         # Check if v_end is in graph.
-        if isinstance(v_end, int) and not 0 <= v_end < self.v_count:
+        if isinstance(v_end, int) and not self._has_vertex(v_end):
             v_end = None
 
         # Traverse graph until we either reach v_end or traverse every vertex.
-        return self._dfs(v_start, v_end)
+        for v, _, _ in self.iter_dfs(v_start):
+            visited.append(v)
+            if v == v_end:
+                break
+
+        return visited
 
     def bfs(self, v_start: int, v_end: int = None) -> []:
         """
@@ -178,40 +411,143 @@ class DirectedGraph:
         visited: list = list()
 
         # Check if v_start is in graph.
-        if not 0 <= v_start < self.v_count:
+        if not self._has_vertex(v_start):
             return visited
 
         # Check if v_end is in graph.
-        if isinstance(v_end, int) and not 0 <= v_end < self.v_count:
+        if isinstance(v_end, int) and not self._has_vertex(v_end):
             v_end = None
 
         # Traverse graph until we either reach v_end or traverse every vertex.
-        vertices: deque = deque()
-        vertices.appendleft(v_start)
-        while len(vertices) > 0:
-            v: int = vertices.pop()
-            if v not in visited:
-                # Add vertex to visited vertices.
-                visited.append(v)
-
-                # Stop if vertex is equal to v_end.
-                if v == v_end:
-                    break
-
-                # Add all neighbors of vertex in descending order so that they are popped in ascending order.
-                for neighbor in self.neighbors(v):
-                    vertices.appendleft(neighbor)
+        for v, _, _ in self.iter_bfs(v_start):
+            visited.append(v)
+            if v == v_end:
+                break
 
         return visited
 
+    def iter_dfs(self, v_start: int, max_depth: int = None, prune=None):
+        """
+        Lazily yield (vertex, depth, parent) for every vertex visited during DFS search from v_start vertex.
+
+        If v_start is not in the graph, yields nothing.
+        Vertices deeper than the optional max_depth are not visited. If the optional prune(vertex, depth) callback
+        returns True, the search does not continue past that vertex.
+
+        Vertices are picked in ascending order.
+        """
+
+        if not self._has_vertex(v_start):
+            return iter(())
+
+        return depth_first(v_start, self._store.neighbors, max_depth, prune)
+
+    def iter_bfs(self, v_start: int, max_depth: int = None, prune=None):
+        """
+        Lazily yield (vertex, depth, parent) for every vertex visited during BFS search from v_start vertex.
+
+        If v_start is not in the graph, yields nothing.
+        Vertices deeper than the optional max_depth are not visited. If the optional prune(vertex, depth) callback
+        returns True, the search does not continue past that vertex.
+
+        Vertices are picked in ascending order.
+        """
+
+        if not self._has_vertex(v_start):
+            return iter(())
+
+        return breadth_first(v_start, self._store.neighbors, max_depth, prune)
+
+    def bfs_levels(self, sources, max_depth: int = None) -> (array, array):
+        """
+        Returns an array of the BFS distance of every vertex from the closest of the source vertices, and an array of
+        its parent on a shortest path, with -1 for vertices that weren't reached.
+
+        Sources have distance 0 and parent -1, and sources that are not in the graph are ignored. Vertices deeper than
+        the optional max_depth are not reached. The parent of a vertex is its smallest incoming neighbor one level up.
+
+        Expands a whole level of vertices at a time, switching to scanning incoming edges from the unreached vertices
+        when the frontier grows large, which suits reachability sweeps over large graphs on the sparse or csr backend.
+        """
+
+        return level_bfs([v for v in sources if self._has_vertex(v)], self.v_count, self._store.neighbors,
+                         self._store.in_neighbors, self._store.out_degree, self.edge_count, max_depth)
+
     def has_cycle(self):
         """Return True if graph contains a cycle."""
 
-        # If any of the strongly connected components (SCC) of the graph contain more than one vertex, then that SCC
-        # contains a cycle and so does the graph.
-        for component in self.connected_components():
-            if len(component) > 1:
-                return True
+        return len(self.find_cycle()) > 0
+
+    def find_cycle(self) -> []:
+        """
+        Return the vertices of a cycle in the graph, in path order, or an empty list if the graph is acyclic.
+
+        The last vertex in the list has an edge back to the first one. Uses a DFS that stops at the first back edge it
+        finds.
+        """
+
+        # White vertices are unvisited, grey ones are on the current DFS path, and black ones are finished.
+        white, grey, black = 0, 1, 2
+        color: bytearray = bytearray(self.v_count)
+
+        for v_start in range(self.v_count):
+            if color[v_start] != white:
+                continue
+
+            color[v_start] = grey
+            path: list = [v_start]
+            frames: list = [iter(self._store.neighbors(v_start))]
+            while frames:
+                for neighbor in frames[-1]:
+                    if color[neighbor] == white:
+                        color[neighbor] = grey
+                        path.append(neighbor)
+                        frames.append(iter(self._store.neighbors(neighbor)))
+                        break
+                    elif color[neighbor] == grey:
+                        # An edge back to a vertex on the current path closes a cycle.
+                        return path[path.index(neighbor):]
+                else:
+                    color[path.pop()] = black
+                    frames.pop()
+
+        return []
+
+    def would_create_cycle(self, src: int, dst: int) -> bool:
+        """
+        Return True if adding an edge from src to dst would close a cycle, i.e. if dst already has a path to src.
+
+        Returns False if the edge is not valid. Searches forward from dst and backward from src at the same time,
+        always growing the smaller frontier, so only the neighborhood of the two vertices is explored.
+        """
+
+        if not self._is_valid_edge(src, dst):
+            return False
+
+        forward: set = {dst}
+        backward: set = {src}
+        forward_frontier: list = [dst]
+        backward_frontier: list = [src]
+
+        while forward_frontier and backward_frontier:
+            if len(forward_frontier) <= len(backward_frontier):
+                frontier, reached, other, adjacent = forward_frontier, forward, backward, self._store.neighbors
+            else:
+                frontier, reached, other, adjacent = backward_frontier, backward, forward, self._store.in_neighbors
+
+            next_frontier: list = list()
+            for v in frontier:
+                for neighbor in adjacent(v):
+                    if neighbor in other:
+                        return True
+                    if neighbor not in reached:
+                        reached.add(neighbor)
+                        next_frontier.append(neighbor)
+
+            if frontier is forward_frontier:
+                forward_frontier = next_frontier
+            else:
+                backward_frontier = next_frontier
 
         return False
 
@@ -222,32 +558,144 @@ class DirectedGraph:
         If a vertex is not reachable, then its distance is infinity.
         """
 
-        distances: list = list()
+        if self.is_empty() or not self._has_vertex(src):
+            return list()
 
-        if self.is_empty() or not 0 <= src < self.v_count:
-            return distances
+        return self._dijkstra([src])[0]
 
-        # Create priority queue containing first vertex with distance 0.
-        vertices: list = list()
-        heapq.heappush(vertices, (0, src))
-        visited: dict = dict()
+    def dijkstra_many(self, sources, workers: int = None) -> []:
+        """
+        Returns a list holding, for each of the source vertices, an array of its distances to every vertex.
 
-        # Iterate through priority queue, updating min distance for each vertex.
-        while vertices:
-            dist_v, v = heapq.heappop(vertices)
-            if v not in visited:
-                visited[v] = dist_v
-                for neighbor in self.neighbors(v):
-                    d_neighbor: int = self.adj_matrix[v][neighbor]
-                    heapq.heappush(vertices, (dist_v + d_neighbor, neighbor))
+        Distances to vertices that are not reachable are infinity, as are all distances from sources that are not in
+        the graph. If workers is greater than 1, the searches are spread over a pool of that many worker processes.
+        The edges are placed in shared memory once as compressed sparse rows, and each worker writes its rows
+        straight into a distance matrix in shared memory, so neither the graph nor the distances are pickled.
+        """
 
-        # Update distances with min distance for each vertex, or inf if they are not reachable.
-        for v in self.get_vertices():
-            dist: int = visited.get(v, float("inf"))
-            distances.append(dist)
+        sources = [src if self._has_vertex(src) else -1 for src in sources]
+        if workers is None or workers <= 1 or len(sources) <= 1:
+            return [array("d", self._dijkstra([src])[0]) for src in sources]
+
+        store: _CSRStorage = self._csr_store()
+        csr: list = [store.offsets, store.targets, store.weights]
+        graph_block, graph_layout = share_arrays(csr)
+        matrix_block, matrix_layout = share_arrays([("d", len(sources) * self.v_count)])
+        try:
+            # Hand out sources in chunks, several per worker, so that workers that finish early pick up more.
+            chunk_size: int = max(1, len(sources) // (4 * workers))
+            starts: range = range(0, len(sources), chunk_size)
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_shared_worker,
+                                     initargs=([(graph_block.name, graph_layout),
+                                                (matrix_block.name, matrix_layout)],)) as executor:
+                list(executor.map(_dijkstra_rows, starts, [sources[i:i + chunk_size] for i in starts]))
+
+            # Copy the rows out of the matrix, which starts at the beginning of its block.
+            row_size: int = 8 * self.v_count
+            distances: list = list()
+            for i in range(len(sources)):
+                row: array = array("d")
+                row.frombytes(matrix_block.buf[i * row_size:(i + 1) * row_size])
+                distances.append(row)
+        finally:
+            for block in (graph_block, matrix_block):
+                block.close()
+                block.unlink()
 
         return distances
 
+    def shortest_paths(self, sources, targets=None) -> ([], []):
+        """
+        Returns a list of distances and a list of predecessors for every vertex, measured from the closest of the
+        given source vertices.
+
+        The predecessor of a vertex is the vertex before it on a shortest path, or -1 for sources and vertices that
+        weren't reached. If targets are given, the search stops as soon as all of them are settled, and vertices that
+        weren't settled by then have distance infinity. Sources and targets that are not in the graph are ignored.
+        """
+
+        return self._dijkstra(sources, targets)
+
+    def shortest_path(self, src: int, dst: int) -> ([], int):
+        """
+        Returns the vertices of a shortest path from src vertex to dst vertex, along with its length.
+
+        If dst is not reachable from src, or either vertex is not in the graph, returns an empty path and infinity.
+        """
+
+        if not (self._has_vertex(src) and self._has_vertex(dst)):
+            return list(), float("inf")
+
+        distances, predecessors = self._dijkstra([src], [dst])
+        if distances[dst] == float("inf"):
+            return list(), distances[dst]
+
+        # Walk predecessors back from dst to src.
+        path: list = [dst]
+        while path[-1] != src:
+            path.append(predecessors[path[-1]])
+        path.reverse()
+
+        return path, distances[dst]
+
+    def all_pairs_shortest_paths(self, sources=None, targets=None, next_hops: bool = False, method: str = "auto",
+                                 workers: int = None) -> ([], []):
+        """
+        Returns a distance table and an optional next-hop table between the given sources and targets.
+
+        Row i of the distance table is an array of distances from sources[i] to each of the targets, with infinity
+        for unreachable vertices. Sources and targets default to all vertices. If next_hops is True, a table of the
+        same shape holds the vertex that follows sources[i] on a shortest path to targets[j], or -1 if there is none;
+        otherwise None is returned in its place.
+
+        The method is either "floyd_warshall", which suits small dense graphs, or "dijkstra", which runs one search
+        per source and can spread them over a pool of worker processes. "auto" picks Floyd-Warshall when every row is
+        requested and the graph holds more than V^2 / log2(V) edges, where its O(V^3) time beats V Dijkstra searches,
+        and Dijkstra otherwise.
+        """
+
+        if method not in ("auto", "floyd_warshall", "dijkstra"):
+            raise ValueError(f"unknown method: {method!r}")
+
+        sources = self.get_vertices() if sources is None else [v for v in sources if self._has_vertex(v)]
+        targets = self.get_vertices() if targets is None else [v for v in targets if self._has_vertex(v)]
+
+        if method == "auto":
+            dense: bool = self.edge_count * math.log2(max(2, self.vertex_count)) > self.vertex_count ** 2
+            method = "floyd_warshall" if dense and len(sources) == self.vertex_count else "dijkstra"
+
+        if method == "floyd_warshall":
+            distances, hops = self._floyd_warshall(next_hops)
+            distances = [array("d", [distances[src][dst] for dst in targets]) for src in sources]
+            if next_hops:
+                hops = [array("q", [hops[src][dst] for dst in targets]) for src in sources]
+
+            return distances, hops
+
+        # Spread distance-only searches over workers that share the graph and the distance matrix.
+        if workers is not None and workers > 1 and len(sources) > 1 and not next_hops:
+            rows: list = self.dijkstra_many(sources, workers)
+            if targets != list(range(self.v_count)):
+                rows = [array("d", [row[dst] for dst in targets]) for row in rows]
+
+            return rows, None
+
+        # Run one Dijkstra search per source, either here or spread over worker processes that each receive a copy
+        # of the graph once.
+        if workers is not None and workers > 1 and len(sources) > 1:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(self,)) as executor:
+                rows: list = list(executor.map(
+                    _shortest_path_row, sources, [targets] * len(sources), [next_hops] * len(sources),
+                    chunksize=max(1, len(sources) // (4 * workers))
+                ))
+        else:
+            rows = [self._shortest_path_row(src, targets, next_hops) for src in sources]
+
+        distances: list = [row[0] for row in rows]
+        hops: list = [row[1] for row in rows] if next_hops else None
+
+        return distances, hops
+
     def are_adjacent(self, src: int, dst: int) -> bool:
         """Returns True if src vertex has an outgoing edge that connects to dst vertex."""
 
@@ -255,172 +703,1486 @@ class DirectedGraph:
         if not self._is_valid_edge(src, dst):
             return False
 
-        return self.adj_matrix[src][dst] > 0
+        return self._store.weight(src, dst) > 0
 
-    def connected_components(self) -> []:
+    def connected_components(self, workers: int = None) -> []:
         """
         Return a list of lists containing all strongly connected components (SCC) of the graph.
 
-        Uses Kosaraju's algorithm to detect all SCCs.
+        Components are listed in topological order, so edges between different components always point from an
+        earlier component to a later one.
+
+        If workers is greater than 1, the components are found by forward-backward search with trimming on a pool of
+        that many worker processes, which share the edges as compressed sparse rows in shared memory. The vertices of
+        each component are then listed in ascending order, and components that don't reach each other may be listed
+        in a different order than by the sequential search.
         """
 
-        components: list = list()
+        if workers is None or workers <= 1:
+            return self._tarjan()[0]
 
-        if self.is_empty():
-            return components
+        return self._parallel_components(workers)
+
+    def component_ids(self) -> []:
+        """
+        Return a list mapping each vertex to the index of its strongly connected component in the list returned by
+        connected_components().
+        """
 
-        # Iterate through all vertices via DFS.
-        # The top_stack maintains a topological sorting of all visited vertices.
-        top_stack: deque = deque()
-        vertices: deque = deque()
-        for v in self.get_vertices():
-            vertices.appendleft(v)
+        return self._tarjan()[1]
 
-        _: list = self._dfs_complete(vertices, top_stack=top_stack)
+    def condensation(self) -> ("DirectedGraph", []):
+        """
+        Return the condensation of the graph together with the list returned by component_ids().
 
-        # Reverse graph to perform second round of DFS.
-        d_reverse: DirectedGraph = self.reversed()
-        self.adj_matrix, d_reverse.adj_matrix = d_reverse.adj_matrix, self.adj_matrix
+        The condensation is a DAG with one vertex per strongly connected component, and an edge between two
+        components whenever any of their vertices are joined by an edge. The weight of that edge is the smallest
+        weight among them.
+        """
 
-        # Iterate through all vertices in reverse order via DFS.
-        components = self._dfs_complete(top_stack)
+        components, component_ids = self._tarjan()
 
-        # Reverse graph again to return to original form.
-        self.adj_matrix = d_reverse.adj_matrix
+        # Collapse edges between different components, keeping the lightest one.
+        dag_edges: dict = dict()
+        for src, dst, weight in self._store.edges():
+            c_src, c_dst = component_ids[src], component_ids[dst]
+            if c_src != c_dst and weight < dag_edges.get((c_src, c_dst), float("inf")):
+                dag_edges[c_src, c_dst] = weight
 
-        return components
+        dag: DirectedGraph = DirectedGraph.from_edges(
+            [(c_src, c_dst, weight) for (c_src, c_dst), weight in dag_edges.items()],
+            v_count=len(components), backend=self.backend
+        )
+
+        return dag, component_ids
 
     def reversed(self) -> "DirectedGraph":
         """Returns a new DirectedGraph with outgoing edges swapped with incoming and vice versa."""
 
-        # Initialize new empty digraph with similar number of vertices.
+        # Initialize new empty digraph with the same vertices and backend, then move the reversed edges into it.
         d_graph: DirectedGraph = DirectedGraph()
-        for _ in range(self.v_count):
-            d_graph.add_vertex()
-
-        # Reflect edges over matrix diagonal to reverse their orientation then add them to new digraph.
-        for i in range(self.v_count):
-            for j in range(self.v_count):
-                d_graph.adj_matrix[i][j] = self.adj_matrix[j][i]
+        d_graph._store = self._store.reversed()
+        d_graph.v_count = self.v_count
+        if self._removed:
+            d_graph._removed = set(self._removed)
 
         return d_graph
 
     def neighbors(self, v: int) -> []:
         """Return all vertices that vertex v has an outgoing edge to."""
 
-        neighbors: list = list()
+        return list(self._store.neighbors(v))
 
-        for i in range(self.v_count):
-            if self.adj_matrix[v][i] > 0:
-                neighbors.append(i)
+    def in_neighbors(self, v: int) -> []:
+        """Return all vertices that have an outgoing edge to vertex v."""
 
-        return neighbors
+        return list(self._store.in_neighbors(v))
+
+    def out_degree(self, v: int) -> int:
+        """
+        Returns the number of outgoing edges of vertex v.
+
+        Returns -1 if vertex does not exist.
+        """
+
+        return self._store.out_degree(v) if self._has_vertex(v) else -1
+
+    def in_degree(self, v: int) -> int:
+        """
+        Returns the number of incoming edges of vertex v.
+
+        Returns -1 if vertex does not exist.
+        """
+
+        return self._store.in_degree(v) if self._has_vertex(v) else -1
 
     def is_empty(self) -> bool:
         """Return True if the graph contains no vertices."""
 
-        return self.v_count == 0
+        return self.vertex_count == 0
 
-    def _is_valid_edge(self, src: int, dst: int) -> bool:
+    def write_edgelist(self, fp, vertices=None, min_weight=None) -> None:
         """
-        Returns True if an edge between a src and dst vertex is valid.
+        Writes a "src dst weight" line for every edge to the text file fp, in ascending (src, dst) order.
 
-        An edge is invalid if the src and dst point to the same vertex, or if either vertex is not on the graph.
+        If vertices is given, only edges between those vertices are written, and if min_weight is given, only edges
+        with at least that weight. The output can be read back with edge_list.load_edge_list().
         """
 
-        return src != dst and 0 <= src < self.v_count and 0 <= dst < self.v_count
+        write_lines(fp, (f"{src} {dst} {weight}\n" for src, dst, weight in self._export_edges(vertices, min_weight)))
 
-    def _dfs_complete(self, vertices: deque, top_stack: deque = None) -> []:
+    def write_adjacency(self, fp, vertices=None, min_weight=None) -> None:
         """
-        Returns a list of weakly connected components using DFS traversal.
+        Writes a "src: dst:weight dst:weight ..." line for every vertex to the text file fp, in ascending order.
 
-        An optional top_stack parameter tracks the topological sorting of the graph and in turn ensures that
-        the returned components are strongly connected.
+        Filters work as in write_edgelist(), and vertices outside the given vertices are left out.
         """
 
-        components: list = list()
-        unvisited: list = [True] * self.v_count
+        export_vertices, allowed = vertex_subset(self.get_vertices(), vertices)
+        write_lines(fp, (
+            f"{src}:" + "".join(f" {dst}:{weight}" for dst, weight in self._export_successors(src, allowed, min_weight))
+            + "\n"
+            for src in export_vertices
+        ))
 
-        while vertices:
-            v: int = vertices.popleft()
+    def write_dot(self, fp, vertices=None, min_weight=None) -> None:
+        """
+        Writes the graph to the text file fp in the DOT language of Graphviz, with edge weights as labels.
 
-            # Grab the next vertex that hasn't been visited.
-            while not unvisited[v] and vertices:
-                v = vertices.popleft()
+        Filters work as in write_edgelist(), and vertices outside the given vertices are left out.
+        """
 
-            # All vertices have been visited, so we can stop.
-            if v is None:
-                break
+        export_vertices, _ = vertex_subset(self.get_vertices(), vertices)
+        write_lines(fp, chain(
+            ["digraph {\n"],
+            (f"  {dot_id(v)};\n" for v in export_vertices),
+            (f"  {dot_id(src)} -> {dot_id(dst)} [label={weight}];\n"
+             for src, dst, weight in self._export_edges(vertices, min_weight)),
+            ["}\n"]
+        ))
 
-            component: list = self._dfs(v_start=v, unvisited=unvisited, top_stack=top_stack)
-            if len(component) > 0:
-                components.append(component)
+    def _export_edges(self, vertices, min_weight):
+        """Yields (src, dst, weight) for the edges that pass the filters of the exporters."""
 
-        return components
+        export_vertices, allowed = vertex_subset(self.get_vertices(), vertices)
+        for src in export_vertices:
+            for dst, weight in self._export_successors(src, allowed, min_weight):
+                yield src, dst, weight
+
+    def _export_successors(self, src: int, allowed: set, min_weight) -> []:
+        """Returns the (dst, weight) pairs of the outgoing edges of src that pass the filters of the exporters."""
+
+        return [(dst, weight) for dst, weight in self._store.successors(src)
+                if (allowed is None or dst in allowed) and (min_weight is None or weight >= min_weight)]
+
+    def _is_valid_edge(self, src: int, dst: int) -> bool:
+        """
+        Returns True if an edge between a src and dst vertex is valid.
 
-    def _dfs(self, v_start: int, v_end: int = None, unvisited: list = None, top_stack: deque = None) -> []:
+        An edge is invalid if the src and dst point to the same vertex, or if either vertex is not on the graph.
         """
-        Returns a list containing all vertices visited starting from the vertex v_start up to the optional vertex
-        v_end via DFS.
 
-        An optional list of unvisited vertices ensures vertices are visited exactly once during multiple calls to
-        this method.
+        return src != dst and self._has_vertex(src) and self._has_vertex(dst)
 
-        An optional top_stack parameter maintains a topological sorting of all visited vertices.
+    def _csr_store(self) -> "_CSRStorage":
+        """Returns the storage of the graph as compressed sparse rows, building a copy unless it is already held so."""
+
+        if self.backend == "csr":
+            return self._store
+
+        return _CSRStorage.from_edges(self.v_count, self._store.edges())
+
+    def _has_vertex(self, v: int) -> bool:
+        """Returns True if v is the id of a vertex in the graph that has not been removed."""
+
+        return 0 <= v < self.v_count and v not in self._removed
+
+    def _edge_batch(self, edges) -> {}:
         """
+        Returns a dict mapping (src, dst) to weight for every valid edge in the given (src, dst, weight) edges.
 
-        # The backstack holds any visited vertices in the order that they were visited.
-        backstack: deque = deque()
+        Invalid edges are dropped and duplicate edges keep their last weight, matching repeated add_edge() calls.
+        """
 
-        vertices: deque = deque()
-        visited: list = list()
+        batch: dict = dict()
+        v_count: int = self.v_count
+        removed: set = self._removed
 
-        if unvisited is None:
-            unvisited = [True] * self.v_count
+        for src, dst, weight in edges:
+            if src != dst and 0 <= src < v_count and 0 <= dst < v_count and weight >= 1:
+                if not removed or (src not in removed and dst not in removed):
+                    batch[src, dst] = weight
 
-        vertices.appendleft(v_start)
-        while vertices:
-            v: int = vertices.popleft()
+        return batch
 
-            if unvisited[v]:
-                unvisited[v] = False
-                visited.append(v)
-                backstack.appendleft(v)
+    def _dijkstra(self, sources, targets=None) -> ([], []):
+        """
+        Returns the distances and predecessors of every vertex from the closest of the source vertices.
+
+        Heap entries are only pushed when they improve a vertex's distance, and stale entries are skipped when popped.
+        If targets are given, stops once all of them are settled.
+        """
+
+        inf: float = float("inf")
+        distances: list = [inf] * self.v_count
+        predecessors: list = [-1] * self.v_count
+        settled: bytearray = bytearray(self.v_count)
 
-                # Unroll backstack so that its top points to a vertex with at least one unvisited neighbor. Update
-                # top_stack in the process.
-                if top_stack is not None:
-                    self._backtrack(unvisited, backstack, top_stack)
+        # Create priority queue containing every source with distance 0.
+        vertices: list = list()
+        for src in sources:
+            if self._has_vertex(src) and distances[src] != 0:
+                distances[src] = 0
+                vertices.append((0, src))
+        heapq.heapify(vertices)
+
+        remaining: set = None
+        if targets is not None:
+            remaining = {v for v in targets if self._has_vertex(v)}
+            if not remaining:
+                vertices.clear()
+
+        # Iterate through priority queue, settling the closest unsettled vertex each time.
+        while vertices:
+            dist_v, v = heapq.heappop(vertices)
+            if settled[v]:
+                continue
 
-                if v == v_end:
+            settled[v] = True
+            if remaining is not None:
+                remaining.discard(v)
+                if not remaining:
                     break
 
-                # Neighbors are pushed in descending order so that they are visited in ascending order.
-                for neighbor in reversed(self.neighbors(v)):
-                    if unvisited[neighbor]:
-                        vertices.appendleft(neighbor)
+            for neighbor, d_neighbor in self._store.successors(v):
+                dist: int = dist_v + d_neighbor
+                if dist < distances[neighbor]:
+                    distances[neighbor] = dist
+                    predecessors[neighbor] = v
+                    heapq.heappush(vertices, (dist, neighbor))
 
-        return visited
+        # Vertices that were reached but not settled before stopping don't have a final distance yet.
+        for v in range(self.v_count):
+            if not settled[v]:
+                distances[v] = inf
+                predecessors[v] = -1
 
-    def _backtrack(self, unvisited: list, backstack: deque, top_stack: deque) -> None:
+        return distances, predecessors
+
+    def _shortest_path_row(self, src: int, targets: [], next_hops: bool) -> (array, array):
+        """
+        Returns the distances from src to each of the targets, along with the next hops from src towards them if
+        next_hops is True.
         """
-        While the vertex at the top of the backstack has no unvisited neighbors, pops the vertex and pushes it to the
-        top_stack.
 
-        This effectively rolls back the backstack so that either the stack is emptied or the top points to a vertex
-        that has unvisited neighbors.
+        distances, predecessors = self._dijkstra([src], targets)
+        row: array = array("d", [distances[dst] for dst in targets])
+        if not next_hops:
+            return row, None
+
+        # Predecessors are always closer to src, so visiting vertices by distance fills in each predecessor's hop
+        # before it is needed.
+        hops: list = [-1] * self.v_count
+        for v in sorted((v for v in range(self.v_count) if predecessors[v] != -1), key=distances.__getitem__):
+            hops[v] = v if predecessors[v] == src else hops[predecessors[v]]
+
+        return row, array("q", [hops[dst] for dst in targets])
 
-        The top_stack will contain the topological sorting of the graph in return.
+    def _floyd_warshall(self, next_hops: bool) -> ([], []):
         """
+        Returns the full distance table of the graph, and the next-hop table if next_hops is True, using the
+        Floyd-Warshall algorithm.
+        """
+
+        inf: float = float("inf")
+        distances: list = [[inf] * self.v_count for _ in range(self.v_count)]
+        hops: list = [[-1] * self.v_count for _ in range(self.v_count)] if next_hops else None
+        for v in range(self.v_count):
+            distances[v][v] = 0
+        for src, dst, weight in self._store.edges():
+            distances[src][dst] = weight
+            if next_hops:
+                hops[src][dst] = dst
+
+        for k in range(self.v_count):
+            k_distances: list = distances[k]
+            for i in range(self.v_count):
+                i_distances: list = distances[i]
+                d_ik = i_distances[k]
+                if d_ik == inf or i == k:
+                    continue
+
+                if not next_hops:
+                    # Relax the whole row at once.
+                    distances[i] = list(map(min, i_distances, [d_ik + d_kj for d_kj in k_distances]))
+                    continue
+
+                i_hops: list = hops[i]
+                hop_ik: int = i_hops[k]
+                for j, d_kj in enumerate(k_distances):
+                    if d_ik + d_kj < i_distances[j]:
+                        i_distances[j] = d_ik + d_kj
+                        i_hops[j] = hop_ik
+
+        return distances, hops
+
+    def _parallel_components(self, workers: int) -> []:
+        """
+        Returns the strongly connected components of the graph in topological order, found by forward-backward
+        search on a pool of worker processes.
 
-        while backstack:
-            v: int = backstack[0]
-            v_unvisited: list = list()
-            for neighbor in self.neighbors(v):
-                if unvisited[neighbor]:
-                    v_unvisited.append(neighbor)
+        Each task splits a set of vertices into the components found in it and smaller sets that are sent back out as
+        new tasks, along with their place in the topological order. Vertices are labelled with the set they belong to
+        in a shared array, so searches only follow edges inside their own set.
+        """
 
-            if not v_unvisited:
-                top_stack.appendleft(backstack.popleft())
+        vertices: list = self.get_vertices()
+        if not vertices:
+            return list()
+
+        # A set is labelled with one of its vertices, and finished vertices with -1.
+        labels: array = array("q", [-1]) * self.v_count
+        for v in vertices:
+            labels[v] = vertices[0]
+
+        store: _CSRStorage = self._csr_store()
+        block, layout = share_arrays([store.offsets, store.targets, store.in_offsets, store.in_sources, labels])
+        try:
+            # Each task's result is a list of components and the ids of the tasks that replace its smaller sets.
+            results: dict = dict()
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_shared_worker,
+                                     initargs=([(block.name, layout)],)) as executor:
+                pending: dict = {executor.submit(_split_components, vertices[0], vertices): 0}
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        pieces: list = future.result()
+                        for i, piece in enumerate(pieces):
+                            if isinstance(piece, tuple):
+                                pieces[i] = len(results) + len(pending)
+                                pending[executor.submit(_split_components, *piece)] = pieces[i]
+                        results[pending.pop(future)] = pieces
+        finally:
+            block.close()
+            block.unlink()
+
+        # Replace each task id with the components of that task, in place.
+        components: list = list()
+        tasks: list = [iter(results[0])]
+        while tasks:
+            for piece in tasks[-1]:
+                if isinstance(piece, int):
+                    tasks.append(iter(results[piece]))
+                    break
+                components.append(piece)
             else:
-                break
+                tasks.pop()
+
+        return components
+
+    def _tarjan(self) -> ([], []):
+        """
+        Returns the strongly connected components of the graph in topological order, along with a list mapping each
+        vertex to the index of its component.
+
+        Uses an iterative version of Tarjan's algorithm, so it runs in O(V + E) without recursion and without
+        modifying the graph.
+        """
+
+        components: list = list()
+        component_ids: list = [-1] * self.v_count
+
+        # Order in which each vertex was discovered, and the lowest discovery order reachable from it through the
+        # vertices still on the stack.
+        order: list = [-1] * self.v_count
+        low: list = [0] * self.v_count
+        on_stack: bytearray = bytearray(self.v_count)
+        stack: list = list()
+        counter: int = 0
+
+        for v_start in range(self.v_count):
+            if order[v_start] != -1 or v_start in self._removed:
+                continue
+
+            order[v_start] = low[v_start] = counter
+            counter += 1
+            stack.append(v_start)
+            on_stack[v_start] = True
+
+            # Each frame holds a vertex and an iterator over its remaining neighbors.
+            frames: list = [(v_start, iter(self._store.neighbors(v_start)))]
+            while frames:
+                v, v_neighbors = frames[-1]
+                for neighbor in v_neighbors:
+                    if order[neighbor] == -1:
+                        order[neighbor] = low[neighbor] = counter
+                        counter += 1
+                        stack.append(neighbor)
+                        on_stack[neighbor] = True
+                        frames.append((neighbor, iter(self._store.neighbors(neighbor))))
+                        break
+                    elif on_stack[neighbor] and order[neighbor] < low[v]:
+                        low[v] = order[neighbor]
+                else:
+                    # All neighbors are finished, so pass the low value up to the parent.
+                    frames.pop()
+                    if frames and low[v] < low[frames[-1][0]]:
+                        low[frames[-1][0]] = low[v]
+
+                    # v is the root of a component, which holds every vertex above it on the stack.
+                    if low[v] == order[v]:
+                        component: list = list()
+                        while True:
+                            w: int = stack.pop()
+                            on_stack[w] = False
+                            component_ids[w] = len(components)
+                            component.append(w)
+                            if w == v:
+                                break
+
+                        component.reverse()
+                        components.append(component)
+
+        # Tarjan's algorithm finds components in reverse topological order.
+        components.reverse()
+        last: int = len(components) - 1
+        for v in range(self.v_count):
+            if component_ids[v] != -1:
+                component_ids[v] = last - component_ids[v]
+
+        return components, component_ids
+
+
+class _DenseStorage:
+    """
+    Adjacency matrix storage backend.
+
+    The matrix is kept row-major in one contiguous array of machine integers rather than as nested lists of Python
+    ints. Rows are spaced capacity cells apart and the capacity grows geometrically, so adding a vertex only copies
+    the matrix once in a while instead of appending to every row. A weight of 0 means there is no edge between two
+    vertices. The first time a weight is stored that the array can't hold exactly, such as a float or an integer
+    outside the 64-bit range, the buffer switches to a list with the same layout, which holds every weight as given.
+
+    Sorted lists of the outgoing and incoming neighbors of every vertex are kept next to the matrix, so neighbor
+    scans and degrees don't depend on the number of vertices.
+    """
+
+    name: str = "dense"
+
+    def __init__(self, matrix: [] = None):
+        self.v_count: int = 0
+        self.capacity: int = 0
+        self.data: array = array("q")
+        self.out_index: list = list()
+        self.in_index: list = list()
+        self.edge_count: int = 0
+        self._rows: list = None
+
+        if matrix:
+            self.add_vertices(len(matrix))
+            self.set_weights((src, dst, weight) for src, row in enumerate(matrix)
+                             for dst, weight in enumerate(row) if weight)
+
+    @classmethod
+    def from_edges(cls, v_count: int, edges) -> "_DenseStorage":
+        """Returns a new storage with v_count vertices holding the given (src, dst, weight) edges."""
+
+        store: _DenseStorage = cls()
+        store.add_vertices(v_count)
+        store.set_weights(edges)
+
+        return store
+
+    def add_vertices(self, n: int) -> None:
+        """Adds n new rows and columns, growing the buffer if it is full."""
+
+        if self.v_count + n > self.capacity:
+            self._reserve(max(self.v_count + n, self.capacity + self.capacity // 2 + 1))
+
+        self.out_index.extend(list() for _ in range(n))
+        self.in_index.extend(list() for _ in range(n))
+        self.v_count += n
+        self._rows = None
+
+    def set_weight(self, src: int, dst: int, weight) -> None:
+        """Adds or updates the edge from src to dst."""
+
+        self._fit(weight)
+
+        i: int = src * self.capacity + dst
+        if not self.data[i]:
+            bisect.insort(self.out_index[src], dst)
+            bisect.insort(self.in_index[dst], src)
+            self.edge_count += 1
+
+        self.data[i] = weight
+        self._rows = None
+
+    def set_weights(self, edges) -> None:
+        """Adds or updates all given (src, dst, weight) edges."""
+
+        # New neighbors are appended and each touched index list is sorted once at the end, rather than inserting
+        # every neighbor into place.
+        touched_out: set = set()
+        touched_in: set = set()
+        for src, dst, weight in edges:
+            self._fit(weight)
+
+            i: int = src * self.capacity + dst
+            if not self.data[i]:
+                self.out_index[src].append(dst)
+                self.in_index[dst].append(src)
+                touched_out.add(src)
+                touched_in.add(dst)
+                self.edge_count += 1
+
+            self.data[i] = weight
+
+        for v in touched_out:
+            self.out_index[v].sort()
+        for v in touched_in:
+            self.in_index[v].sort()
+
+        self._rows = None
+
+    def remove_edge(self, src: int, dst: int) -> None:
+        """Removes the edge from src to dst if there is one."""
+
+        i: int = src * self.capacity + dst
+        if self.data[i]:
+            self.data[i] = 0
+            _remove_sorted(self.out_index[src], dst)
+            _remove_sorted(self.in_index[dst], src)
+            self.edge_count -= 1
+            self._rows = None
+
+    def clear_vertex(self, v: int) -> None:
+        """Removes all incoming and outgoing edges of v."""
+
+        start: int = v * self.capacity
+        for dst in self.out_index[v]:
+            self.data[start + dst] = 0
+            _remove_sorted(self.in_index[dst], v)
+        for src in self.in_index[v]:
+            self.data[src * self.capacity + v] = 0
+            _remove_sorted(self.out_index[src], v)
+
+        self.edge_count -= len(self.out_index[v]) + len(self.in_index[v])
+        self.out_index[v] = list()
+        self.in_index[v] = list()
+        self._rows = None
+
+    def weight(self, src: int, dst: int):
+        """Returns the weight of the edge from src to dst, or 0 if there is none."""
+
+        return self.data[src * self.capacity + dst]
+
+    def row(self, v: int) -> array:
+        """Returns a copy of the outgoing weights of v, indexed by destination vertex, as an array or a list."""
+
+        start: int = v * self.capacity
+        return self.data[start:start + self.v_count]
+
+    def column(self, v: int) -> array:
+        """Returns a copy of the incoming weights of v, indexed by source vertex."""
+
+        return self.data[v:self.v_count * self.capacity:self.capacity]
+
+    def neighbors(self, v: int) -> []:
+        """Returns the outgoing neighbors of v in ascending order. The list must not be modified."""
+
+        return self.out_index[v]
+
+    def in_neighbors(self, v: int) -> []:
+        """Returns the incoming neighbors of v in ascending order. The list must not be modified."""
+
+        return self.in_index[v]
+
+    def successors(self, v: int) -> []:
+        """Returns (dst, weight) pairs for all outgoing edges of v in ascending order of dst."""
+
+        start: int = v * self.capacity
+        return [(dst, self.data[start + dst]) for dst in self.out_index[v]]
+
+    def out_degree(self, v: int) -> int:
+        """Returns the number of outgoing edges of v."""
+
+        return len(self.out_index[v])
+
+    def in_degree(self, v: int) -> int:
+        """Returns the number of incoming edges of v."""
+
+        return len(self.in_index[v])
+
+    def edges(self):
+        """Yields (src, dst, weight) for all edges in ascending (src, dst) order."""
+
+        for src in range(self.v_count):
+            start: int = src * self.capacity
+            for dst in self.out_index[src]:
+                yield src, dst, self.data[start + dst]
+
+    def rows(self) -> []:
+        """Returns the matrix as read-only rows, cached until the next change."""
+
+        if self._rows is None:
+            self._rows = [_ReadOnlyRow(self.row(v)) for v in range(self.v_count)]
+
+        return self._rows
+
+    def reversed(self) -> "_DenseStorage":
+        """Returns a new storage holding the transposed matrix."""
+
+        store: _DenseStorage = _DenseStorage()
+        store.data = array(self.data.typecode) if isinstance(self.data, array) else list()
+        store._reserve(self.v_count)
+        store.v_count = self.v_count
+        store.out_index = [list(v_index) for v_index in self.in_index]
+        store.in_index = [list(v_index) for v_index in self.out_index]
+        store.edge_count = self.edge_count
+
+        # Each column of this matrix becomes a row of the transposed one.
+        for v in range(self.v_count):
+            start: int = v * store.capacity
+            store.data[start:start + self.v_count] = self.column(v)
+
+        return store
+
+    def _reserve(self, capacity: int) -> None:
+        """Grows the buffer so that it can hold capacity vertices, copying existing rows into place."""
+
+        if capacity <= self.capacity:
+            return
+
+        data: array = (array(self.data.typecode, [0]) if isinstance(self.data, array) else [0]) * (capacity * capacity)
+        for v in range(self.v_count):
+            start: int = v * capacity
+            data[start:start + self.v_count] = self.row(v)
+
+        self.data = data
+        self.capacity = capacity
+
+    def _fit(self, weight) -> None:
+        """Switches the buffer to a list if the array can't hold weight exactly."""
+
+        if isinstance(self.data, array) and not (isinstance(weight, int) and _INT64_MIN <= weight <= _INT64_MAX):
+            self.data = self.data.tolist()
+
+
+class _MappedStorage:
+    """
+    Disk-backed adjacency matrix storage backend.
+
+    The matrix has the same layout as the dense backend's, but lives in a memory-mapped temporary file, so the
+    operating system pages rows in and out as they are used instead of keeping the whole matrix in memory. The file
+    is created empty and grows sparse, so cells that were never written take no disk space on most file systems. It
+    is placed in the default temporary directory, which can be changed with the TMPDIR environment variable, and
+    removed once the storage is garbage collected.
+
+    Copies pickled for other processes map the same file read-only instead of copying the matrix, so they must be
+    unpickled while the original storage is alive.
+
+    Weights are kept in the narrowest unsigned integer type that holds them, starting at one byte. Storing a larger
+    weight rewrites the matrix with a wider type. Storing a non-integer weight rewrites it with doubles, after which
+    every weight reads back as a float. Integer weights that don't fit in 64 unsigned bits raise ValueError, since
+    doubles would round them.
+
+    Only the degrees of the vertices are kept in memory. Neighbors are found by scanning a row of the matrix, and
+    incoming neighbors by scanning a column.
+    """
+
+    name: str = "mapped"
+
+    def __init__(self, typecode: str = "B"):
+        self.v_count: int = 0
+        self.capacity: int = 0
+        self.data: memoryview = None
+        self.path: str = None
+        self._remove_file: weakref.finalize = None
+        self.out_degrees: array = array("q")
+        self.in_degrees: array = array("q")
+        self.edge_count: int = 0
+        self._rows: list = None
+        self._remap(0, typecode)
+
+    @classmethod
+    def from_edges(cls, v_count: int, edges) -> "_MappedStorage":
+        """Returns a new storage with v_count vertices holding the given (src, dst, weight) edges."""
+
+        store: _MappedStorage = cls()
+        store.add_vertices(v_count)
+        store.set_weights(edges)
+
+        return store
+
+    @classmethod
+    def attach(cls, path: str, capacity: int, typecode: str, v_count: int, out_degrees: array,
+               in_degrees: array) -> "_MappedStorage":
+        """Returns a read-only storage that maps the matrix file of another storage."""
+
+        store: _MappedStorage = cls.__new__(cls)
+        with open(path, "rb") as fp:
+            store.data = memoryview(mmap_module.mmap(fp.fileno(), 0, access=mmap_module.ACCESS_READ)).cast(typecode)
+        store.path = path
+        store._remove_file = None
+        store.capacity = capacity
+        store.v_count = v_count
+        store.out_degrees = out_degrees
+        store.in_degrees = in_degrees
+        store.edge_count = sum(out_degrees)
+        store._rows = None
+
+        return store
+
+    def __reduce__(self):
+        """Pickles the storage as the path of its matrix file, which the copy maps read-only."""
+
+        return _MappedStorage.attach, (self.path, self.capacity, self.data.format, self.v_count,
+                                       self.out_degrees, self.in_degrees)
+
+    def add_vertices(self, n: int) -> None:
+        """Adds n new rows and columns, moving the matrix to a larger file if it is full."""
+
+        self._check_writable()
+        if self.v_count + n > self.capacity:
+            self._remap(max(self.v_count + n, self.capacity + self.capacity // 2 + 1), self.data.format)
+
+        self.out_degrees.extend(array("q", bytes(8 * n)))
+        self.in_degrees.extend(array("q", bytes(8 * n)))
+        self.v_count += n
+        self._rows = None
+
+    def set_weight(self, src: int, dst: int, weight) -> None:
+        """Adds or updates the edge from src to dst."""
+
+        self._check_writable()
+        self._fit(weight)
+
+        i: int = src * self.capacity + dst
+        if not self.data[i]:
+            self.out_degrees[src] += 1
+            self.in_degrees[dst] += 1
+            self.edge_count += 1
+
+        self.data[i] = weight
+        self._rows = None
+
+    def set_weights(self, edges) -> None:
+        """Adds or updates all given (src, dst, weight) edges."""
+
+        for src, dst, weight in edges:
+            self.set_weight(src, dst, weight)
+
+    def remove_edge(self, src: int, dst: int) -> None:
+        """Removes the edge from src to dst if there is one."""
+
+        self._check_writable()
+        i: int = src * self.capacity + dst
+        if self.data[i]:
+            self.data[i] = 0
+            self.out_degrees[src] -= 1
+            self.in_degrees[dst] -= 1
+            self.edge_count -= 1
+            self._rows = None
+
+    def clear_vertex(self, v: int) -> None:
+        """Removes all incoming and outgoing edges of v."""
+
+        for dst in self.neighbors(v):
+            self.remove_edge(v, dst)
+        for src in self.in_neighbors(v):
+            self.remove_edge(src, v)
+
+    def weight(self, src: int, dst: int):
+        """Returns the weight of the edge from src to dst, or 0 if there is none."""
+
+        return self.data[src * self.capacity + dst]
+
+    def row(self, v: int) -> memoryview:
+        """Returns a view of the outgoing weights of v, indexed by destination vertex."""
+
+        start: int = v * self.capacity
+        return self.data[start:start + self.v_count]
+
+    def column(self, v: int) -> memoryview:
+        """Returns a view of the incoming weights of v, indexed by source vertex."""
+
+        return self.data[v:self.v_count * self.capacity:self.capacity]
+
+    def neighbors(self, v: int) -> []:
+        """Returns the outgoing neighbors of v in ascending order."""
+
+        # Flag every nonzero byte of the row, then jump between flags with find(), which skips runs of zeros much
+        # faster than looking at each weight.
+        row: memoryview = self.row(v)
+        itemsize: int = row.itemsize
+        flags: bytes = row.tobytes().translate(_NONZERO_FLAGS)
+
+        neighbors: list = list()
+        i: int = flags.find(1)
+        while i != -1:
+            neighbors.append(i // itemsize)
+            i = flags.find(1, (i // itemsize + 1) * itemsize)
+
+        return neighbors
+
+    def in_neighbors(self, v: int) -> []:
+        """Returns the incoming neighbors of v in ascending order."""
+
+        return list(compress(range(self.v_count), self.column(v)))
+
+    def successors(self, v: int) -> []:
+        """Returns (dst, weight) pairs for all outgoing edges of v in ascending order of dst."""
+
+        row: memoryview = self.row(v)
+        return [(dst, row[dst]) for dst in self.neighbors(v)]
+
+    def out_degree(self, v: int) -> int:
+        """Returns the number of outgoing edges of v."""
+
+        return self.out_degrees[v]
+
+    def in_degree(self, v: int) -> int:
+        """Returns the number of incoming edges of v."""
+
+        return self.in_degrees[v]
+
+    def edges(self):
+        """Yields (src, dst, weight) for all edges in ascending (src, dst) order, reading one row at a time."""
+
+        for src in range(self.v_count):
+            for dst, weight in self.successors(src):
+                yield src, dst, weight
+
+    def rows(self) -> []:
+        """Returns the matrix as read-only rows, cached until the next change."""
+
+        if self._rows is None:
+            self._rows = [_ReadOnlyRow(self.row(v).tolist()) for v in range(self.v_count)]
+
+        return self._rows
+
+    def reversed(self) -> "_MappedStorage":
+        """Returns a new storage holding the transposed matrix, built from blocks of rows."""
+
+        store: _MappedStorage = _MappedStorage(self.data.format)
+        store.add_vertices(self.v_count)
+        store.out_degrees = array("q", self.in_degrees)
+        store.in_degrees = array("q", self.out_degrees)
+        store.edge_count = self.edge_count
+
+        # Edges of a block of rows are written in order of their new row, so the new file is filled front to back.
+        block_rows: int = max(1, _BLOCK_CELLS // max(1, self.v_count))
+        for block_start in range(0, self.v_count, block_rows):
+            block_end: int = min(block_start + block_rows, self.v_count)
+            block: list = sorted((dst, src, weight) for src in range(block_start, block_end)
+                                 for dst, weight in self.successors(src))
+            for dst, src, weight in block:
+                store.data[dst * store.capacity + src] = weight
+
+        return store
+
+    def _fit(self, weight) -> None:
+        """Widens the weight type of the matrix if it can't hold weight, or raises ValueError if no type can."""
+
+        if isinstance(weight, int) and (weight < 0 or weight >> 64):
+            raise ValueError(f"mapped graphs hold integer weights from 0 to 2**64 - 1, not {weight}")
+
+        typecode: str = self.data.format
+        if typecode == "d":
+            return
+
+        if not isinstance(weight, int):
+            self._remap(self.capacity, "d")
+        elif weight >> (8 * self.data.itemsize):
+            self._remap(self.capacity, next(code for code in _MAPPED_TYPECODES
+                                            if not weight >> (8 * array(code).itemsize)))
+
+    def _remap(self, capacity: int, typecode: str) -> None:
+        """
+        Moves the matrix to a new file that holds capacity vertices with the given weight type, row by row, and
+        removes the old file.
+        """
+
+        data, path = _map_matrix(capacity, typecode)
+        for v in range(self.v_count):
+            start: int = v * capacity
+            row: memoryview = self.row(v)
+            data[start:start + self.v_count] = row if typecode == self.data.format else array(typecode, row)
+
+        if self._remove_file is not None:
+            self._remove_file()
+        self.data = data
+        self.path = path
+        self.capacity = capacity
+        self._remove_file = weakref.finalize(self, _remove_matrix_file, path, os.getpid())
+
+    def _check_writable(self) -> None:
+        """Raises TypeError if the storage is a read-only copy mapped from another storage's file."""
+
+        if self.data.readonly:
+            raise TypeError("mapped graph copies are read-only, modify the original graph instead")
+
+
+class _SparseStorage:
+    """
+    Adjacency dict storage backend.
+
+    Each vertex maps its outgoing neighbors to edge weights, and its incoming neighbors likewise, so that memory and
+    neighbor scans are proportional to the number of edges instead of the number of vertices squared. The sorted
+    neighbor order of a vertex is cached until its edges change.
+    """
+
+    name: str = "sparse"
+
+    def __init__(self):
+        self.out_edges: list = list()
+        self.in_edges: list = list()
+        self._sorted_out: list = list()
+        self._sorted_in: list = list()
+        self.edge_count: int = 0
+        self._rows: list = None
+
+    @classmethod
+    def from_edges(cls, v_count: int, edges) -> "_SparseStorage":
+        """Returns a new storage with v_count vertices holding the given (src, dst, weight) edges."""
+
+        store: _SparseStorage = cls()
+        store.add_vertices(v_count)
+        store.set_weights(edges)
+
+        return store
+
+    def add_vertices(self, n: int) -> None:
+        """Adds empty adjacency dicts for n new vertices."""
+
+        self.out_edges.extend(dict() for _ in range(n))
+        self.in_edges.extend(dict() for _ in range(n))
+        self._sorted_out.extend([None] * n)
+        self._sorted_in.extend([None] * n)
+        self._rows = None
+
+    def set_weight(self, src: int, dst: int, weight) -> None:
+        """Adds or updates the edge from src to dst."""
+
+        if dst not in self.out_edges[src]:
+            self._sorted_out[src] = None
+            self._sorted_in[dst] = None
+            self.edge_count += 1
+
+        self.out_edges[src][dst] = weight
+        self.in_edges[dst][src] = weight
+        self._rows = None
+
+    def set_weights(self, edges) -> None:
+        """Adds or updates all given (src, dst, weight) edges."""
+
+        out_edges, in_edges = self.out_edges, self.in_edges
+        sorted_out, sorted_in = self._sorted_out, self._sorted_in
+        for src, dst, weight in edges:
+            if dst not in out_edges[src]:
+                sorted_out[src] = None
+                sorted_in[dst] = None
+                self.edge_count += 1
+
+            out_edges[src][dst] = weight
+            in_edges[dst][src] = weight
+
+        self._rows = None
+
+    def remove_edge(self, src: int, dst: int) -> None:
+        """Removes the edge from src to dst if there is one."""
+
+        if self.out_edges[src].pop(dst, None) is not None:
+            del self.in_edges[dst][src]
+            self._sorted_out[src] = None
+            self._sorted_in[dst] = None
+            self.edge_count -= 1
+            self._rows = None
+
+    def clear_vertex(self, v: int) -> None:
+        """Removes all incoming and outgoing edges of v."""
+
+        for dst in self.out_edges[v]:
+            del self.in_edges[dst][v]
+            self._sorted_in[dst] = None
+        for src in self.in_edges[v]:
+            del self.out_edges[src][v]
+            self._sorted_out[src] = None
+
+        self.edge_count -= len(self.out_edges[v]) + len(self.in_edges[v])
+        self.out_edges[v] = dict()
+        self.in_edges[v] = dict()
+        self._sorted_out[v] = self._sorted_in[v] = None
+        self._rows = None
+
+    def weight(self, src: int, dst: int):
+        """Returns the weight of the edge from src to dst, or 0 if there is none."""
+
+        return self.out_edges[src].get(dst, 0)
+
+    def neighbors(self, v: int) -> []:
+        """Returns the outgoing neighbors of v in ascending order. The list must not be modified."""
+
+        v_sorted: list = self._sorted_out[v]
+        if v_sorted is None:
+            v_sorted = self._sorted_out[v] = sorted(self.out_edges[v])
+
+        return v_sorted
+
+    def in_neighbors(self, v: int) -> []:
+        """Returns the incoming neighbors of v in ascending order. The list must not be modified."""
+
+        v_sorted: list = self._sorted_in[v]
+        if v_sorted is None:
+            v_sorted = self._sorted_in[v] = sorted(self.in_edges[v])
+
+        return v_sorted
+
+    def successors(self, v: int) -> []:
+        """Returns (dst, weight) pairs for all outgoing edges of v in ascending order of dst."""
+
+        v_edges: dict = self.out_edges[v]
+        return [(dst, v_edges[dst]) for dst in self.neighbors(v)]
+
+    def out_degree(self, v: int) -> int:
+        """Returns the number of outgoing edges of v."""
+
+        return len(self.out_edges[v])
+
+    def in_degree(self, v: int) -> int:
+        """Returns the number of incoming edges of v."""
+
+        return len(self.in_edges[v])
+
+    def edges(self):
+        """Yields (src, dst, weight) for all edges in ascending (src, dst) order."""
+
+        for src, v_edges in enumerate(self.out_edges):
+            for dst in self.neighbors(src):
+                yield src, dst, v_edges[dst]
+
+    def rows(self) -> []:
+        """Returns an adjacency matrix of read-only rows cached until the next change."""
+
+        if self._rows is None:
+            v_count: int = len(self.out_edges)
+            self._rows = [[0] * v_count for _ in range(v_count)]
+            for src, dst, weight in self.edges():
+                self._rows[src][dst] = weight
+            self._rows = [_ReadOnlyRow(row) for row in self._rows]
+
+        return self._rows
+
+    def reversed(self) -> "_SparseStorage":
+        """Returns a new storage with incoming and outgoing edges swapped."""
+
+        store: _SparseStorage = _SparseStorage()
+        store.out_edges = [dict(v_edges) for v_edges in self.in_edges]
+        store.in_edges = [dict(v_edges) for v_edges in self.out_edges]
+        store._sorted_out = list(self._sorted_in)
+        store._sorted_in = list(self._sorted_out)
+        store.edge_count = self.edge_count
+
+        return store
+
+
+class _CSRStorage:
+    """
+    Compressed sparse row storage backend.
+
+    The outgoing edges of vertex v are targets[offsets[v]:offsets[v + 1]], sorted in ascending order, with matching
+    weights. The incoming edges are kept the same way in a second set of arrays. The arrays are built once, so this
+    backend is read-only.
+
+    The arrays may also be memoryviews over a memory-mapped graph file, in which case mapped holds the path of the
+    file and whether the storage is reversed, so that copies sent to other processes map the same file.
+    """
+
+    name: str = "csr"
+    mapped: tuple = None
+
+    def __init__(self, offsets: array, targets: array, weights: array,
+                 in_offsets: array, in_sources: array, in_weights: array):
+        self.offsets: array = offsets
+        self.targets: array = targets
+        self.weights: array = weights
+        self.in_offsets: array = in_offsets
+        self.in_sources: array = in_sources
+        self.in_weights: array = in_weights
+        self._rows: list = None
+
+    @classmethod
+    def from_edges(cls, v_count: int, edges) -> "_CSRStorage":
+        """
+        Returns a new storage with v_count vertices holding the given (src, dst, weight) edges.
+
+        Edges must be given in ascending (src, dst) order. Weights are kept as 64-bit integers if they all fit, and
+        as doubles otherwise.
+        """
+
+        edges = list(edges)
+        typecode: str = "q" if all(isinstance(weight, int) and _INT64_MIN <= weight <= _INT64_MAX
+                                   for _, _, weight in edges) else "d"
+        offsets, targets, weights = _csr_arrays(v_count, edges, typecode)
+        in_offsets, in_sources, in_weights = _csr_arrays(
+            v_count, [(dst, src, weight) for src, dst, weight in edges], typecode
+        )
+
+        return cls(offsets, targets, weights, in_offsets, in_sources, in_weights)
+
+    @classmethod
+    def load(cls, path: str, mmap: bool, reverse: bool = False) -> "_CSRStorage":
+        """Returns a storage holding the arrays of a graph file, with incoming and outgoing edges swapped if reverse."""
+
+        _, arrays = read_arrays(path, DIRECTED, mmap)
+        store: _CSRStorage = cls(*(arrays[3:] + arrays[:3] if reverse else arrays))
+        if mmap:
+            store.mapped = (path, reverse)
+
+        return store
+
+    def __reduce__(self):
+        """Pickles memory-mapped storage as the path of its file, and other storage as its arrays."""
+
+        if self.mapped is not None:
+            return _CSRStorage.load, (self.mapped[0], True, self.mapped[1])
+
+        return _CSRStorage, (self.offsets, self.targets, self.weights,
+                             self.in_offsets, self.in_sources, self.in_weights)
+
+    def _read_only(self, *args) -> None:
+        raise TypeError("csr graphs are read-only, switch to the sparse or dense backend to modify them")
+
+    add_vertices = set_weight = set_weights = remove_edge = clear_vertex = _read_only
+
+    @property
+    def edge_count(self) -> int:
+        """Number of edges held by the arrays."""
+
+        return len(self.targets)
+
+    def weight(self, src: int, dst: int):
+        """Returns the weight of the edge from src to dst, or 0 if there is none."""
+
+        # Targets of each row are sorted, so binary search for dst.
+        start, end = self.offsets[src], self.offsets[src + 1]
+        i: int = bisect.bisect_left(self.targets, dst, start, end)
+        if i < end and self.targets[i] == dst:
+            return self.weights[i]
+
+        return 0
+
+    def neighbors(self, v: int) -> array:
+        """Returns the outgoing neighbors of v in ascending order."""
+
+        return self.targets[self.offsets[v]:self.offsets[v + 1]]
+
+    def in_neighbors(self, v: int) -> array:
+        """Returns the incoming neighbors of v in ascending order."""
+
+        return self.in_sources[self.in_offsets[v]:self.in_offsets[v + 1]]
+
+    def successors(self, v: int) -> []:
+        """Returns (dst, weight) pairs for all outgoing edges of v in ascending order of dst."""
+
+        start, end = self.offsets[v], self.offsets[v + 1]
+        return list(zip(self.targets[start:end], self.weights[start:end]))
+
+    def out_degree(self, v: int) -> int:
+        """Returns the number of outgoing edges of v."""
+
+        return self.offsets[v + 1] - self.offsets[v]
+
+    def in_degree(self, v: int) -> int:
+        """Returns the number of incoming edges of v."""
+
+        return self.in_offsets[v + 1] - self.in_offsets[v]
+
+    def edges(self):
+        """Yields (src, dst, weight) for all edges in ascending (src, dst) order."""
+
+        for src in range(len(self.offsets) - 1):
+            for i in range(self.offsets[src], self.offsets[src + 1]):
+                yield src, self.targets[i], self.weights[i]
+
+    def rows(self) -> []:
+        """Returns an adjacency matrix of read-only rows built from the arrays."""
+
+        if self._rows is None:
+            v_count: int = len(self.offsets) - 1
+            self._rows = [[0] * v_count for _ in range(v_count)]
+            for src, dst, weight in self.edges():
+                self._rows[src][dst] = weight
+            self._rows = [_ReadOnlyRow(row) for row in self._rows]
+
+        return self._rows
+
+    def reversed(self) -> "_CSRStorage":
+        """Returns a new storage with incoming and outgoing edges swapped, sharing the same arrays."""
+
+        store: _CSRStorage = _CSRStorage(self.in_offsets, self.in_sources, self.in_weights,
+                                         self.offsets, self.targets, self.weights)
+        if self.mapped is not None:
+            store.mapped = (self.mapped[0], not self.mapped[1])
+
+        return store
+
+
+def _csr_arrays(v_count: int, edges: [], typecode: str) -> ():
+    """
+    Returns (offsets, targets, weights) arrays for the given (src, dst, weight) edges.
+
+    Edges are placed with a counting sort on src, which keeps the relative order of edges sharing the same src.
+    """
+
+    # Count edges per source, then turn counts into starting offsets.
+    offsets: array = array("q", bytes(8 * (v_count + 1)))
+    for src, _, _ in edges:
+        offsets[src + 1] += 1
+    for v in range(v_count):
+        offsets[v + 1] += offsets[v]
+
+    # Place each edge in the next free slot of its source's row.
+    targets: array = array("q", bytes(8 * len(edges)))
+    weights: array = array(typecode, bytes(array(typecode).itemsize * len(edges)))
+    slots: array = offsets[:-1]
+    for src, dst, weight in edges:
+        i: int = slots[src]
+        targets[i] = dst
+        weights[i] = weight
+        slots[src] = i + 1
+
+    return offsets, targets, weights
+
+
+_worker_graph: DirectedGraph = None
+
+
+def _init_worker(d_graph: DirectedGraph) -> None:
+    """Stores the graph that shortest path searches in this worker process run on."""
+
+    global _worker_graph
+    _worker_graph = d_graph
+
+
+def _shortest_path_row(src: int, targets: [], next_hops: bool) -> (array, array):
+    """Runs one shortest path search from src on the worker process's graph."""
+
+    return _worker_graph._shortest_path_row(src, targets, next_hops)
+
+
+# Sets of vertices smaller than this are split by the worker that found them instead of being sent back as new tasks.
+_LOCAL_SCC_SIZE: int = 1 << 12
+
+# Views of the arrays in shared memory that the worker process runs on, and the blocks holding them.
+_worker_arrays: list = None
+_worker_blocks: list = None
+
+
+def _init_shared_worker(blocks: []) -> None:
+    """Attaches the worker process to the given (name, layout) blocks of shared memory made by share_arrays()."""
+
+    global _worker_arrays, _worker_blocks
+    _worker_blocks = [shared_memory.SharedMemory(name=name) for name, _ in blocks]
+    _worker_arrays = [view for block, (_, layout) in zip(_worker_blocks, blocks)
+                      for view in shared_views(block, layout)]
+
+
+def _dijkstra_rows(start: int, sources: []) -> None:
+    """Writes the distances from each of the sources into the shared distance matrix, starting at row start."""
+
+    offsets, targets, weights, matrix = _worker_arrays
+    v_count: int = len(offsets) - 1
+    for i, src in enumerate(sources, start):
+        matrix[i * v_count:(i + 1) * v_count] = _csr_dijkstra(offsets, targets, weights, src)
+
+
+def _split_components(label: int, vertices: []) -> []:
+    """
+    Finds the strongly connected components among the vertices of the set with the given label, using the shared
+    arrays of the worker process.
+
+    Returns the components found and the (label, vertices) sets still to be split, in topological order. Sets smaller
+    than _LOCAL_SCC_SIZE are split here rather than returned.
+    """
+
+    pieces: list = list()
+    stack: list = [(label, vertices)]
+    while stack:
+        piece = stack.pop()
+        if isinstance(piece, tuple) and (len(piece[1]) < _LOCAL_SCC_SIZE or piece[1] is vertices):
+            stack.extend(reversed(_forward_backward(*piece)))
+        else:
+            pieces.append(piece)
+
+    return pieces
+
+
+def _forward_backward(label: int, vertices: []) -> []:
+    """
+    Splits the set of vertices with the given label once, and returns the pieces in topological order.
+
+    Vertices without incoming or outgoing edges inside the set are trimmed off first as components of their own.
+    The component of a pivot is then the intersection of the vertices it reaches and the vertices that reach it, and
+    the rest splits into three sets: vertices that reach the pivot, vertices the pivot reaches, and all others.
+    Vertices are labelled -1 once their component is found, and the new sets are labelled with their first vertex.
+    """
+
+    offsets, targets, in_offsets, in_sources, labels = _worker_arrays
+
+    # Trim vertices that can't be part of a cycle, until none are left. Trimmed sources come before the rest of the
+    # set, and trimmed sinks after it in the reverse of the order they were trimmed.
+    out_degrees: dict = {v: sum(labels[w] == label for w in targets[offsets[v]:offsets[v + 1]]) for v in vertices}
+    in_degrees: dict = {v: sum(labels[u] == label for u in in_sources[in_offsets[v]:in_offsets[v + 1]])
+                        for v in vertices}
+    trimmed: deque = deque(v for v in vertices if out_degrees[v] == 0 or in_degrees[v] == 0)
+    sources: list = list()
+    sinks: list = list()
+    while trimmed:
+        v: int = trimmed.popleft()
+        if labels[v] != label:
+            continue
+
+        labels[v] = -1
+        if in_degrees[v] == 0:
+            sources.append([v])
+            for w in targets[offsets[v]:offsets[v + 1]]:
+                if labels[w] == label:
+                    in_degrees[w] -= 1
+                    if in_degrees[w] == 0:
+                        trimmed.append(w)
+        else:
+            sinks.append([v])
+            for u in in_sources[in_offsets[v]:in_offsets[v + 1]]:
+                if labels[u] == label:
+                    out_degrees[u] -= 1
+                    if out_degrees[u] == 0:
+                        trimmed.append(u)
+
+    sinks.reverse()
+    remaining: list = [v for v in vertices if labels[v] == label]
+    if not remaining:
+        return sources + sinks
+
+    # Taking the middle vertex splits chains of components listed in order evenly.
+    pivot: int = remaining[len(remaining) // 2]
+    reached: set = _reach(pivot, label, offsets, targets, labels)
+    reaching: set = _reach(pivot, label, in_offsets, in_sources, labels)
+
+    component: list = list()
+    groups: tuple = (list(), list(), list())
+    for v in remaining:
+        if v in reached and v in reaching:
+            component.append(v)
+        else:
+            groups[0 if v in reaching else 2 if v in reached else 1].append(v)
+
+    for v in component:
+        labels[v] = -1
+
+    # Edges between the pieces only run from the vertices that reach the pivot, through its component and the
+    # other vertices, to the vertices the pivot reaches.
+    pieces: list = sources
+    for i, group in enumerate(groups):
+        if i == 1:
+            pieces.append(component)
+        if group:
+            for v in group:
+                labels[v] = group[0]
+            pieces.append((group[0], group))
+
+    return pieces + sinks
+
+
+def _reach(v_start: int, label: int, offsets, targets, labels) -> set:
+    """Returns the vertices with the given label reachable from v_start along the given compressed sparse rows."""
+
+    reached: set = {v_start}
+    frontier: list = [v_start]
+    for v in frontier:
+        for w in targets[offsets[v]:offsets[v + 1]]:
+            if w not in reached and labels[w] == label:
+                reached.add(w)
+                frontier.append(w)
+
+    return reached
+
+
+def _csr_dijkstra(offsets, targets, weights, src: int) -> array:
+    """
+    Returns an array of the distances from src to every vertex of a graph held as compressed sparse rows, with
+    infinity for vertices that are not reachable, or for every vertex if src is -1.
+    """
+
+    inf: float = float("inf")
+    distances: list = [inf] * (len(offsets) - 1)
+    if src == -1:
+        return array("d", distances)
+
+    distances[src] = 0
+    settled: bytearray = bytearray(len(distances))
+    vertices: list = [(0, src)]
+    while vertices:
+        dist_v, v = heapq.heappop(vertices)
+        if settled[v]:
+            continue
+
+        settled[v] = True
+        for i in range(offsets[v], offsets[v + 1]):
+            dist = dist_v + weights[i]
+            neighbor: int = targets[i]
+            if dist < distances[neighbor]:
+                distances[neighbor] = dist
+                heapq.heappush(vertices, (dist, neighbor))
+
+    return array("d", distances)
+
+
+# Range of the integer weights that the dense backend keeps in its array.
+_INT64_MIN: int = -(1 << 63)
+_INT64_MAX: int = (1 << 63) - 1
+
+
+class _ReadOnlyRow(list):
+    """Row of an adjacency matrix snapshot, which raises TypeError on any attempt to change it."""
+
+    def __reduce__(self):
+        return _ReadOnlyRow, (list(self),)
+
+    def _read_only(self, *args) -> None:
+        raise TypeError("adjacency matrix rows are read-only, use add_edge() and remove_edge() to change the graph")
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = extend = insert = pop = remove = clear = sort = reverse = _read_only
+
+
+# Unsigned integer weight types of the mapped backend, from narrowest to widest.
+_MAPPED_TYPECODES: str = "BHIQ"
+
+# Number of matrix cells the mapped backend reads at a time when it processes blocks of rows.
+_BLOCK_CELLS: int = 1 << 18
+
+# Translation table that maps every nonzero byte to 1.
+_NONZERO_FLAGS: bytes = bytes([0]) + bytes([1]) * 255
+
+
+def _map_matrix(capacity: int, typecode: str) -> (memoryview, str):
+    """
+    Returns a zeroed, writable view of a capacity by capacity matrix mapped from a new temporary file, along with the
+    path of the file.
+    """
+
+    size: int = max(1, capacity * capacity) * array(typecode).itemsize
+
+    # The mapping keeps the file open, so it stays usable even once the file is removed.
+    fd, path = tempfile.mkstemp(prefix="pygraph-", suffix=".matrix")
+    with open(fd, "wb+") as fp:
+        fp.truncate(size)
+        return memoryview(mmap_module.mmap(fp.fileno(), size)).cast(typecode), path
+
+
+def _remove_matrix_file(path: str, pid: int) -> None:
+    """Removes the matrix file of a mapped storage, unless called in a child process forked after it was made."""
+
+    if os.getpid() == pid:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+def _remove_sorted(values: [], value) -> None:
+    """Removes value from the sorted list values using binary search."""
+
+    i: int = bisect.bisect_left(values, value)
+    if i < len(values) and values[i] == value:
+        del values[i]
+
+
+_BACKENDS: dict = {
+    "dense": _DenseStorage,
+    "sparse": _SparseStorage,
+    "csr": _CSRStorage,
+    "mapped": _MappedStorage,
+}
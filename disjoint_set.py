@@ -0,0 +1,87 @@
+# Course: CS261 - Data Structures
+# Author: Mohamed Al-Hussein
+# Assignment: 06
+# Description: Disjoint set (union-find) implementation.
+
+
+class DisjointSet:
+    """
+    Class to implement a disjoint set forest over hashable elements
+    - union by size
+    - path halving on find
+    """
+
+    def __init__(self, elements=None):
+        """Store each set as a tree of parent links, with the size of each tree kept at its root."""
+
+        self.parent: dict = dict()
+        self.size: dict = dict()
+        self.count: int = 0
+
+        if elements is not None:
+            for x in elements:
+                self.add(x)
+
+    def __len__(self) -> int:
+        """Return the number of elements in all sets."""
+
+        return len(self.parent)
+
+    def __contains__(self, x) -> bool:
+        """Return True if x belongs to one of the sets."""
+
+        return x in self.parent
+
+    def add(self, x) -> None:
+        """
+        Add x as a new single element set.
+
+        If x already belongs to a set, does nothing and returns to caller.
+        """
+
+        if x not in self.parent:
+            self.parent[x] = x
+            self.size[x] = 1
+            self.count += 1
+
+    def find(self, x):
+        """
+        Return the representative element of the set containing x.
+
+        Raises KeyError if x does not belong to any set.
+        """
+
+        parent: dict = self.parent
+
+        # Point every other element on the path to its grandparent while walking up to the root.
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+
+        return x
+
+    def union(self, x, y) -> bool:
+        """
+        Merge the sets containing x and y.
+
+        Returns True if the sets were merged, or False if x and y already belonged to the same set.
+        """
+
+        root_x, root_y = self.find(x), self.find(y)
+        if root_x == root_y:
+            return False
+
+        # Attach the smaller tree below the root of the larger one.
+        if self.size[root_x] < self.size[root_y]:
+            root_x, root_y = root_y, root_x
+
+        self.parent[root_y] = root_x
+        self.size[root_x] += self.size.pop(root_y)
+        self.count -= 1
+
+        return True
+
+    def connected(self, x, y) -> bool:
+        """Return True if x and y belong to the same set."""
+
+        return self.find(x) == self.find(y)
@@ -0,0 +1,460 @@
+# Course: CS261 - Data Structures
+# Author: Mohamed Al-Hussein
+# Assignment: 06
+# Description: Fully dynamic connectivity index supporting edge insertions and deletions.
+
+import random
+
+
+class DynamicConnectivity:
+    """
+    Class to implement fully dynamic connectivity over hashable elements
+    - edges can be added and removed in O(log^2 n) amortized time
+    - connectivity queries take O(log n) time
+
+    Uses the algorithm of Holm, de Lichtenberg and Thorup. Every edge has a level, starting at 0. Level i keeps a
+    spanning forest of the edges with level i or higher as Euler tours, so level 0 holds a spanning forest of the
+    whole graph. When a forest edge is removed, the smaller of the two halves is searched for a replacement edge,
+    and edges that fail to reconnect it move up a level, which bounds how often each edge is looked at.
+
+    Offers the same methods as DisjointSet, plus remove_edge() and remove().
+    """
+
+    def __init__(self, elements=None):
+        """Store the level of every edge next to the spanning forest and non-tree edges of every level."""
+
+        self.edges: dict = dict()
+        self.levels: list = [_Level()]
+        self.count: int = 0
+
+        if elements is not None:
+            for x in elements:
+                self.add(x)
+
+    def __len__(self) -> int:
+        """Return the number of elements."""
+
+        return len(self.edges)
+
+    def __contains__(self, x) -> bool:
+        """Return True if x is one of the elements."""
+
+        return x in self.edges
+
+    def add(self, x) -> None:
+        """
+        Add x as a new element with no edges.
+
+        If x already exists, does nothing and returns.
+        """
+
+        if x not in self.edges:
+            self.edges[x] = dict()
+            self.count += 1
+
+    def remove(self, x) -> None:
+        """
+        Remove x and all of its edges.
+
+        If x does not exist, does nothing and returns.
+        """
+
+        if x not in self.edges:
+            return
+
+        for y in list(self.edges[x]):
+            self.remove_edge(x, y)
+
+        del self.edges[x]
+        for level in self.levels:
+            level.nodes.pop(x, None)
+        self.count -= 1
+
+    def find(self, x):
+        """
+        Return the representative element of the component containing x.
+
+        Representatives may change when edges are added or removed. Raises KeyError if x does not exist.
+        """
+
+        if x not in self.edges:
+            raise KeyError(x)
+
+        return self.levels[0].first_vertex(x)
+
+    def connected(self, x, y) -> bool:
+        """Return True if x and y belong to the same component."""
+
+        return self.find(x) == self.find(y)
+
+    def union(self, x, y) -> bool:
+        """
+        Add an edge between x and y, which must not already exist.
+
+        Returns True if the edge merged two components, or False if x and y were already connected.
+        """
+
+        self.edges[x][y] = self.edges[y][x] = 0
+
+        level: _Level = self.levels[0]
+        if not level.connected(x, y):
+            level.link(x, y, True)
+            self.count -= 1
+            return True
+
+        level.add_non_tree(x, y)
+        return False
+
+    def remove_edge(self, x, y) -> bool:
+        """
+        Remove the edge between x and y.
+
+        Returns True if removing the edge split a component in two. Raises KeyError if there is no such edge.
+        """
+
+        edge_level: int = self.edges[x].pop(y)
+        del self.edges[y][x]
+
+        # Removing an edge that is not in the spanning forest doesn't change the components.
+        if not self.levels[0].has_arc(x, y):
+            self.levels[edge_level].remove_non_tree(x, y)
+            return False
+
+        for i in range(edge_level + 1):
+            self.levels[i].cut(x, y)
+
+        # Look for a replacement edge, starting at the level of the removed edge.
+        for i in range(edge_level, -1, -1):
+            if self._replace(i, x, y):
+                return False
+
+        self.count += 1
+        return True
+
+    def _replace(self, i: int, x, y) -> bool:
+        """
+        Search the smaller of the level i trees containing x and y for a non-tree edge joining them again.
+
+        Returns True if one was found and linked into the forests of levels 0 to i.
+        """
+
+        level: _Level = self.levels[i]
+        if level.tree_size(x) > level.tree_size(y):
+            x, y = y, x
+
+        if len(self.levels) == i + 1:
+            self.levels.append(_Level())
+        upper: _Level = self.levels[i + 1]
+
+        # The smaller tree can't have more than half the vertices, so all its level i edges move up a level.
+        for u, v in level.tree_arcs(x):
+            level.set_tree(u, v, False)
+            upper.link(u, v, True)
+            self.edges[u][v] = self.edges[v][u] = i + 1
+
+        # Every level i non-tree edge of the smaller tree either reconnects the two trees, or has both ends in the
+        # smaller tree and moves up a level.
+        for u in level.non_tree_vertices(x):
+            while u in level.non_tree:
+                v = next(iter(level.non_tree[u]))
+                level.remove_non_tree(u, v)
+
+                if level.connected(v, y):
+                    for j in range(i + 1):
+                        self.levels[j].link(u, v, j == i)
+                    return True
+
+                upper.add_non_tree(u, v)
+                self.edges[u][v] = self.edges[v][u] = i + 1
+
+        return False
+
+
+class _Level:
+    """
+    Spanning forest and non-tree edges of one level.
+
+    Each tree of the forest is kept as an Euler tour in a treap ordered by position. The tour holds one node for
+    every vertex and one node for each direction of every tree edge. Vertex nodes are created the first time a
+    vertex is used at this level, so a vertex without a node is a tree of its own.
+    """
+
+    def __init__(self):
+        self.nodes: dict = dict()
+        self.arcs: dict = dict()
+        self.non_tree: dict = dict()
+
+    def connected(self, x, y) -> bool:
+        """Return True if x and y are in the same tree."""
+
+        if x == y:
+            return True
+
+        x_node, y_node = self.nodes.get(x), self.nodes.get(y)
+        return x_node is not None and y_node is not None and _root(x_node) is _root(y_node)
+
+    def has_arc(self, x, y) -> bool:
+        """Return True if the edge between x and y is a tree edge."""
+
+        return (x, y) in self.arcs
+
+    def tree_size(self, x) -> int:
+        """Return the number of vertices in the tree containing x."""
+
+        x_node: _TourNode = self.nodes.get(x)
+        return _root(x_node).vertices if x_node is not None else 1
+
+    def first_vertex(self, x):
+        """Return the first vertex in the Euler tour of the tree containing x."""
+
+        x_node: _TourNode = self.nodes.get(x)
+        if x_node is None:
+            return x
+
+        node: _TourNode = _root(x_node)
+        while True:
+            if node.left is not None and node.left.vertices:
+                node = node.left
+            elif not node.arc:
+                return node.key
+            else:
+                node = node.right
+
+    def link(self, x, y, flag: bool) -> None:
+        """
+        Join the trees of x and y with a tree edge between them.
+
+        If flag is True, the edge is marked as having this level.
+        """
+
+        x_tour: _TourNode = self._reroot(x)
+        y_tour: _TourNode = self._reroot(y)
+
+        # A tour rooted at x, then into y's tour and back.
+        xy: _TourNode = _TourNode((x, y), True)
+        yx: _TourNode = _TourNode((y, x), True)
+        self.arcs[x, y], self.arcs[y, x] = xy, yx
+        xy.own_tree = int(flag)
+        xy.tree = xy.own_tree
+
+        _merge(_merge(_merge(x_tour, xy), y_tour), yx).parent = None
+
+    def cut(self, x, y) -> None:
+        """Remove the tree edge between x and y, splitting its tree in two."""
+
+        xy: _TourNode = self.arcs.pop((x, y))
+        yx: _TourNode = self.arcs.pop((y, x))
+        i, j = _index(xy), _index(yx)
+        if i > j:
+            i, j = j, i
+
+        # The part of the tour between the two arcs is one tree and the parts around them form the other.
+        before, rest = _split(_root(xy), i)
+        _, rest = _split(rest, 1)
+        _, rest = _split(rest, j - i - 1)
+        _, after = _split(rest, 1)
+        root: _TourNode = _merge(before, after)
+        if root is not None:
+            root.parent = None
+
+    def set_tree(self, x, y, flag: bool) -> None:
+        """Mark or unmark the tree edge between x and y as having this level."""
+
+        node: _TourNode = self.arcs[x, y]
+        if not node.own_tree:
+            node = self.arcs[y, x]
+        node.own_tree = int(flag)
+        _update_path(node)
+
+    def add_non_tree(self, x, y) -> None:
+        """Add a non-tree edge between x and y."""
+
+        for u, v in ((x, y), (y, x)):
+            u_edges: set = self.non_tree.get(u)
+            if u_edges is None:
+                u_edges = self.non_tree[u] = set()
+                node: _TourNode = self._node(u)
+                node.own_non_tree = 1
+                _update_path(node)
+            u_edges.add(v)
+
+    def remove_non_tree(self, x, y) -> None:
+        """Remove the non-tree edge between x and y."""
+
+        for u, v in ((x, y), (y, x)):
+            u_edges: set = self.non_tree[u]
+            u_edges.discard(v)
+            if not u_edges:
+                del self.non_tree[u]
+                node: _TourNode = self.nodes[u]
+                node.own_non_tree = 0
+                _update_path(node)
+
+    def tree_arcs(self, x) -> []:
+        """Return the tree edges marked as having this level in the tree containing x."""
+
+        x_node: _TourNode = self.nodes.get(x)
+        if x_node is None:
+            return list()
+
+        return [node.key for node in _marked(_root(x_node), "tree")]
+
+    def non_tree_vertices(self, x) -> []:
+        """Return the vertices with non-tree edges in the tree containing x."""
+
+        x_node: _TourNode = self.nodes.get(x)
+        if x_node is None:
+            return list()
+
+        return [node.key for node in _marked(_root(x_node), "non_tree")]
+
+    def _node(self, x) -> "_TourNode":
+        """Return the vertex node of x, creating it if x doesn't have one yet."""
+
+        node: _TourNode = self.nodes.get(x)
+        if node is None:
+            node = self.nodes[x] = _TourNode(x, False)
+
+        return node
+
+    def _reroot(self, x) -> "_TourNode":
+        """Rotate the Euler tour of the tree containing x so that it starts at x, and return its root."""
+
+        node: _TourNode = self._node(x)
+        before, after = _split(_root(node), _index(node))
+        root: _TourNode = _merge(after, before)
+        root.parent = None
+
+        return root
+
+
+class _TourNode:
+    """
+    Treap node of an Euler tour, standing for either a vertex or one direction of a tree edge.
+
+    Subtree totals of the number of nodes, vertices, marked tree edges and vertices with non-tree edges are kept at
+    every node.
+    """
+
+    __slots__ = ("key", "arc", "priority", "left", "right", "parent",
+                 "size", "vertices", "own_tree", "tree", "own_non_tree", "non_tree")
+
+    def __init__(self, key, arc: bool):
+        self.key = key
+        self.arc: bool = arc
+        self.priority: float = random.random()
+        self.left: _TourNode = None
+        self.right: _TourNode = None
+        self.parent: _TourNode = None
+        self.size: int = 1
+        self.vertices: int = 0 if arc else 1
+        self.own_tree: int = 0
+        self.tree: int = 0
+        self.own_non_tree: int = 0
+        self.non_tree: int = 0
+
+
+def _update(node: _TourNode) -> None:
+    """Recompute the subtree totals of node from its children."""
+
+    size, vertices = 1, 0 if node.arc else 1
+    tree, non_tree = node.own_tree, node.own_non_tree
+    for child in (node.left, node.right):
+        if child is not None:
+            size += child.size
+            vertices += child.vertices
+            tree += child.tree
+            non_tree += child.non_tree
+
+    node.size, node.vertices, node.tree, node.non_tree = size, vertices, tree, non_tree
+
+
+def _update_path(node: _TourNode) -> None:
+    """Recompute the subtree totals of node and all its ancestors."""
+
+    while node is not None:
+        _update(node)
+        node = node.parent
+
+
+def _root(node: _TourNode) -> _TourNode:
+    """Return the root of the treap containing node."""
+
+    while node.parent is not None:
+        node = node.parent
+
+    return node
+
+
+def _index(node: _TourNode) -> int:
+    """Return the position of node in its tour."""
+
+    i: int = node.left.size if node.left is not None else 0
+    while node.parent is not None:
+        if node is node.parent.right:
+            i += 1 + (node.parent.left.size if node.parent.left is not None else 0)
+        node = node.parent
+
+    return i
+
+
+def _merge(a: _TourNode, b: _TourNode) -> _TourNode:
+    """Concatenate the tours a and b and return the new root. The parent of the root is left to the caller."""
+
+    if a is None:
+        return b
+    if b is None:
+        return a
+
+    if a.priority > b.priority:
+        a.right = _merge(a.right, b)
+        a.right.parent = a
+        _update(a)
+        return a
+
+    b.left = _merge(a, b.left)
+    b.left.parent = b
+    _update(b)
+    return b
+
+
+def _split(node: _TourNode, k: int) -> (_TourNode, _TourNode):
+    """Split the tour rooted at node after its first k nodes and return the roots of both parts."""
+
+    if node is None:
+        return None, None
+
+    left_size: int = node.left.size if node.left is not None else 0
+    if k <= left_size:
+        before, after = _split(node.left, k)
+        node.left = after
+        if after is not None:
+            after.parent = node
+        _update(node)
+        node.parent = None
+        return before, node
+
+    before, after = _split(node.right, k - left_size - 1)
+    node.right = before
+    if before is not None:
+        before.parent = node
+    _update(node)
+    node.parent = None
+    return node, after
+
+
+def _marked(root: _TourNode, total: str) -> []:
+    """Return the nodes below root whose own count of the given total ("tree" or "non_tree") is set."""
+
+    own: str = "own_" + total
+    marked: list = list()
+    nodes: list = [root]
+    while nodes:
+        node: _TourNode = nodes.pop()
+        if getattr(node, own):
+            marked.append(node)
+        for child in (node.left, node.right):
+            if child is not None and getattr(child, total):
+                nodes.append(child)
+
+    return marked
@@ -0,0 +1,173 @@
+# Course: CS261 - Data Structures
+# Author: Mohamed Al-Hussein
+# Assignment: 06
+# Description: Chunked loader for graphs stored as text edge lists.
+
+from array import array
+import os
+
+from d_graph import DirectedGraph
+
+
+def load_edge_list(graph, source, delimiter: str = None, chunk_size: int = 1 << 20, skip_invalid: bool = True,
+                   progress=None) -> int:
+    """
+    Reads the edges of a text edge list into a DirectedGraph or UndirectedGraph, and returns the number of edges read.
+
+    source is a path or a file object. Each line holds the two endpoints of an edge, followed for a DirectedGraph by
+    an optional weight that defaults to 1, separated by whitespace or by the given delimiter. Weights of a chunk are
+    read as doubles if any of them is not an integer that fits in 64 bits. Blank lines and lines starting with '#'
+    are skipped. Endpoints of a DirectedGraph are integer ids, and missing vertices are added;
+    endpoints of an UndirectedGraph are vertex names.
+
+    The file is read about chunk_size bytes at a time. Each chunk is parsed into columns and added through the
+    graph's add_edges(), so memory use is bounded by the chunk size rather than the file size. If given,
+    progress(bytes_read, edges_read) is called after each chunk.
+
+    If skip_invalid is True, edges follow the same rules as add_edge(): loops and non-positive weights are skipped,
+    and duplicate edges are added once, keeping the last weight. Otherwise a loop, a non-positive weight or an edge
+    that is already in the graph or earlier in the file raises ValueError. Lines that can't be parsed always raise
+    ValueError.
+    """
+
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as fp:
+            return load_edge_list(graph, fp, delimiter, chunk_size, skip_invalid, progress)
+
+    directed: bool = isinstance(graph, DirectedGraph)
+    bytes_read: int = 0
+    edges_read: int = 0
+    line_number: int = 0
+
+    for lines in iter(lambda: source.readlines(chunk_size), []):
+        if directed:
+            chunk: tuple = _directed_columns(lines, delimiter, line_number)
+            _add_directed(graph, chunk, skip_invalid)
+        else:
+            chunk = _undirected_columns(lines, delimiter, line_number)
+            _add_undirected(graph, chunk, skip_invalid)
+
+        bytes_read += sum(map(len, lines))
+        edges_read += len(chunk[0])
+        line_number += len(lines)
+        if progress is not None:
+            progress(bytes_read, edges_read)
+
+    return edges_read
+
+
+def _fields(lines: [], delimiter: str):
+    """Yields the index and fields of every line that is not blank or a comment."""
+
+    separator = delimiter
+    if delimiter is not None and lines and isinstance(lines[0], bytes):
+        separator = delimiter.encode("utf-8")
+
+    for i, line in enumerate(lines):
+        line = line.strip()
+        if not line or line[:1] in (b"#", "#"):
+            continue
+
+        yield i, line.split() if separator is None else [field.strip() for field in line.split(separator)]
+
+
+def _directed_columns(lines: [], delimiter: str, line_number: int) -> (array, array, array, []):
+    """
+    Returns the source, destination and weight columns of a chunk of directed edge lines, along with the line number
+    of each edge.
+    """
+
+    sources: array = array("q")
+    destinations: array = array("q")
+    weights: array = array("q")
+    numbers: list = list()
+
+    for i, fields in _fields(lines, delimiter):
+        try:
+            if len(fields) not in (2, 3):
+                raise ValueError("expected two endpoints and an optional weight")
+            src, dst = int(fields[0]), int(fields[1])
+            if src < 0 or dst < 0:
+                raise ValueError("negative vertex id")
+            if src >= 1 << 63 or dst >= 1 << 63:
+                raise ValueError("vertex id out of range")
+            weight = 1 if len(fields) == 2 else _number(fields[2])
+        except ValueError as error:
+            raise ValueError(f"line {line_number + i + 1}: {error}") from None
+
+        # Switch the weight column to doubles the first time a weight is read that is not a 64-bit integer.
+        if weights.typecode == "q" and not (isinstance(weight, int) and -(1 << 63) <= weight < 1 << 63):
+            weights = array("d", weights)
+
+        sources.append(src)
+        destinations.append(dst)
+        weights.append(weight)
+        numbers.append(line_number + i + 1)
+
+    return sources, destinations, weights, numbers
+
+
+def _undirected_columns(lines: [], delimiter: str, line_number: int) -> ([], [], []):
+    """Returns the two endpoint columns of a chunk of undirected edge lines, along with the line number of each edge."""
+
+    us: list = list()
+    vs: list = list()
+    numbers: list = list()
+
+    for i, fields in _fields(lines, delimiter):
+        if len(fields) != 2:
+            raise ValueError(f"line {line_number + i + 1}: expected two endpoints")
+
+        u, v = fields
+        us.append(u.decode("utf-8") if isinstance(u, bytes) else u)
+        vs.append(v.decode("utf-8") if isinstance(v, bytes) else v)
+        numbers.append(line_number + i + 1)
+
+    return us, vs, numbers
+
+
+def _add_directed(d_graph: DirectedGraph, chunk: tuple, skip_invalid: bool) -> None:
+    """Adds a chunk of directed edge columns to the graph, adding any missing vertices first."""
+
+    sources, destinations, weights, numbers = chunk
+    if not sources:
+        return
+
+    d_graph.add_vertices(max(max(sources), max(destinations)) + 1 - d_graph.v_count)
+
+    if not skip_invalid:
+        seen: set = set()
+        for src, dst, weight, number in zip(sources, destinations, weights, numbers):
+            if src == dst or weight < 1:
+                raise ValueError(f"line {number}: {'loop' if src == dst else 'non-positive weight'}")
+            if (src, dst) in seen or d_graph.are_adjacent(src, dst):
+                raise ValueError(f"line {number}: duplicate edge")
+            seen.add((src, dst))
+
+    d_graph.add_edges(zip(sources, destinations, weights))
+
+
+def _add_undirected(ud_graph, chunk: tuple, skip_invalid: bool) -> None:
+    """Adds a chunk of undirected edge columns to the graph."""
+
+    us, vs, numbers = chunk
+
+    if not skip_invalid:
+        seen: set = set()
+        for u, v, number in zip(us, vs, numbers):
+            if u == v:
+                raise ValueError(f"line {number}: loop")
+            if (u, v) in seen or (v, u) in seen or ud_graph.are_adjacent(u, v):
+                raise ValueError(f"line {number}: duplicate edge")
+            seen.add((u, v))
+
+    ud_graph.add_edges(zip(us, vs))
+
+
+def _number(field):
+    """Returns a weight field as an int, or as a float if it is not a whole number."""
+
+    try:
+        return int(field)
+    except ValueError:
+        return float(field)
@@ -0,0 +1,47 @@
+# Course: CS261 - Data Structures
+# Author: Mohamed Al-Hussein
+# Assignment: 06
+# Description: Helpers shared by the streaming text exporters of the graph implementations.
+
+
+def write_lines(fp, lines, chunk_size: int = 1 << 16) -> None:
+    """
+    Writes lines to the text file fp, joining about chunk_size characters of lines into each write.
+
+    Only one chunk is held in memory at a time, so lines can be generated lazily for graphs of any size.
+    """
+
+    chunk: list = list()
+    size: int = 0
+    for line in lines:
+        chunk.append(line)
+        size += len(line)
+        if size >= chunk_size:
+            fp.write("".join(chunk))
+            chunk.clear()
+            size = 0
+
+    if chunk:
+        fp.write("".join(chunk))
+
+
+def dot_id(v) -> str:
+    """Returns vertex v as a DOT identifier, quoting it unless it is an integer."""
+
+    if isinstance(v, int):
+        return str(v)
+
+    return '"' + str(v).replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def vertex_subset(all_vertices: [], vertices) -> ([], set):
+    """
+    Returns the vertices to export in the order of all_vertices, along with the set of allowed vertices, or None if
+    vertices is None and every vertex is allowed.
+    """
+
+    if vertices is None:
+        return all_vertices, None
+
+    allowed: set = set(vertices)
+    return [v for v in all_vertices if v in allowed], allowed
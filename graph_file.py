@@ -0,0 +1,97 @@
+# Course: CS261 - Data Structures
+# Author: Mohamed Al-Hussein
+# Assignment: 06
+# Description: Versioned binary file format for graphs kept as compressed sparse row arrays.
+
+from array import array
+import mmap as mmap_module
+import struct
+import sys
+
+MAGIC: bytes = b"PYGRAPH\0"
+VERSION: int = 1
+
+DIRECTED: int = 0
+UNDIRECTED: int = 1
+
+# A file starts with the magic bytes, the format version, the kind of graph, the number of vertices and the number
+# of arrays, followed by the typecode and length of each array. The arrays come next in the same order, little-endian
+# and each starting on an 8-byte boundary, so that they can be memory-mapped in place.
+_HEADER: struct.Struct = struct.Struct("<8sIIqq")
+_ARRAY: struct.Struct = struct.Struct("<c7xq")
+_TYPECODES: str = "Bidq"
+
+
+def write_arrays(path: str, kind: int, v_count: int, arrays: []) -> None:
+    """Writes a graph file holding the given arrays, which may be arrays or memoryviews of the same typecodes."""
+
+    typecodes: list = [_typecode(values) for values in arrays]
+
+    with open(path, "wb") as fp:
+        fp.write(_HEADER.pack(MAGIC, VERSION, kind, v_count, len(arrays)))
+        for typecode, values in zip(typecodes, arrays):
+            fp.write(_ARRAY.pack(typecode.encode("ascii"), len(values)))
+
+        for typecode, values in zip(typecodes, arrays):
+            fp.write(bytes(-fp.tell() % 8))
+            if sys.byteorder == "big":
+                values = array(typecode, values)
+                values.byteswap()
+            fp.write(values)
+
+
+def read_arrays(path: str, kind: int, mmap: bool) -> (int, []):
+    """
+    Returns the number of vertices and the arrays held by a graph file of the given kind.
+
+    If mmap is True, the arrays are memoryviews over a read-only memory map of the file. Otherwise they are read into
+    arrays. Raises ValueError if the file is not a graph file of the given kind and version.
+    """
+
+    with open(path, "rb") as fp:
+        header: bytes = fp.read(_HEADER.size)
+        if len(header) < _HEADER.size or header[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"not a graph file: {path!r}")
+
+        _, version, file_kind, v_count, n = _HEADER.unpack(header)
+        if version != VERSION:
+            raise ValueError(f"unsupported graph file version: {version}")
+        if file_kind != kind:
+            raise ValueError(f"graph file holds a {'directed' if file_kind == DIRECTED else 'undirected'} graph")
+
+        specs: list = list()
+        for _ in range(n):
+            typecode, length = _ARRAY.unpack(fp.read(_ARRAY.size))
+            typecode = typecode.decode("ascii")
+            if typecode not in _TYPECODES:
+                raise ValueError(f"unsupported array typecode in graph file: {typecode!r}")
+            specs.append((typecode, length))
+
+        # Memory maps share the byte order of the machine, so big-endian machines read and swap the arrays instead.
+        buffer: memoryview = None
+        if mmap and sys.byteorder == "little":
+            buffer = memoryview(mmap_module.mmap(fp.fileno(), 0, access=mmap_module.ACCESS_READ))
+
+        arrays: list = list()
+        position: int = _HEADER.size + n * _ARRAY.size
+        for typecode, length in specs:
+            position += -position % 8
+            size: int = length * array(typecode).itemsize
+            if buffer is not None:
+                arrays.append(buffer[position:position + size].cast(typecode))
+            else:
+                values: array = array(typecode)
+                fp.seek(position)
+                values.fromfile(fp, length)
+                if sys.byteorder == "big":
+                    values.byteswap()
+                arrays.append(values)
+            position += size
+
+    return v_count, arrays
+
+
+def _typecode(values) -> str:
+    """Returns the typecode of an array or the format of a memoryview."""
+
+    return values.typecode if isinstance(values, array) else values.format
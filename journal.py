@@ -0,0 +1,247 @@
+# Course: CS261 - Data Structures
+# Author: Mohamed Al-Hussein
+# Assignment: 06
+# Description: Snapshot and write-ahead log persistence for graphs.
+
+import functools
+import inspect
+import json
+import os
+
+_MANIFEST: str = "manifest.json"
+
+
+def journaled(method=None, *, iterable: str = None):
+    """
+    Decorator for graph methods that change the graph, which records each call in the graph's journal, if it has
+    one.
+
+    Calls are encoded before they run, so arguments that can't be written raise before the graph changes, and
+    recorded after they return, so calls that raise are left out. Calls made from inside a recorded method are not
+    recorded themselves, since replaying the outer call repeats them.
+
+    iterable names a parameter that takes an iterable of vertices or edges, such as a generator that can only be read
+    once. It is read into a list, so that the same values are both applied and written. Other arguments are passed
+    to the method unchanged.
+    """
+
+    if method is None:
+        return functools.partial(journaled, iterable=iterable)
+
+    name: str = method.__name__
+    position: int = None
+    if iterable is not None:
+        position = list(inspect.signature(method).parameters).index(iterable) - 1
+
+    @functools.wraps(method)
+    def record(self, *args, **kwargs):
+        journal: Journal = self._journal
+        if journal is None or not journal.recording:
+            return method(self, *args, **kwargs)
+
+        if iterable in kwargs:
+            kwargs[iterable] = list(kwargs[iterable])
+        elif position is not None and position < len(args):
+            args = args[:position] + (list(args[position]),) + args[position + 1:]
+
+        line: bytes = journal.encode(name, args, kwargs)
+
+        journal.recording = False
+        try:
+            result = method(self, *args, **kwargs)
+        finally:
+            journal.recording = True
+
+        journal.write(line)
+        return result
+
+    return record
+
+
+class Journal:
+    """
+    Class to implement snapshot plus write-ahead log persistence of one graph in a directory
+    - every call that changes the graph is appended to a log
+    - the log is flushed to disk after every sync_every records
+    - snapshot() saves the whole graph and starts a new, empty log
+
+    Snapshots and logs are numbered by generation. A manifest names the latest complete snapshot, and the logs from
+    its generation on hold every change made after it, so recovery loads the snapshot and replays only those logs.
+    Vertex names and weights must be JSON values, and snapshots of an UndirectedGraph also need string vertex names.
+    """
+
+    def __init__(self, directory: str, sync_every: int = 1000):
+        """Store the directory of the journal, creating it if it doesn't exist."""
+
+        self.directory: str = directory
+        self.sync_every: int = sync_every
+        self.graph = None
+        self.generation: int = 0
+        self.recording: bool = True
+        self._fp = None
+        self._pending: int = 0
+
+        os.makedirs(directory, exist_ok=True)
+
+    def recover(self, graph_class):
+        """
+        Returns a graph of graph_class rebuilt from the latest snapshot and the logs written after it, and starts
+        recording its changes.
+
+        If the journal is empty, returns a new empty graph. A record cut short at the end of the last log, as left
+        by a crash, is dropped. Raises ValueError if the journal holds a graph of a different class.
+        """
+
+        manifest: dict = self._read_manifest()
+        if manifest is None:
+            graph = graph_class()
+            self.generation = 0
+        elif manifest["graph"] != graph_class.__name__:
+            raise ValueError(f"journal holds a {manifest['graph']}, not a {graph_class.__name__}")
+        else:
+            self.generation = manifest["generation"]
+            graph = graph_class._from_snapshot(self._path("snapshot", self.generation), manifest["metadata"])
+
+        generations: list = [gen for gen in self._generations("log") if gen >= self.generation]
+        for gen in generations:
+            self._replay(graph, self._path("log", gen))
+        if generations:
+            self.generation = generations[-1]
+
+        self._attach(graph)
+        return graph
+
+    @staticmethod
+    def encode(name: str, args: [], kwargs: dict) -> bytes:
+        """Returns the log line recording a call. Raises TypeError if an argument is not a JSON value."""
+
+        record: list = [name, list(args), kwargs] if kwargs else [name, list(args)]
+        return json.dumps(record, separators=(",", ":")).encode("utf-8") + b"\n"
+
+    def write(self, line: bytes) -> None:
+        """Appends a line made by encode() to the log, and flushes the log to disk if enough records are waiting."""
+
+        self._fp.write(line)
+
+        self._pending += 1
+        if self._pending >= self.sync_every:
+            self.sync()
+
+    def sync(self) -> None:
+        """Flushes all records written so far to disk."""
+
+        if self._fp is not None:
+            self._fp.flush()
+            os.fsync(self._fp.fileno())
+            self._pending = 0
+
+    def snapshot(self) -> None:
+        """
+        Saves the whole graph as a new snapshot and starts a new log, then removes the older snapshot and logs.
+
+        The snapshot is written before the new log is started, so if the graph can't be saved, the error is raised
+        with the journal unchanged. The manifest is only replaced once the snapshot is on disk, so a crash part way
+        through leaves the previous snapshot and its logs in place.
+        """
+
+        self.sync()
+        path: str = self._path("snapshot", self.generation + 1)
+        try:
+            metadata: dict = self.graph._snapshot(path)
+            _fsync_file(path)
+        except Exception:
+            if os.path.exists(path):
+                os.remove(path)
+            raise
+
+        self._fp.close()
+        self.generation += 1
+        self._fp = open(self._path("log", self.generation), "ab")
+
+        manifest_path: str = os.path.join(self.directory, _MANIFEST)
+        with open(manifest_path + ".tmp", "w", encoding="utf-8") as fp:
+            json.dump({"graph": type(self.graph).__name__, "generation": self.generation, "metadata": metadata}, fp)
+            fp.flush()
+            os.fsync(fp.fileno())
+        os.replace(manifest_path + ".tmp", manifest_path)
+
+        for kind in ("log", "snapshot"):
+            for gen in self._generations(kind):
+                if gen < self.generation:
+                    os.remove(self._path(kind, gen))
+
+    def close(self) -> None:
+        """Flushes the log to disk and stops recording changes to the graph."""
+
+        if self._fp is not None:
+            self.sync()
+            self._fp.close()
+            self._fp = None
+
+        if self.graph is not None:
+            self.graph._journal = None
+            self.graph = None
+
+    def _attach(self, graph) -> None:
+        """Starts recording the changes of graph in the log of the current generation."""
+
+        self._fp = open(self._path("log", self.generation), "ab")
+        self.graph = graph
+        graph._journal = self
+
+    def _replay(self, graph, path: str) -> None:
+        """Applies every record of a log to graph, and cuts off a partly written last record."""
+
+        good_size: int = 0
+        with open(path, "rb") as fp:
+            lines: list = fp.readlines()
+
+        for i, line in enumerate(lines):
+            try:
+                if not line.endswith(b"\n"):
+                    raise ValueError("incomplete record")
+                record: list = json.loads(line)
+            except ValueError:
+                if i == len(lines) - 1:
+                    break
+                raise ValueError(f"corrupt record {i + 1} in journal log {path!r}") from None
+
+            name, args = record[0], record[1]
+            getattr(graph, name)(*args, **(record[2] if len(record) > 2 else {}))
+            good_size += len(line)
+
+        if good_size < os.path.getsize(path):
+            with open(path, "rb+") as fp:
+                fp.truncate(good_size)
+
+    def _read_manifest(self) -> dict:
+        """Returns the manifest of the latest snapshot, or None if no snapshot was taken yet."""
+
+        try:
+            with open(os.path.join(self.directory, _MANIFEST), encoding="utf-8") as fp:
+                return json.load(fp)
+        except FileNotFoundError:
+            return None
+
+    def _generations(self, kind: str) -> []:
+        """Returns the generations of the log or snapshot files in the directory, in ascending order."""
+
+        generations: list = list()
+        for file_name in os.listdir(self.directory):
+            prefix, _, suffix = file_name.partition(".")
+            if prefix == kind and suffix.isdigit():
+                generations.append(int(suffix))
+
+        return sorted(generations)
+
+    def _path(self, kind: str, generation: int) -> str:
+        """Returns the path of the log or snapshot file of a generation."""
+
+        return os.path.join(self.directory, f"{kind}.{generation:08d}")
+
+
+def _fsync_file(path: str) -> None:
+    """Flushes a file that was written and closed elsewhere to disk."""
+
+    with open(path, "rb+") as fp:
+        os.fsync(fp.fileno())
@@ -0,0 +1,50 @@
+# Course: CS261 - Data Structures
+# Author: Mohamed Al-Hussein
+# Assignment: 06
+# Description: Arrays kept in shared memory, for graph algorithms that run on a pool of worker processes.
+
+from array import array
+from multiprocessing import shared_memory
+
+
+def share_arrays(arrays: []) -> (shared_memory.SharedMemory, []):
+    """
+    Returns a new block of shared memory holding copies of the given arrays, along with the layout needed to read
+    them back with shared_views().
+
+    Arrays may also be memoryviews. An entry may instead be a (typecode, length) pair, which reserves a zeroed array
+    of that length. The process that creates the block must close and unlink it once it is done.
+    """
+
+    layout: list = list()
+    size: int = 0
+    for values in arrays:
+        typecode, length = values if isinstance(values, tuple) else (_typecode(values), len(values))
+        size += -size % 8
+        layout.append((typecode, size, length))
+        size += length * array(typecode).itemsize
+
+    block: shared_memory.SharedMemory = shared_memory.SharedMemory(create=True, size=max(1, size))
+    for values, view in zip(arrays, shared_views(block, layout)):
+        if not isinstance(values, tuple):
+            view[:] = values if isinstance(values, memoryview) else memoryview(values)
+        view.release()
+
+    return block, layout
+
+
+def shared_views(block: shared_memory.SharedMemory, layout: []) -> []:
+    """
+    Returns a writable memoryview of each array in a block of shared memory created by share_arrays().
+
+    The views must be released before the block is closed.
+    """
+
+    return [block.buf[offset:offset + length * array(typecode).itemsize].cast(typecode)
+            for typecode, offset, length in layout]
+
+
+def _typecode(values) -> str:
+    """Returns the typecode of an array or the format of a memoryview."""
+
+    return values.typecode if isinstance(values, array) else values.format
@@ -1,3 +1,7 @@
+import io
+import os
+import pickle
+import tempfile
 import unittest
 
 from d_graph import DirectedGraph
@@ -440,5 +444,631 @@ class TestDirectedGraph(unittest.TestCase):
             self.assertListEqual(e, d)
 
 
+    def test_from_edges_backends_match_dense_backend(self) -> None:
+        # Arrange
+        edges: list = [(0, 1, 10), (4, 0, 12), (1, 4, 15), (4, 3, 3), (3, 1, 5), (2, 1, 23), (3, 2, 7)]
+        g_dense: DirectedGraph = DirectedGraph(edges)
+
+        # Act/Assert
+        for backend in ["dense", "sparse", "csr", "mapped"]:
+            g: DirectedGraph = DirectedGraph.from_edges(edges, backend=backend)
+            self.assertEqual(backend, g.backend)
+            self.assertListEqual(g_dense.adj_matrix, g.adj_matrix)
+            self.assertListEqual(g_dense.get_edges(), g.get_edges())
+            self.assertListEqual(g_dense.reversed().get_edges(), g.reversed().get_edges())
+            self.assertCountEqual(g_dense.connected_components(), g.connected_components())
+            self.assertEqual(g_dense.has_cycle(), g.has_cycle())
+            for v in range(5):
+                self.assertListEqual(g_dense.neighbors(v), g.neighbors(v))
+                self.assertListEqual(g_dense.dfs(v), g.dfs(v))
+                self.assertListEqual(g_dense.bfs(v), g.bfs(v))
+                self.assertListEqual(g_dense.dijkstra(v), g.dijkstra(v))
+
+    def test_set_backend_keeps_edges(self) -> None:
+        # Arrange
+        exp: list = [(0, 1, 10), (1, 4, 15), (2, 1, 23), (3, 1, 5), (3, 2, 7), (4, 0, 12), (4, 3, 3)]
+        edges: list = [(0, 1, 10), (4, 0, 12), (1, 4, 15), (4, 3, 3), (3, 1, 5), (2, 1, 23), (3, 2, 7)]
+        g: DirectedGraph = DirectedGraph(edges)
+
+        # Act/Assert
+        for backend in ["sparse", "csr", "mapped", "dense"]:
+            g.set_backend(backend)
+            self.assertEqual(backend, g.backend)
+            self.assertListEqual(exp, g.get_edges())
+
+    def test_csr_backend_is_read_only(self) -> None:
+        # Arrange
+        g: DirectedGraph = DirectedGraph.from_edges([(0, 1, 1)], backend="csr")
+
+        # Act/Assert
+        self.assertRaises(TypeError, g.add_vertex)
+        self.assertRaises(TypeError, g.add_edge, 1, 0)
+        self.assertRaises(TypeError, g.remove_edge, 0, 1)
+        self.assertTrue(g.are_adjacent(0, 1))
+
+    def test_from_edges_rejects_unknown_backend(self) -> None:
+        # Act/Assert
+        self.assertRaises(ValueError, DirectedGraph.from_edges, [], backend="unknown")
+
+    def test_add_vertex_keeps_edges_when_matrix_grows(self) -> None:
+        # Arrange
+        exp: list = [(0, 1, 10), (1, 0, 5), (2, 40, 7), (40, 2, 3)]
+        g: DirectedGraph = DirectedGraph([(0, 1, 10), (1, 0, 5)])
+
+        # Act
+        for _ in range(40):
+            g.add_vertex()
+        g.add_edge(2, 40, 7)
+        g.add_edge(40, 2, 3)
+
+        # Assert
+        self.assertEqual(42, g.v_count)
+        self.assertEqual(42, len(g.adj_matrix))
+        self.assertListEqual(exp, g.get_edges())
+        self.assertListEqual([2], g.reversed().neighbors(40))
+
+    def test_add_edge_accepts_non_integer_weights(self) -> None:
+        # Arrange
+        exp: list = [(0, 1, 2), (1, 2, 1.5)]
+        g: DirectedGraph = DirectedGraph([(0, 1, 2)])
+        g.add_vertex()
+
+        # Act
+        g.add_edge(1, 2, 1.5)
+
+        # Assert
+        self.assertListEqual(exp, g.get_edges())
+        self.assertListEqual([0, 2, 3.5], g.dijkstra(0))
+
+    def test_add_vertices_example_1(self) -> None:
+        # Arrange
+        exp: list = [[0] * 5] * 5
+        g: DirectedGraph = DirectedGraph()
+
+        # Act
+        count_1: int = g.add_vertices(3)
+        count_2: int = g.add_vertices(2)
+
+        # Assert
+        self.assertEqual(3, count_1)
+        self.assertEqual(5, count_2)
+        self.assertListEqual(exp, g.adj_matrix)
+
+    def test_add_edges_skips_invalid_edges_and_keeps_last_weight(self) -> None:
+        # Arrange
+        exp: list = [(0, 1, 4), (1, 2, 1), (2, 0, 6)]
+        g: DirectedGraph = DirectedGraph()
+        g.add_vertices(3)
+
+        # Act
+        for backend in ["dense", "sparse"]:
+            g.set_backend(backend)
+            g.add_edges([(0, 1, 3), (1, 2, 1), (2, 2, 5), (2, 3, 5), (2, 0, 0), (2, 0, 6), (0, 1, 4)])
+
+            # Assert
+            self.assertListEqual(exp, g.get_edges())
+
+    def test_from_edges_example_1(self) -> None:
+        # Arrange
+        edges: list = [(0, 1, 10), (4, 0, 12), (1, 4, 15), (4, 3, 3), (3, 1, 5), (2, 1, 23), (3, 2, 7)]
+        exp: list = DirectedGraph(edges).adj_matrix
+
+        # Act
+        g_1: DirectedGraph = DirectedGraph.from_edges(iter(edges))
+        g_2: DirectedGraph = DirectedGraph.from_edges(edges, v_count=7)
+
+        # Assert
+        self.assertListEqual(exp, g_1.adj_matrix)
+        self.assertEqual(7, g_2.v_count)
+        self.assertListEqual(g_1.get_edges(), g_2.get_edges())
+
+    def test_in_neighbors_returns_all_vertices_with_edge_to_vertex(self) -> None:
+        # Arrange
+        exp: list = [0, 3]
+        edges: list = [(3, 1, 1), (0, 1, 1), (1, 2, 1)]
+        g: DirectedGraph = DirectedGraph(edges)
+
+        # Act
+        in_neighbors: list = g.in_neighbors(1)
+
+        # Assert
+        self.assertListEqual(exp, in_neighbors)
+
+    def test_degrees_follow_added_and_removed_edges(self) -> None:
+        # Arrange
+        edges: list = [(0, 1, 10), (4, 0, 12), (1, 4, 15), (4, 3, 3), (3, 1, 5), (2, 1, 23), (3, 2, 7)]
+
+        for backend in ["dense", "sparse"]:
+            g: DirectedGraph = DirectedGraph.from_edges(edges, backend=backend)
+
+            # Act
+            g.add_edge(0, 3, 2)
+            g.add_edge(0, 3, 4)
+            g.remove_edge(2, 1)
+            g.remove_edge(2, 1)
+
+            # Assert
+            self.assertListEqual([2, 1, 0, 2, 2], [g.out_degree(v) for v in range(5)])
+            self.assertListEqual([1, 2, 1, 2, 1], [g.in_degree(v) for v in range(5)])
+            self.assertListEqual([1, 3], g.neighbors(0))
+            self.assertListEqual([0, 4], g.in_neighbors(3))
+            self.assertListEqual([], g.neighbors(2))
+            self.assertEqual(-1, g.out_degree(5))
+            self.assertEqual(-1, g.in_degree(-1))
+
+    def test_connected_components_does_not_recurse(self) -> None:
+        # Arrange
+        v_count: int = 20000
+        edges: list = [(v, v + 1, 1) for v in range(v_count - 1)] + [(v_count - 1, 0, 1)]
+        g: DirectedGraph = DirectedGraph.from_edges(edges, backend="sparse")
+
+        # Act
+        components: list = g.connected_components()
+
+        # Assert
+        self.assertEqual(1, len(components))
+        self.assertListEqual(list(range(v_count)), components[0])
+
+    def test_component_ids_example_1(self) -> None:
+        # Arrange
+        edges: list = [(0, 1, 1), (1, 0, 1), (1, 2, 1), (2, 3, 1), (3, 2, 1), (4, 2, 1)]
+        g: DirectedGraph = DirectedGraph(edges)
+
+        # Act
+        components: list = g.connected_components()
+        component_ids: list = g.component_ids()
+
+        # Assert
+        self.assertEqual(3, len(components))
+        for i, component in enumerate(components):
+            for v in component:
+                self.assertEqual(i, component_ids[v])
+
+    def test_condensation_example_1(self) -> None:
+        # Arrange
+        edges: list = [(0, 1, 1), (1, 0, 1), (1, 2, 4), (0, 2, 3), (2, 3, 1), (3, 2, 1), (4, 2, 2)]
+        g: DirectedGraph = DirectedGraph(edges)
+
+        # Act
+        dag, component_ids = g.condensation()
+
+        # Assert
+        self.assertEqual(3, dag.v_count)
+        self.assertFalse(dag.has_cycle())
+        self.assertEqual(component_ids[0], component_ids[1])
+        self.assertEqual(component_ids[2], component_ids[3])
+        self.assertCountEqual(
+            [(component_ids[0], component_ids[2], 3), (component_ids[4], component_ids[2], 2)], dag.get_edges()
+        )
+        for src, dst, _ in dag.get_edges():
+            self.assertLess(src, dst)
+
+    def test_find_cycle_returns_cycle_vertices(self) -> None:
+        # Arrange
+        edges: list = [(0, 1, 1), (1, 2, 1), (2, 3, 1), (3, 1, 1), (3, 4, 1)]
+        g: DirectedGraph = DirectedGraph(edges)
+
+        # Act
+        cycle: list = g.find_cycle()
+
+        # Assert
+        self.assertListEqual([1, 2, 3], cycle)
+        self.assertTrue(g.is_valid_path(cycle + cycle[:1]))
+
+    def test_find_cycle_returns_empty_list_if_acyclic(self) -> None:
+        # Arrange
+        g: DirectedGraph = DirectedGraph.from_edges([(v, v + 1, 1) for v in range(20000)], backend="sparse")
+
+        # Act/Assert
+        self.assertListEqual([], g.find_cycle())
+        self.assertFalse(g.has_cycle())
+
+    def test_would_create_cycle_example_1(self) -> None:
+        # Arrange
+        edges: list = [(0, 1, 1), (1, 2, 1), (2, 3, 1), (4, 3, 1)]
+        g: DirectedGraph = DirectedGraph(edges)
+        test_cases: list = [((3, 0), True), ((2, 1), True), ((0, 3), False), ((3, 4), True), ((4, 0), False),
+                            ((1, 1), False), ((0, 9), False)]
+
+        # Act/Assert
+        for (src, dst), exp in test_cases:
+            self.assertEqual(exp, g.would_create_cycle(src, dst))
+            self.assertFalse(g.has_cycle())
+
+    def test_shortest_path_example_1(self) -> None:
+        # Arrange
+        inf: float = float("inf")
+        edges: list = [(0, 1, 10), (4, 0, 12), (1, 4, 15), (4, 3, 3), (3, 1, 5), (2, 1, 23), (3, 2, 7)]
+        g: DirectedGraph = DirectedGraph(edges)
+        test_cases: list = [
+            (0, 2, [0, 1, 4, 3, 2], 35),
+            (2, 0, [2, 1, 4, 0], 50),
+            (3, 3, [3], 0),
+            (4, 1, [4, 3, 1], 8),
+            (0, 7, [], inf)
+        ]
+
+        # Act/Assert
+        for src, dst, exp_path, exp_dist in test_cases:
+            path, dist = g.shortest_path(src, dst)
+            self.assertListEqual(exp_path, path)
+            self.assertEqual(exp_dist, dist)
+
+        g.remove_edge(4, 3)
+        self.assertTupleEqual(([], inf), g.shortest_path(0, 2))
+
+    def test_shortest_paths_multiple_sources(self) -> None:
+        # Arrange
+        inf: float = float("inf")
+        edges: list = [(0, 1, 10), (4, 0, 12), (1, 4, 15), (4, 3, 3), (3, 1, 5), (2, 1, 23), (3, 2, 7)]
+        g: DirectedGraph = DirectedGraph(edges)
+
+        # Act
+        distances, predecessors = g.shortest_paths([0, 3])
+
+        # Assert
+        self.assertListEqual([0, 5, 7, 0, 20], distances)
+        self.assertListEqual([-1, 3, 3, -1, 1], predecessors)
+
+        # Act
+        distances, predecessors = g.shortest_paths([0], targets=[1])
+
+        # Assert
+        self.assertListEqual([0, 10, inf, inf, inf], distances)
+        self.assertListEqual([-1, 0, -1, -1, -1], predecessors)
+
+    def test_all_pairs_shortest_paths_matches_dijkstra(self) -> None:
+        # Arrange
+        edges: list = [(0, 1, 10), (4, 0, 12), (1, 4, 15), (4, 3, 3), (3, 1, 5), (2, 1, 23), (3, 2, 7)]
+        g: DirectedGraph = DirectedGraph(edges)
+        g.remove_edge(4, 3)
+        exp: list = [g.dijkstra(v) for v in range(5)]
+
+        # Act/Assert
+        for method, workers in [("auto", None), ("floyd_warshall", None), ("dijkstra", None), ("dijkstra", 2)]:
+            distances, next_hops = g.all_pairs_shortest_paths(method=method, workers=workers)
+            self.assertListEqual(exp, [list(row) for row in distances])
+            self.assertIsNone(next_hops)
+
+    def test_all_pairs_shortest_paths_next_hops(self) -> None:
+        # Arrange
+        exp: list = [[-1, 1, 1, 1, 1], [4, -1, 4, 4, 4], [1, 1, -1, 1, 1], [1, 1, 2, -1, 1], [0, 3, 3, 3, -1]]
+        edges: list = [(0, 1, 10), (4, 0, 12), (1, 4, 15), (4, 3, 3), (3, 1, 5), (2, 1, 23), (3, 2, 7)]
+        g: DirectedGraph = DirectedGraph(edges)
+
+        # Act/Assert
+        for method in ["floyd_warshall", "dijkstra"]:
+            _, next_hops = g.all_pairs_shortest_paths(next_hops=True, method=method)
+            self.assertListEqual(exp, [list(row) for row in next_hops])
+
+    def test_all_pairs_shortest_paths_subset(self) -> None:
+        # Arrange
+        exp_distances: list = [[35, 10], [7, 5]]
+        exp_next_hops: list = [[1, 1], [2, 1]]
+        edges: list = [(0, 1, 10), (4, 0, 12), (1, 4, 15), (4, 3, 3), (3, 1, 5), (2, 1, 23), (3, 2, 7)]
+        g: DirectedGraph = DirectedGraph(edges)
+
+        # Act/Assert
+        for method in ["floyd_warshall", "dijkstra"]:
+            distances, next_hops = g.all_pairs_shortest_paths([0, 3], [2, 1], next_hops=True, method=method)
+            self.assertListEqual(exp_distances, [list(row) for row in distances])
+            self.assertListEqual(exp_next_hops, [list(row) for row in next_hops])
+
+    def test_iter_bfs_yields_depth_and_parent(self) -> None:
+        # Arrange
+        exp: list = [(3, 0, None), (1, 1, 3), (2, 1, 3), (4, 2, 1), (0, 3, 4)]
+        edges: list = [(0, 1, 10), (4, 0, 12), (1, 4, 15), (4, 3, 3), (3, 1, 5), (2, 1, 23), (3, 2, 7)]
+        g: DirectedGraph = DirectedGraph(edges)
+
+        # Act
+        bfs: list = list(g.iter_bfs(3))
+        dfs: list = [v for v, _, _ in g.iter_dfs(3, max_depth=1)]
+        missing: list = list(g.iter_dfs(5))
+
+        # Assert
+        self.assertListEqual(exp, bfs)
+        self.assertListEqual([3, 1, 2], dfs)
+        self.assertListEqual([], missing)
+
+    def test_iter_edges_yields_all_edges_lazily(self) -> None:
+        # Arrange
+        exp: list = [(0, 1, 10), (1, 4, 15), (2, 1, 23), (3, 1, 5), (3, 2, 7), (4, 0, 12), (4, 3, 3)]
+        edges: list = [(0, 1, 10), (4, 0, 12), (1, 4, 15), (4, 3, 3), (3, 1, 5), (2, 1, 23), (3, 2, 7)]
+
+        for backend in ["dense", "sparse", "csr"]:
+            g: DirectedGraph = DirectedGraph.from_edges(edges, backend=backend)
+
+            # Act
+            edge_iter = g.iter_edges()
+
+            # Assert
+            self.assertTupleEqual(exp[0], next(edge_iter))
+            self.assertListEqual(exp[1:], list(edge_iter))
+
+    def test_edge_count_follows_mutations(self) -> None:
+        # Arrange
+        edges: list = [(0, 1, 10), (4, 0, 12), (1, 4, 15), (4, 3, 3), (3, 1, 5), (2, 1, 23), (3, 2, 7)]
+
+        for backend in ["dense", "sparse"]:
+            g: DirectedGraph = DirectedGraph.from_edges(edges, backend=backend)
+
+            # Act/Assert
+            self.assertEqual(7, g.edge_count)
+            self.assertEqual(5, g.vertex_count)
+
+            g.add_edge(0, 1, 3)
+            g.add_edge(0, 2, 3)
+            g.add_edges([(1, 0, 1), (1, 0, 2), (2, 1, 4), (2, 2, 1)])
+            self.assertEqual(9, g.edge_count)
+
+            g.remove_edge(0, 2)
+            g.remove_edge(0, 2)
+            g.add_vertex()
+            self.assertEqual(8, g.edge_count)
+            self.assertEqual(6, g.vertex_count)
+            self.assertEqual(8, g.reversed().edge_count)
+
+            g.set_backend("csr")
+            self.assertEqual(8, g.edge_count)
+
+    def test_remove_vertex_leaves_tombstone(self) -> None:
+        # Arrange
+        edges: list = [(0, 1, 10), (4, 0, 12), (1, 4, 15), (4, 3, 3), (3, 1, 5), (2, 1, 23), (3, 2, 7)]
+
+        for backend in ["dense", "sparse"]:
+            g: DirectedGraph = DirectedGraph.from_edges(edges, backend=backend)
+
+            # Act
+            g.remove_vertex(1)
+            g.remove_vertex(1)
+            g.add_edge(1, 2, 5)
+
+            # Assert
+            self.assertEqual([(3, 2, 7), (4, 0, 12), (4, 3, 3)], g.get_edges())
+            self.assertEqual(3, g.edge_count)
+            self.assertEqual(4, g.vertex_count)
+            self.assertEqual([0, 2, 3, 4], g.get_vertices())
+            self.assertEqual(-1, g.out_degree(1))
+            self.assertEqual([], g.dfs(1))
+            self.assertEqual([[4], [3], [2], [0]], g.connected_components())
+            self.assertEqual([4], g.in_neighbors(0))
+            self.assertEqual([4, 0, 3, 2], g.dfs(4))
+
+    def test_compact_renumbers_remaining_vertices(self) -> None:
+        # Arrange
+        edges: list = [(0, 1, 10), (4, 0, 12), (1, 4, 15), (4, 3, 3), (3, 1, 5), (2, 1, 23), (3, 2, 7)]
+
+        for backend in ["dense", "sparse"]:
+            g: DirectedGraph = DirectedGraph.from_edges(edges, backend=backend)
+            g.remove_vertex(1)
+            g.remove_vertex(3)
+
+            # Act
+            mapping: list = g.compact()
+
+            # Assert
+            self.assertEqual([0, -1, 1, -1, 2], mapping)
+            self.assertEqual([(2, 0, 12)], g.get_edges())
+            self.assertEqual(3, g.vertex_count)
+            self.assertEqual([0, 1, 2], g.get_vertices())
+            self.assertEqual(backend, g.backend)
+            self.assertEqual([0, 1, 2], g.compact())
+
+    def test_remove_vertex_on_csr_backend_raises(self) -> None:
+        # Arrange
+        g: DirectedGraph = DirectedGraph.from_edges([(0, 1, 1)], backend="csr")
+
+        # Act/Assert
+        with self.assertRaises(TypeError):
+            g.remove_vertex(0)
+
+
+    def test_save_and_load_example_1(self) -> None:
+        # Arrange
+        edges: list = [(0, 1, 10), (4, 0, 12), (1, 4, 15), (4, 3, 3), (3, 1, 5), (2, 1, 23), (3, 2, 7)]
+        g: DirectedGraph = DirectedGraph.from_edges(edges, backend="sparse")
+
+        with tempfile.TemporaryDirectory() as directory:
+            path: str = os.path.join(directory, "graph.bin")
+
+            # Act
+            g.save(path)
+
+            for mmap in [True, False]:
+                g_loaded: DirectedGraph = DirectedGraph.load(path, mmap=mmap)
+
+                # Assert
+                self.assertEqual("csr", g_loaded.backend)
+                self.assertListEqual(g.get_edges(), g_loaded.get_edges())
+                self.assertListEqual(g.adj_matrix, g_loaded.adj_matrix)
+                self.assertListEqual(g.dijkstra(0), g_loaded.dijkstra(0))
+                self.assertListEqual(g.in_neighbors(1), g_loaded.in_neighbors(1))
+                self.assertListEqual(g.reversed().get_edges(), g_loaded.reversed().get_edges())
+                self.assertListEqual(g.get_edges(), pickle.loads(pickle.dumps(g_loaded)).get_edges())
+                self.assertListEqual(g.reversed().get_edges(),
+                                     pickle.loads(pickle.dumps(g_loaded.reversed())).get_edges())
+
+            del g_loaded
+
+    def test_load_rejects_undirected_graph_file(self) -> None:
+        # Arrange
+        with tempfile.TemporaryDirectory() as directory:
+            path: str = os.path.join(directory, "graph.bin")
+            with open(path, "wb") as fp:
+                fp.write(b"not a graph")
+
+            # Act/Assert
+            self.assertRaises(ValueError, DirectedGraph.load, path)
+
+
+    def test_mapped_backend_widens_weights_and_grows(self) -> None:
+        # Arrange
+        g: DirectedGraph = DirectedGraph.from_edges([(0, 1, 10), (1, 0, 5)], backend="mapped")
+
+        # Act
+        g.add_vertices(40)
+        g.add_edge(2, 40, 300)
+        g.add_edge(40, 2, 70000)
+        g.add_edge(1, 2, 1.5)
+        g.remove_vertex(0)
+
+        # Assert
+        self.assertListEqual([(1, 2, 1.5), (2, 40, 300), (40, 2, 70000)], g.get_edges())
+        self.assertListEqual([(2, 1, 1.5), (2, 40, 70000), (40, 2, 300)], g.reversed().get_edges())
+        self.assertListEqual([1, 40], g.in_neighbors(2))
+        self.assertEqual(2, g.in_degree(2))
+        self.assertEqual(3, g.edge_count)
+        self.assertListEqual(g.get_edges(), pickle.loads(pickle.dumps(g)).get_edges())
+
+    def test_mapped_backend_pickles_as_read_only_mapping(self) -> None:
+        # Arrange
+        g: DirectedGraph = DirectedGraph.from_edges([(0, 1, 10), (1, 0, 5)], backend="mapped")
+
+        # Act
+        g_copy: DirectedGraph = pickle.loads(pickle.dumps(g))
+
+        # Assert
+        self.assertEqual("mapped", g_copy.backend)
+        self.assertListEqual([(0, 1, 10), (1, 0, 5)], g_copy.get_edges())
+        self.assertRaises(TypeError, g_copy.add_edge, 0, 1, 3)
+
+    def test_mapped_backend_rejects_weights_beyond_64_bits(self) -> None:
+        # Arrange
+        g: DirectedGraph = DirectedGraph.from_edges([(0, 1, 3), (1, 0, 2 ** 64 - 1)], v_count=3, backend="mapped")
+
+        # Act/Assert
+        self.assertRaises(ValueError, g.add_edge, 1, 2, 2 ** 64)
+        self.assertListEqual([(0, 1, 3), (1, 0, 2 ** 64 - 1)], g.get_edges())
+        self.assertEqual(2, g.edge_count)
+
+        # A float weight turns every weight into a double.
+        g.add_edge(1, 2, 1.5)
+        self.assertListEqual([(0, 1, 3.0), (1, 0, float(2 ** 64 - 1)), (1, 2, 1.5)], g.get_edges())
+        self.assertIsInstance(g.get_edges()[0][2], float)
+
+    def test_write_edgelist_and_adjacency_apply_filters(self) -> None:
+        # Arrange
+        edges: list = [(0, 1, 10), (4, 0, 12), (1, 4, 15), (4, 3, 3), (3, 1, 5), (2, 1, 23), (3, 2, 7)]
+        g: DirectedGraph = DirectedGraph.from_edges(edges)
+        edge_list, adjacency = io.StringIO(), io.StringIO()
+
+        # Act
+        g.write_edgelist(edge_list, vertices=[1, 3, 4], min_weight=5)
+        g.write_adjacency(adjacency, vertices=[1, 3, 4], min_weight=5)
+
+        # Assert
+        self.assertEqual("1 4 15\n3 1 5\n", edge_list.getvalue())
+        self.assertEqual("1: 4:15\n3: 1:5\n4:\n", adjacency.getvalue())
+
+    def test_write_dot_example_1(self) -> None:
+        # Arrange
+        g: DirectedGraph = DirectedGraph.from_edges([(0, 1, 10), (2, 0, 3), (1, 2, 7)])
+        g.remove_vertex(1)
+        out: io.StringIO = io.StringIO()
+
+        # Act
+        g.write_dot(out)
+
+        # Assert
+        self.assertEqual("digraph {\n  0;\n  2;\n  2 -> 0 [label=3];\n}\n", out.getvalue())
+
+    def test_bfs_levels_example_1(self) -> None:
+        # Arrange
+        edges: list = [(0, 1, 10), (4, 0, 12), (1, 4, 15), (4, 3, 3), (3, 1, 5), (2, 1, 23), (3, 2, 7), (5, 2, 1)]
+
+        for backend in ["dense", "sparse", "csr", "mapped"]:
+            g: DirectedGraph = DirectedGraph.from_edges(edges, backend=backend)
+
+            # Act
+            distances, parents = g.bfs_levels([0])
+            limited, _ = g.bfs_levels([2, 0, 9], max_depth=1)
+
+            # Assert
+            self.assertListEqual([0, 1, 4, 3, 2, -1], list(distances))
+            self.assertListEqual([-1, 0, 3, 4, 1, -1], list(parents))
+            self.assertListEqual([0, 1, 0, -1, -1, -1], list(limited))
+
+    def test_dijkstra_many_matches_dijkstra(self) -> None:
+        # Arrange
+        edges: list = [(0, 1, 10), (4, 0, 12), (1, 4, 15), (4, 3, 3), (3, 1, 5), (2, 1, 23), (3, 2, 7)]
+        g: DirectedGraph = DirectedGraph.from_edges(edges, backend="sparse")
+        g.remove_vertex(2)
+        sources: list = [0, 4, 2, 3, 7, 1]
+        exp: list = [g.dijkstra(src) or [float("inf")] * 5 for src in sources]
+
+        # Act/Assert
+        for workers in [None, 2]:
+            distances: list = g.dijkstra_many(sources, workers=workers)
+            self.assertListEqual(exp, [list(row) for row in distances])
+
+    def test_connected_components_with_workers_matches_sequential(self) -> None:
+        # Arrange
+        edges: list = [(0, 1, 10), (4, 0, 12), (1, 4, 15), (4, 3, 3), (3, 1, 5), (2, 1, 23), (5, 2, 7), (2, 5, 1),
+                       (6, 5, 1), (3, 7, 1), (7, 8, 1), (8, 7, 1), (9, 6, 1)]
+        g: DirectedGraph = DirectedGraph.from_edges(edges, backend="csr")
+        exp: list = [sorted(component) for component in g.connected_components()]
+
+        # Act
+        comp: list = g.connected_components(workers=2)
+
+        # Assert
+        self.assertListEqual([[9], [6], [2, 5], [0, 1, 3, 4], [7, 8]], comp)
+        self.assertCountEqual(exp, comp)
+
+    def test_connected_components_with_workers_splits_large_graph(self) -> None:
+        # Arrange
+        # A chain of 3000 two-vertex cycles is large enough for the workers to send sets back out as new tasks.
+        edges: list = [(v, v ^ 1, 1) for v in range(6000)] + [(v, v + 1, 1) for v in range(1, 5999, 2)]
+        g: DirectedGraph = DirectedGraph.from_edges(sorted(edges), backend="csr")
+
+        # Act
+        comp: list = g.connected_components(workers=2)
+
+        # Assert
+        self.assertListEqual([[v, v + 1] for v in range(0, 6000, 2)], comp)
+
+    def test_dense_backend_keeps_weights_it_cannot_pack(self) -> None:
+        # Arrange
+        g: DirectedGraph = DirectedGraph([(0, 1, 3), (1, 2, 4)])
+
+        # Act
+        g.add_edge(2, 0, 2 ** 63)
+        g.add_edge(0, 2, 1.5)
+
+        # Assert
+        self.assertListEqual([(0, 1, 3), (0, 2, 1.5), (1, 2, 4), (2, 0, 2 ** 63)], g.get_edges())
+        self.assertListEqual([[0, 3, 1.5], [0, 0, 4], [2 ** 63, 0, 0]], g.adj_matrix)
+        self.assertEqual(4, g.edge_count)
+
+    def test_adj_matrix_rows_are_read_only(self) -> None:
+        # Arrange
+        g: DirectedGraph = DirectedGraph([(0, 1, 3), (1, 2, 4)])
+        matrix: list = g.adj_matrix
+
+        # Act/Assert
+        with self.assertRaises(TypeError):
+            matrix[2][0] = 7
+        matrix.append([0, 0, 0])
+        self.assertEqual(3, len(g.adj_matrix))
+        self.assertFalse(g.has_cycle())
+
+    def test_huge_weight_graph_converts_to_csr_and_saves(self) -> None:
+        # Arrange
+        g: DirectedGraph = DirectedGraph([(0, 1, 1 << 70), (1, 2, 3)])
+
+        with tempfile.TemporaryDirectory() as directory:
+            path: str = os.path.join(directory, "graph.bin")
+
+            # Act
+            g.save(path)
+            g_loaded: DirectedGraph = DirectedGraph.load(path, mmap=False)
+            g.set_backend("csr")
+
+            # Assert
+            self.assertListEqual([(0, 1, 1 << 70), (1, 2, 3)], g.get_edges())
+            self.assertListEqual(g.get_edges(), g_loaded.get_edges())
+            self.assertEqual(1 << 70, g.dijkstra_many([0])[0][1])
+
+
 if __name__ == "__main__":
     unittest.main()
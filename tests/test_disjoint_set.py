@@ -0,0 +1,48 @@
+import unittest
+
+from disjoint_set import DisjointSet
+
+
+class TestDisjointSet(unittest.TestCase):
+    def test_add_creates_single_element_sets(self) -> None:
+        # Arrange
+        ds: DisjointSet = DisjointSet('AB')
+
+        # Act
+        ds.add('C')
+        ds.add('A')
+
+        # Assert
+        self.assertEqual(3, len(ds))
+        self.assertEqual(3, ds.count)
+        self.assertEqual('C', ds.find('C'))
+        self.assertTrue('B' in ds)
+        self.assertFalse('D' in ds)
+
+    def test_union_merges_sets(self) -> None:
+        # Arrange
+        ds: DisjointSet = DisjointSet('ABCDE')
+
+        # Act
+        merged_1: bool = ds.union('A', 'B')
+        merged_2: bool = ds.union('C', 'D')
+        merged_3: bool = ds.union('B', 'D')
+        merged_4: bool = ds.union('A', 'C')
+
+        # Assert
+        self.assertListEqual([True, True, True, False], [merged_1, merged_2, merged_3, merged_4])
+        self.assertEqual(2, ds.count)
+        self.assertTrue(ds.connected('A', 'D'))
+        self.assertFalse(ds.connected('A', 'E'))
+        self.assertEqual(ds.find('A'), ds.find('C'))
+
+    def test_find_raises_key_error_if_element_missing(self) -> None:
+        # Arrange
+        ds: DisjointSet = DisjointSet()
+
+        # Act/Assert
+        self.assertRaises(KeyError, ds.find, 'A')
+
+
+if __name__ == "__main__":
+    unittest.main()
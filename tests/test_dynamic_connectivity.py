@@ -0,0 +1,88 @@
+import random
+import unittest
+
+from disjoint_set import DisjointSet
+from dynamic_connectivity import DynamicConnectivity
+
+
+class TestDynamicConnectivity(unittest.TestCase):
+    def test_union_merges_components(self) -> None:
+        # Arrange
+        dc: DynamicConnectivity = DynamicConnectivity('ABCDE')
+
+        # Act
+        merged_1: bool = dc.union('A', 'B')
+        merged_2: bool = dc.union('C', 'D')
+        merged_3: bool = dc.union('B', 'D')
+        merged_4: bool = dc.union('A', 'C')
+
+        # Assert
+        self.assertListEqual([True, True, True, False], [merged_1, merged_2, merged_3, merged_4])
+        self.assertEqual(2, dc.count)
+        self.assertEqual(5, len(dc))
+        self.assertTrue(dc.connected('A', 'D'))
+        self.assertFalse(dc.connected('A', 'E'))
+        self.assertEqual(dc.find('A'), dc.find('C'))
+        self.assertEqual('E', dc.find('E'))
+
+    def test_remove_edge_finds_replacement_edge(self) -> None:
+        # Arrange
+        dc: DynamicConnectivity = DynamicConnectivity('ABCDE')
+        for x, y in ['AB', 'BC', 'CD', 'DA', 'DE']:
+            dc.union(x, y)
+
+        # Act/Assert
+        self.assertFalse(dc.remove_edge('A', 'B'))
+        self.assertTrue(dc.connected('A', 'B'))
+        self.assertEqual(1, dc.count)
+
+        self.assertTrue(dc.remove_edge('C', 'D'))
+        self.assertFalse(dc.connected('B', 'D'))
+        self.assertTrue(dc.connected('A', 'E'))
+        self.assertEqual(2, dc.count)
+        self.assertRaises(KeyError, dc.remove_edge, 'A', 'C')
+
+    def test_remove_drops_element_and_its_edges(self) -> None:
+        # Arrange
+        dc: DynamicConnectivity = DynamicConnectivity('ABC')
+        dc.union('A', 'B')
+        dc.union('B', 'C')
+
+        # Act
+        dc.remove('B')
+        dc.remove('B')
+
+        # Assert
+        self.assertEqual(2, dc.count)
+        self.assertFalse('B' in dc)
+        self.assertFalse(dc.connected('A', 'C'))
+        self.assertRaises(KeyError, dc.find, 'B')
+
+    def test_matches_disjoint_set_rebuilt_after_each_change(self) -> None:
+        # Arrange
+        rng: random.Random = random.Random(261)
+        n: int = 30
+        dc: DynamicConnectivity = DynamicConnectivity(range(n))
+        edges: set = set()
+
+        for _ in range(1000):
+            # Act
+            u, v = sorted(rng.sample(range(n), 2))
+            if (u, v) in edges:
+                edges.remove((u, v))
+                dc.remove_edge(u, v)
+            else:
+                edges.add((u, v))
+                dc.union(u, v)
+
+            # Assert
+            ds: DisjointSet = DisjointSet(range(n))
+            for x, y in edges:
+                ds.union(x, y)
+            self.assertEqual(ds.count, dc.count)
+            for x in range(n):
+                self.assertEqual(ds.connected(0, x), dc.connected(0, x))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+import io
+import os
+import tempfile
+import unittest
+
+from d_graph import DirectedGraph
+from edge_list import load_edge_list
+from ud_graph import UndirectedGraph
+
+
+class TestEdgeList(unittest.TestCase):
+    def test_load_edge_list_directed_example_1(self) -> None:
+        # Arrange
+        text: bytes = b"# src dst weight\n0 1 10\n4 0 12\n\n1 4 15\n4 3 3\n3 1 5\n2 1\n3 3 7\n0 1 2\n3 2 1.5\n"
+        g: DirectedGraph = DirectedGraph.from_edges([], backend="sparse")
+        calls: list = list()
+
+        # Act
+        count: int = load_edge_list(g, io.BytesIO(text), chunk_size=16, progress=lambda *args: calls.append(args))
+
+        # Assert
+        self.assertEqual(9, count)
+        self.assertListEqual([(0, 1, 2), (1, 4, 15), (2, 1, 1), (3, 1, 5), (3, 2, 1.5), (4, 0, 12), (4, 3, 3)],
+                             g.get_edges())
+        self.assertEqual(5, g.vertex_count)
+        self.assertGreater(len(calls), 1)
+        self.assertEqual((len(text), 9), calls[-1])
+
+    def test_load_edge_list_undirected_from_csv_path(self) -> None:
+        # Arrange
+        g: UndirectedGraph = UndirectedGraph()
+
+        with tempfile.TemporaryDirectory() as directory:
+            path: str = os.path.join(directory, "edges.csv")
+            with open(path, "w", encoding="utf-8") as fp:
+                fp.write("A, B\nB, C\nC, A\nB, A\nD, D\nZürich, A\n")
+
+            # Act
+            count: int = load_edge_list(g, path, delimiter=",")
+
+        # Assert
+        self.assertEqual(6, count)
+        self.assertListEqual(['A', 'B', 'C', 'Zürich'], g.get_vertices())
+        self.assertEqual(4, g.edge_count)
+
+    def test_load_edge_list_raises_on_invalid_edges_unless_skipped(self) -> None:
+        # Arrange
+        test_cases: list = [b"0 1\n1 1\n", b"0 1\n1 0\n0 1\n", b"0 1 0\n", b"0 1 2 3\n", b"0 x\n", b"-1 0\n"]
+
+        for text in test_cases:
+            # Act/Assert
+            with self.assertRaises(ValueError):
+                load_edge_list(DirectedGraph(), io.BytesIO(text), skip_invalid=False)
+
+        with self.assertRaisesRegex(ValueError, "line 3"):
+            load_edge_list(UndirectedGraph(), io.StringIO("A B\nB C\nC B\n"), skip_invalid=False)
+
+        g: UndirectedGraph = UndirectedGraph()
+        load_edge_list(g, io.StringIO("A B\nB C\nC B\nC C\n"))
+        self.assertEqual(2, g.edge_count)
+
+    def test_load_edge_list_widens_integer_weights_beyond_64_bits(self) -> None:
+        # Arrange
+        g: DirectedGraph = DirectedGraph()
+
+        # Act
+        load_edge_list(g, io.BytesIO(b"0 1 5\n1 2 100000000000000000000000\n"))
+
+        # Assert
+        self.assertListEqual([(0, 1, 5), (1, 2, 1e23)], g.get_edges())
+        with self.assertRaisesRegex(ValueError, "line 2"):
+            load_edge_list(DirectedGraph(), io.BytesIO(b"0 1\n0 9223372036854775808\n"))
+
+
+if __name__ == "__main__":
+    unittest.main()
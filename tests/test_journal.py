@@ -0,0 +1,144 @@
+import copy
+import os
+import pickle
+import tempfile
+import unittest
+
+from d_graph import DirectedGraph
+from journal import Journal
+from ud_graph import UndirectedGraph
+
+
+class TestJournal(unittest.TestCase):
+    def test_recover_replays_log(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            # Arrange
+            journal: Journal = Journal(directory, sync_every=2)
+            g: UndirectedGraph = journal.recover(UndirectedGraph)
+            g.add_edges(edge for edge in ['AB', 'BC', 'CD'])
+            g.add_vertex('E')
+            g.remove_edge('B', 'C')
+            g.add_edge('A', 'A')
+            journal.close()
+
+            # Act
+            journal = Journal(directory)
+            g_recovered: UndirectedGraph = journal.recover(UndirectedGraph)
+            journal.close()
+
+            # Assert
+            self.assertEqual(str(g), str(g_recovered))
+            self.assertIsNone(g._journal)
+
+    def test_recover_loads_snapshot_and_log_tail(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            # Arrange
+            journal: Journal = Journal(directory)
+            g: DirectedGraph = journal.recover(DirectedGraph)
+            g.set_backend("sparse")
+            for _ in range(5):
+                g.add_vertex()
+            g.add_edges([(0, 1, 10), (1, 2, 3), (2, 0, 4), (3, 4, 1.5)])
+            g.remove_vertex(3)
+            journal.snapshot()
+            g.add_edge(4, 0, 6)
+            g.remove_edge(1, 2)
+            journal.close()
+
+            # Act
+            journal = Journal(directory)
+            g_recovered: DirectedGraph = journal.recover(DirectedGraph)
+
+            # Assert
+            self.assertListEqual(['log.00000001', 'manifest.json', 'snapshot.00000001'], sorted(os.listdir(directory)))
+            self.assertEqual("sparse", g_recovered.backend)
+            self.assertListEqual(g.get_edges(), g_recovered.get_edges())
+            self.assertListEqual(g.get_vertices(), g_recovered.get_vertices())
+            self.assertRaises(ValueError, Journal(directory).recover, UndirectedGraph)
+
+            g_recovered.add_vertex()
+            journal.close()
+            journal = Journal(directory)
+            self.assertEqual(6, journal.recover(DirectedGraph).v_count)
+            journal.close()
+
+    def test_recover_drops_partly_written_last_record(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            # Arrange
+            journal: Journal = Journal(directory)
+            g: UndirectedGraph = journal.recover(UndirectedGraph)
+            g.add_edge('A', 'B')
+            journal.close()
+            with open(os.path.join(directory, "log.00000000"), "ab") as fp:
+                fp.write(b'["add_edge",["B"')
+
+            # Act
+            journal = Journal(directory)
+            g_recovered: UndirectedGraph = journal.recover(UndirectedGraph)
+            g_recovered.add_edge('B', 'C')
+            journal.close()
+
+            journal = Journal(directory)
+            g_recovered = journal.recover(UndirectedGraph)
+            journal.close()
+
+            # Assert
+            self.assertListEqual([('A', 'B'), ('B', 'C')], sorted(g_recovered.get_edges()))
+
+    def test_journal_passes_arguments_unchanged(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            # Arrange
+            journal: Journal = Journal(directory)
+            g: UndirectedGraph = journal.recover(UndirectedGraph)
+
+            # Act
+            g.add_edge(('A', 1), ('B', 2))
+            g.add_vertices(v for v in 'CD')
+            journal.close()
+
+            # Assert
+            self.assertTrue(g.are_adjacent(('A', 1), ('B', 2)))
+            self.assertEqual(4, g.vertex_count)
+
+    def test_snapshot_rejects_non_string_names_without_rotating(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            # Arrange
+            journal: Journal = Journal(directory)
+            g: UndirectedGraph = journal.recover(UndirectedGraph)
+            g.add_edge(1, 2)
+
+            # Act/Assert
+            with self.assertRaises(TypeError):
+                journal.snapshot()
+            g.add_edge(2, 3)
+            journal.close()
+
+            journal = Journal(directory)
+            g_recovered: UndirectedGraph = journal.recover(UndirectedGraph)
+            journal.close()
+            self.assertListEqual(["log.00000000"], sorted(os.listdir(directory)))
+            self.assertListEqual([(1, 2), (2, 3)], sorted(g_recovered.get_edges()))
+
+    def test_journaled_graphs_pickle_without_journal(self) -> None:
+        for graph_class, edges in [(UndirectedGraph, [('A', 'B')]), (DirectedGraph, [(0, 1, 3)])]:
+            with tempfile.TemporaryDirectory() as directory:
+                # Arrange
+                journal: Journal = Journal(directory)
+                g = journal.recover(graph_class)
+                if graph_class is DirectedGraph:
+                    g.add_vertices(2)
+                g.add_edges(edges)
+
+                # Act
+                g_copy = pickle.loads(pickle.dumps(g))
+                g_deep_copy = copy.deepcopy(g)
+                journal.close()
+
+                # Assert
+                self.assertEqual(str(g), str(g_copy))
+                self.assertEqual(str(g), str(g_deep_copy))
+                self.assertIsNone(g_copy._journal)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+import unittest
+
+from traversal import bidirectional_path, breadth_first, depth_first, level_bfs
+
+
+class TestTraversal(unittest.TestCase):
+    def setUp(self) -> None:
+        self.adj: dict = {
+            'A': ['B', 'C'],
+            'B': ['A', 'D', 'E'],
+            'C': ['A', 'E'],
+            'D': ['B'],
+            'E': ['B', 'C', 'F'],
+            'F': ['E']
+        }
+
+    def test_depth_first_yields_depth_and_parent(self) -> None:
+        # Arrange
+        exp: list = [('A', 0, None), ('B', 1, 'A'), ('D', 2, 'B'), ('E', 2, 'B'), ('C', 3, 'E'), ('F', 3, 'E')]
+
+        # Act
+        visited: list = list(depth_first('A', self.adj.get))
+
+        # Assert
+        self.assertListEqual(exp, visited)
+
+    def test_breadth_first_yields_depth_and_parent(self) -> None:
+        # Arrange
+        exp: list = [('A', 0, None), ('B', 1, 'A'), ('C', 1, 'A'), ('D', 2, 'B'), ('E', 2, 'B'), ('F', 3, 'E')]
+
+        # Act
+        visited: list = list(breadth_first('A', self.adj.get))
+
+        # Assert
+        self.assertListEqual(exp, visited)
+
+    def test_max_depth_limits_traversal(self) -> None:
+        # Arrange
+        exp: list = ['A', 'B', 'C']
+
+        # Act
+        dfs: list = [v for v, _, _ in depth_first('A', self.adj.get, max_depth=1)]
+        bfs: list = [v for v, _, _ in breadth_first('A', self.adj.get, max_depth=1)]
+        dfs_0: list = [v for v, _, _ in depth_first('A', self.adj.get, max_depth=0)]
+
+        # Assert
+        self.assertListEqual(exp, dfs)
+        self.assertListEqual(exp, bfs)
+        self.assertListEqual(['A'], dfs_0)
+
+    def test_prune_stops_search_past_vertex(self) -> None:
+        # Arrange
+        exp_dfs: list = ['A', 'B', 'C', 'E', 'F']
+        exp_bfs: list = ['A', 'B', 'C', 'E', 'F']
+
+        def prune(v: str, _: int) -> bool:
+            return v == 'B'
+
+        # Act
+        dfs: list = [v for v, _, _ in depth_first('A', self.adj.get, prune=prune)]
+        bfs: list = [v for v, _, _ in breadth_first('A', self.adj.get, prune=prune)]
+
+        # Assert
+        self.assertListEqual(exp_dfs, dfs)
+        self.assertListEqual(exp_bfs, bfs)
+
+    def test_traversal_is_lazy(self) -> None:
+        # Arrange
+        calls: list = list()
+
+        def neighbors(v: str) -> list:
+            calls.append(v)
+            return self.adj[v]
+
+        # Act
+        dfs = depth_first('A', neighbors)
+        first: tuple = next(dfs)
+
+        # Assert
+        self.assertTupleEqual(('A', 0, None), first)
+        self.assertListEqual([], calls)
+
+
+    def test_bidirectional_path_finds_shortest_path(self) -> None:
+        # Arrange
+        self.adj['G'] = []
+
+        # Act/Assert
+        self.assertListEqual(['A', 'B', 'E', 'F'], bidirectional_path('A', 'F', self.adj.get))
+        self.assertListEqual(['F', 'E', 'B'], bidirectional_path('F', 'B', self.adj.get))
+        self.assertListEqual(['D'], bidirectional_path('D', 'D', self.adj.get))
+        self.assertListEqual([], bidirectional_path('A', 'G', self.adj.get))
+
+    def test_level_bfs_matches_breadth_first_in_both_directions(self) -> None:
+        # Arrange
+        # A hub with many spokes makes the second level run bottom-up, and the long tail brings it back top-down.
+        out_edges: list = [list(range(1, 41))] + [[41] for _ in range(40)] + [[v + 1] for v in range(41, 99)] + [[]]
+        in_edges: list = [[] for _ in out_edges]
+        for v, v_edges in enumerate(out_edges):
+            for neighbor in v_edges:
+                in_edges[neighbor].append(v)
+        exp: list = [-1] * len(out_edges)
+        for v, depth, _ in breadth_first(0, out_edges.__getitem__):
+            exp[v] = depth
+
+        # Act
+        distances, parents = level_bfs([0], len(out_edges), out_edges.__getitem__, in_edges.__getitem__,
+                                       lambda v: len(out_edges[v]), sum(map(len, out_edges)))
+
+        # Assert
+        self.assertListEqual(exp, list(distances))
+        self.assertEqual(-1, parents[0])
+        self.assertEqual(1, parents[41])
+        self.assertEqual(98, parents[99])
+
+
+if __name__ == "__main__":
+    unittest.main()
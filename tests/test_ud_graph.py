@@ -1,6 +1,10 @@
+import io
+import os
+import tempfile
 import unittest
 
-from ud_graph import UndirectedGraph
+from d_graph import DirectedGraph
+from ud_graph import InternedUndirectedGraph, UndirectedGraph
 
 
 class TestUDGraph(unittest.TestCase):
@@ -380,5 +384,334 @@ class TestUDGraph(unittest.TestCase):
             self.assertEqual(exp, g.has_cycle())
 
 
+    def test_add_vertices_example_1(self) -> None:
+        # Arrange
+        exp: dict = {'A': ['B'], 'B': ['A'], 'C': [], 'D': []}
+        g: UndirectedGraph = UndirectedGraph(['AB'])
+
+        # Act
+        g.add_vertices('ABCD')
+
+        # Assert
+        self.assertDictEqual(exp, g.adj_list)
+
+    def test_add_edges_matches_add_edge(self) -> None:
+        # Arrange
+        edges: list = ['AB', 'AC', 'BC', 'BD', 'CD', 'CE', 'DE', ('B', 'C'), 'CA', 'EE', 'DE']
+        exp: dict = UndirectedGraph(edges).adj_list
+        g: UndirectedGraph = UndirectedGraph(['AB'])
+
+        # Act
+        g.add_edges(edges)
+
+        # Assert
+        self.assertDictEqual(exp, g.adj_list)
+
+    def test_from_edges_example_1(self) -> None:
+        # Arrange
+        edges: list = ['AB', 'AC', 'BC', 'BD', 'CD', 'CE', 'DE', 'BA', 'FF']
+        exp: dict = UndirectedGraph(edges).adj_list
+
+        # Act
+        g: UndirectedGraph = UndirectedGraph.from_edges(iter(edges))
+
+        # Assert
+        self.assertDictEqual(exp, g.adj_list)
+
+    def test_iter_dfs_yields_depth_and_parent(self) -> None:
+        # Arrange
+        exp: list = [('C', 0, None), ('A', 1, 'C'), ('E', 2, 'A'), ('B', 3, 'E'), ('D', 4, 'B'), ('H', 4, 'B')]
+        edges: list = ['AE', 'AC', 'BE', 'CE', 'CD', 'CB', 'BD', 'ED', 'BH', 'QG', 'FG']
+        g: UndirectedGraph = UndirectedGraph(edges)
+
+        # Act
+        dfs: list = list(g.iter_dfs('C'))
+        bfs: list = [v for v, _, _ in g.iter_bfs('C', prune=lambda v, _: v != 'C')]
+        missing: list = list(g.iter_bfs('Z'))
+
+        # Assert
+        self.assertListEqual(exp, dfs)
+        self.assertListEqual(['C', 'A', 'B', 'D', 'E'], bfs)
+        self.assertListEqual([], missing)
+
+    def test_neighbors_reflects_edge_changes(self) -> None:
+        # Arrange
+        g: UndirectedGraph = UndirectedGraph(['CB', 'CA', 'CE'])
+
+        # Act/Assert
+        self.assertListEqual(['A', 'B', 'E'], g.neighbors('C'))
+
+        g.add_edge('C', 'D')
+        self.assertListEqual(['A', 'B', 'D', 'E'], g.neighbors('C'))
+
+        g.remove_edge('A', 'C')
+        self.assertListEqual(['B', 'D', 'E'], g.neighbors('C'))
+
+        g.remove_vertex('E')
+        self.assertListEqual(['B', 'D'], g.neighbors('C'))
+        self.assertListEqual([], g.neighbors('Z'))
+
+    def test_neighbors_returns_copy(self) -> None:
+        # Arrange
+        g: UndirectedGraph = UndirectedGraph(['AB', 'AC'])
+
+        # Act
+        g.neighbors('A').append('Z')
+
+        # Assert
+        self.assertListEqual(['B', 'C'], g.neighbors('A'))
+
+    def test_adjacency_keeps_insertion_order(self) -> None:
+        # Arrange
+        g: UndirectedGraph = UndirectedGraph(['AC', 'AB', 'AD'])
+
+        # Act
+        g.remove_edge('A', 'B')
+        g.add_edge('A', 'B')
+
+        # Assert
+        self.assertEqual(['C', 'D', 'B'], g.adj_list['A'])
+        self.assertEqual("['C', 'D', 'B']", str(g.adj_list['A']))
+        self.assertTrue('B' in g.adj_list['A'])
+        self.assertEqual(3, len(g.adj_list['A']))
+
+    def test_connected_example_1(self) -> None:
+        # Arrange
+        g: UndirectedGraph = UndirectedGraph(['AB', 'BC', 'DE'])
+        g.add_vertex('F')
+
+        # Act/Assert
+        self.assertTrue(g.connected('A', 'C'))
+        self.assertTrue(g.connected('F', 'F'))
+        self.assertFalse(g.connected('A', 'D'))
+        self.assertFalse(g.connected('A', 'Z'))
+        self.assertEqual(3, g.count_connected_components())
+
+        g.add_edge('C', 'D')
+        self.assertTrue(g.connected('A', 'E'))
+        self.assertEqual(2, g.count_connected_components())
+
+        g.remove_edge('B', 'C')
+        self.assertFalse(g.connected('A', 'E'))
+        self.assertTrue(g.connected('C', 'E'))
+        self.assertEqual(3, g.count_connected_components())
+
+        g.remove_vertex('D')
+        g.add_edges(['AF', 'GH'])
+        self.assertTrue(g.connected('B', 'F'))
+        self.assertFalse(g.connected('C', 'E'))
+        self.assertEqual(4, g.count_connected_components())
+
+    def test_connected_follows_interleaved_removals(self) -> None:
+        # Arrange
+        g: UndirectedGraph = UndirectedGraph(['AB', 'BC', 'CA', 'CD', 'DE', 'EF', 'FD'])
+
+        # Act/Assert
+        self.assertEqual(1, g.count_connected_components())
+
+        g.remove_edge('A', 'B')
+        self.assertTrue(g.connected('A', 'B'))
+        g.remove_edge('C', 'D')
+        self.assertFalse(g.connected('A', 'F'))
+        self.assertEqual(2, g.count_connected_components())
+
+        g.add_edge('B', 'E')
+        g.remove_edge('D', 'E')
+        self.assertTrue(g.connected('A', 'D'))
+        self.assertEqual(1, g.count_connected_components())
+
+        g.remove_vertex('E')
+        self.assertFalse(g.connected('A', 'D'))
+        self.assertTrue(g.connected('D', 'F'))
+        self.assertEqual(2, g.count_connected_components())
+        self.assertEqual(g.component_id('A'), g.component_id('B'))
+
+    def test_component_id_example_1(self) -> None:
+        # Arrange
+        g: UndirectedGraph = UndirectedGraph(['AB', 'BC', 'DE'])
+
+        # Act/Assert
+        self.assertEqual(g.component_id('A'), g.component_id('C'))
+        self.assertNotEqual(g.component_id('A'), g.component_id('D'))
+        self.assertIn(g.component_id('E'), ['D', 'E'])
+        self.assertIsNone(g.component_id('Z'))
+
+    def test_find_cycle_returns_cycle_vertices(self) -> None:
+        # Arrange
+        g: UndirectedGraph = UndirectedGraph(['AB', 'BC', 'CD', 'DB', 'DE', 'XY'])
+
+        # Act
+        cycle: list = g.find_cycle()
+
+        # Assert
+        self.assertCountEqual(['B', 'C', 'D'], cycle)
+        self.assertTrue(g.is_valid_path(cycle + cycle[:1]))
+
+    def test_find_cycle_returns_empty_list_if_acyclic(self) -> None:
+        # Arrange
+        g: UndirectedGraph = UndirectedGraph.from_edges([(v, v + 1) for v in range(20000)])
+        g.add_edges([('A', 'B'), ('A', 'C'), ('X', 'Y')])
+
+        # Act/Assert
+        self.assertListEqual([], g.find_cycle())
+        self.assertFalse(g.has_cycle())
+
+    def test_interned_graph_matches_graph(self) -> None:
+        # Arrange
+        edges: list = ['AE', 'AC', 'BE', 'CE', 'CD', 'CB', 'BD', 'ED', 'BH', 'QG', 'FG', 'EA', 'KK']
+        g: UndirectedGraph = UndirectedGraph(edges)
+        g.add_vertex('Z')
+
+        # Act
+        g_interned: InternedUndirectedGraph = g.interned()
+
+        # Assert
+        self.assertListEqual(g.get_vertices(), g_interned.get_vertices())
+        self.assertCountEqual(g.get_edges(), g_interned.get_edges())
+        self.assertDictEqual({v: g.neighbors(v) for v in g.adj_list}, dict(g_interned.adj_list))
+        self.assertCountEqual(g.connected_components(), g_interned.connected_components())
+        self.assertEqual(g.count_connected_components(), g_interned.count_connected_components())
+        self.assertEqual(g.has_cycle(), g_interned.has_cycle())
+        self.assertTrue(g_interned.connected('A', 'H'))
+        self.assertFalse(g_interned.connected('A', 'Z'))
+        for v in g.get_vertices() + ['Y']:
+            self.assertEqual(g.degree(v), g_interned.degree(v))
+            self.assertListEqual(g.neighbors(v), g_interned.neighbors(v))
+            self.assertListEqual(g.dfs(v), g_interned.dfs(v))
+            self.assertListEqual(g.bfs(v), g_interned.bfs(v))
+            self.assertListEqual(list(g.iter_bfs(v, max_depth=1)), list(g_interned.iter_bfs(v, max_depth=1)))
+            for u in g.get_vertices():
+                self.assertEqual(g.are_adjacent(u, v), g_interned.are_adjacent(u, v))
+
+    def test_interned_graph_is_read_only(self) -> None:
+        # Arrange
+        g: InternedUndirectedGraph = InternedUndirectedGraph.from_edges(['AB', 'BC'])
+
+        # Act/Assert
+        self.assertRaises(TypeError, g.add_vertex, 'D')
+        self.assertRaises(TypeError, g.add_edge, 'A', 'C')
+        self.assertRaises(TypeError, g.remove_edge, 'A', 'B')
+        self.assertRaises(TypeError, g.remove_vertex, 'A')
+        self.assertEqual("GRAPH: {A: ['B'], B: ['A', 'C'], C: ['B']}", str(g))
+
+    def test_iter_edges_yields_each_edge_once(self) -> None:
+        # Arrange
+        exp: list = [('A', 'B'), ('A', 'C'), ('B', 'C'), ('B', 'D'), ('C', 'D'), ('C', 'E')]
+        g: UndirectedGraph = UndirectedGraph(['BA', 'AC', 'BC', 'DB', 'CD', 'CE'])
+
+        # Act
+        edge_iter = g.iter_edges()
+
+        # Assert
+        self.assertCountEqual(exp, list(edge_iter))
+        self.assertListEqual(exp, list(g.interned().iter_edges()))
+
+    def test_edge_count_follows_mutations(self) -> None:
+        # Arrange
+        g: UndirectedGraph = UndirectedGraph(['AB', 'AC', 'BC', 'BD', 'CD', 'CE', 'DE', 'BA'])
+
+        # Act/Assert
+        self.assertEqual(7, g.edge_count)
+        self.assertEqual(5, g.vertex_count)
+
+        g.add_edges(['AE', 'EA', 'FF', 'FG'])
+        self.assertEqual(9, g.edge_count)
+        self.assertEqual(7, g.vertex_count)
+
+        g.remove_edge('A', 'B')
+        g.remove_edge('A', 'B')
+        self.assertEqual(8, g.edge_count)
+
+        g.remove_vertex('C')
+        self.assertEqual(4, g.edge_count)
+        self.assertEqual(6, g.vertex_count)
+        self.assertEqual(4, g.interned().edge_count)
+
+    def test_shortest_path_example_1(self) -> None:
+        # Arrange
+        edges: list = ['AE', 'AC', 'BE', 'CE', 'CD', 'CB', 'BD', 'ED', 'BH', 'QG', 'FG']
+        g: UndirectedGraph = UndirectedGraph(edges)
+        test_cases: list = [('A', 'H', 3), ('H', 'A', 3), ('D', 'A', 2), ('B', 'B', 0), ('Q', 'F', 2)]
+
+        for g_test in [g, g.interned()]:
+            for u, v, exp_hops in test_cases:
+                # Act
+                path, hops = g_test.shortest_path(u, v)
+
+                # Assert
+                self.assertEqual(exp_hops, hops)
+                self.assertEqual(hops + 1, len(path))
+                self.assertEqual([u, v], [path[0], path[-1]])
+                self.assertTrue(g_test.is_valid_path(path))
+
+            self.assertEqual(([], float("inf")), g_test.shortest_path('A', 'Q'))
+            self.assertEqual(([], float("inf")), g_test.shortest_path('A', 'Z'))
+
+    def test_shortest_paths_follows_pair_order(self) -> None:
+        # Arrange
+        g: UndirectedGraph = UndirectedGraph(['AB', 'BC', 'CD', 'XY'])
+
+        # Act
+        paths: list = g.shortest_paths([('A', 'D'), ('D', 'B'), ('A', 'X')])
+
+        # Assert
+        self.assertListEqual([(['A', 'B', 'C', 'D'], 3), (['D', 'C', 'B'], 2), ([], float("inf"))], paths)
+
+
+    def test_save_and_load_example_1(self) -> None:
+        # Arrange
+        g: UndirectedGraph = UndirectedGraph(['AE', 'AC', 'BE', 'CE', 'CD', 'CB', 'BD', 'ED', 'BH', 'QG', 'FG'])
+        g.add_vertex('Zürich')
+
+        with tempfile.TemporaryDirectory() as directory:
+            path: str = os.path.join(directory, "graph.bin")
+
+            # Act
+            g.save(path)
+
+            for mmap in [True, False]:
+                g_loaded: InternedUndirectedGraph = UndirectedGraph.load(path, mmap=mmap)
+
+                # Assert
+                self.assertListEqual(g.get_vertices(), g_loaded.get_vertices())
+                self.assertListEqual(sorted(g.get_edges()), list(g_loaded.iter_edges()))
+                self.assertListEqual(g.bfs('A'), g_loaded.bfs('A'))
+                self.assertEqual(g.shortest_path('A', 'H')[1], g_loaded.shortest_path('A', 'H')[1])
+                self.assertTrue(g_loaded.are_adjacent('B', 'H'))
+                self.assertEqual(g.degree('B'), g_loaded.degree('B'))
+                self.assertRaises(ValueError, DirectedGraph.load, path)
+
+            del g_loaded
+
+    def test_write_exporters_apply_vertex_filter(self) -> None:
+        # Arrange
+        g: UndirectedGraph = UndirectedGraph(['AE', 'AC', 'BE', 'CE', 'CD'])
+
+        for graph in [g, g.interned()]:
+            edge_list, adjacency, dot = io.StringIO(), io.StringIO(), io.StringIO()
+
+            # Act
+            graph.write_edgelist(edge_list, vertices='ACE')
+            graph.write_adjacency(adjacency, vertices='ACE')
+            graph.write_dot(dot, vertices='AC')
+
+            # Assert
+            self.assertEqual("A C\nA E\nC E\n", edge_list.getvalue())
+            self.assertEqual("A: C E\nC: A E\nE: A C\n", adjacency.getvalue())
+            self.assertEqual('graph {\n  "A";\n  "C";\n  "A" -- "C";\n}\n', dot.getvalue())
+
+    def test_shortest_path_does_not_sort_neighbors(self) -> None:
+        # Arrange
+        g: UndirectedGraph = UndirectedGraph(['AB', 'BC', 'CD'] + [('A', str(i)) for i in range(100)])
+
+        # Act
+        path, hops = g.shortest_path('A', 'D')
+
+        # Assert
+        self.assertListEqual(['A', 'B', 'C', 'D'], path)
+        self.assertEqual(3, hops)
+        self.assertIsNone(g.adj_list['A']._sorted)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,210 @@
+# Course: CS261 - Data Structures
+# Author: Mohamed Al-Hussein
+# Assignment: 06
+# Description: Graph traversals shared by the directed and undirected graph implementations.
+
+from array import array
+from collections import deque
+
+# Thresholds of direction-optimizing BFS: a level runs bottom-up once the frontier's outgoing edges outnumber
+# 1 / _ALPHA of the edges left to explore, and top-down again once the frontier holds fewer than 1 / _BETA of the
+# vertices.
+_ALPHA: int = 14
+_BETA: int = 24
+
+
+def depth_first(v_start, neighbors, max_depth: int = None, prune=None):
+    """
+    Lazily yields (vertex, depth, parent) for every vertex reached by DFS from v_start.
+
+    neighbors(v) must return the neighbors of v in the order they should be picked. The start vertex has depth 0 and
+    parent None.
+
+    Vertices deeper than max_depth are not visited. If prune(vertex, depth) returns True, the vertex is still yielded
+    but the search does not continue past it.
+    """
+
+    visited: set = {v_start}
+    yield v_start, 0, None
+
+    if (max_depth is not None and max_depth <= 0) or (prune is not None and prune(v_start, 0)):
+        return
+
+    # Each frame holds a vertex, its depth and an iterator over its remaining neighbors, so the traversal visits
+    # vertices in the same order as a recursive DFS.
+    frames: list = [(v_start, 0, iter(neighbors(v_start)))]
+    while frames:
+        v, depth, v_neighbors = frames[-1]
+        for neighbor in v_neighbors:
+            if neighbor not in visited:
+                visited.add(neighbor)
+                yield neighbor, depth + 1, v
+
+                # Descend into the neighbor unless it is at the depth limit or pruned.
+                if (max_depth is None or depth + 1 < max_depth) and (prune is None or not prune(neighbor, depth + 1)):
+                    frames.append((neighbor, depth + 1, iter(neighbors(neighbor))))
+                    break
+        else:
+            frames.pop()
+
+
+def breadth_first(v_start, neighbors, max_depth: int = None, prune=None):
+    """
+    Lazily yields (vertex, depth, parent) for every vertex reached by BFS from v_start.
+
+    neighbors(v) must return the neighbors of v in the order they should be picked. The start vertex has depth 0 and
+    parent None.
+
+    Vertices deeper than max_depth are not visited. If prune(vertex, depth) returns True, the vertex is still yielded
+    but the search does not continue past it.
+    """
+
+    # Vertices are marked when queued, since the first time a vertex is queued decides when it is visited.
+    visited: set = {v_start}
+    vertices: deque = deque()
+    vertices.append((v_start, 0, None))
+
+    while vertices:
+        v, depth, parent = vertices.popleft()
+        yield v, depth, parent
+
+        if (max_depth is not None and depth >= max_depth) or (prune is not None and prune(v, depth)):
+            continue
+
+        for neighbor in neighbors(v):
+            if neighbor not in visited:
+                visited.add(neighbor)
+                vertices.append((neighbor, depth + 1, v))
+
+
+def level_bfs(sources, v_count: int, neighbors, in_neighbors, out_degree, edge_count: int,
+              max_depth: int = None) -> (array, array):
+    """
+    Returns the BFS distance of every vertex from the closest of the sources, along with its parent on a shortest
+    path, as two arrays indexed by vertex with -1 for vertices that weren't reached. Sources have distance 0 and
+    parent -1.
+
+    Vertices are the integers in range(v_count). neighbors(v) and in_neighbors(v) must return the outgoing and
+    incoming neighbors of v in ascending order, out_degree(v) the number of outgoing edges of v, and edge_count the
+    number of edges. Vertices deeper than max_depth are not reached.
+
+    The search expands one whole level at a time. A level runs top-down, scanning the outgoing edges of the frontier,
+    while the frontier is small, and bottom-up, scanning the incoming edges of the unreached vertices until one of
+    them leads back to the frontier, once the frontier holds a large share of the remaining edges. Either way the
+    parent of a vertex is its smallest incoming neighbor on the level before it.
+    """
+
+    distances: array = array("q", [-1]) * v_count
+    parents: array = array("q", [-1]) * v_count
+
+    frontier: list = sorted(set(sources))
+    for v in frontier:
+        distances[v] = 0
+
+    frontier_edges: int = sum(map(out_degree, frontier))
+    remaining_edges: int = edge_count - frontier_edges
+    unreached: list = None
+    bottom_up: bool = False
+    depth: int = 0
+
+    while frontier and (max_depth is None or depth < max_depth):
+        depth += 1
+        if bottom_up:
+            bottom_up = len(frontier) * _BETA >= v_count
+        else:
+            bottom_up = frontier_edges * _ALPHA > remaining_edges
+
+        next_frontier: list = list()
+        if bottom_up:
+            # Vertices of the frontier are exactly those at the previous depth.
+            unreached = [v for v in (range(v_count) if unreached is None else unreached) if distances[v] < 0]
+            for v in unreached:
+                for u in in_neighbors(v):
+                    if distances[u] == depth - 1:
+                        distances[v] = depth
+                        parents[v] = u
+                        next_frontier.append(v)
+                        break
+        else:
+            # Scanning the frontier in ascending order lets the smallest parent claim each vertex first.
+            for v in frontier:
+                for neighbor in neighbors(v):
+                    if distances[neighbor] < 0:
+                        distances[neighbor] = depth
+                        parents[neighbor] = v
+                        next_frontier.append(neighbor)
+            next_frontier.sort()
+
+        frontier = next_frontier
+        frontier_edges = sum(map(out_degree, frontier))
+        remaining_edges -= frontier_edges
+
+    return distances, parents
+
+
+def bidirectional_path(v_start, v_end, neighbors) -> []:
+    """
+    Returns the vertices of a shortest path from v_start to v_end in an unweighted graph, or an empty list if v_end
+    can't be reached.
+
+    neighbors(v) must return the neighbors of v, and every edge must be readable from both ends. Searches from both
+    ends one level at a time, always growing the smaller frontier, so only the neighborhood of the two vertices is
+    explored.
+    """
+
+    if v_start == v_end:
+        return [v_start]
+
+    # Each side maps the vertices it reached to their parent and their distance from its own end.
+    reached_start: dict = {v_start: (None, 0)}
+    reached_end: dict = {v_end: (None, 0)}
+    frontier_start: list = [v_start]
+    frontier_end: list = [v_end]
+
+    while frontier_start and frontier_end:
+        if len(frontier_start) <= len(frontier_end):
+            frontier, reached, other = frontier_start, reached_start, reached_end
+        else:
+            frontier, reached, other = frontier_end, reached_end, reached_start
+
+        # Finish the whole level before stopping, keeping the shortest of the paths that meet the other side.
+        best: tuple = None
+        next_frontier: list = list()
+        for v in frontier:
+            depth: int = reached[v][1] + 1
+            for neighbor in neighbors(v):
+                if neighbor in other:
+                    if best is None or depth + other[neighbor][1] < best[0]:
+                        best = (depth + other[neighbor][1], v, neighbor)
+                elif neighbor not in reached:
+                    reached[neighbor] = (v, depth)
+                    next_frontier.append(neighbor)
+
+        if best is not None:
+            _, v, neighbor = best
+            if reached is reached_end:
+                v, neighbor = neighbor, v
+
+            # Walk parents back to v_start on one side and forward to v_end on the other.
+            path: list = _parent_chain(v, reached_start)
+            path.reverse()
+            path.extend(_parent_chain(neighbor, reached_end))
+            return path
+
+        if frontier is frontier_start:
+            frontier_start = next_frontier
+        else:
+            frontier_end = next_frontier
+
+    return []
+
+
+def _parent_chain(v, reached: dict) -> []:
+    """Returns v followed by its parents in reached, up to the end its search started from."""
+
+    chain: list = list()
+    while v is not None:
+        chain.append(v)
+        v = reached[v][0]
+
+    return chain
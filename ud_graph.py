@@ -3,7 +3,17 @@
 # Assignment: 06
 # Description: Undirected graph implementation
 
-from collections import deque
+from array import array
+from collections.abc import Mapping
+from itertools import chain
+import bisect
+
+from disjoint_set import DisjointSet
+from dynamic_connectivity import DynamicConnectivity
+from export import dot_id, vertex_subset, write_lines
+from graph_file import UNDIRECTED, read_arrays, write_arrays
+from journal import Journal, journaled
+from traversal import bidirectional_path, breadth_first, depth_first
 
 
 class UndirectedGraph:
@@ -15,6 +25,18 @@ class UndirectedGraph:
     - vertex names are strings
     """
 
+    # Number of edges in the graph, kept up to date by every method that adds or removes edges.
+    _edge_count: int = 0
+
+    # Index of the connected components, built on the first connectivity query and kept up to date from then on.
+    # Graphs that only grow use a DisjointSet. After the first removal the index is rebuilt as a DynamicConnectivity,
+    # which also handles removals, and _dynamic stays set.
+    _components: DisjointSet = None
+    _dynamic: bool = False
+
+    # Journal that records every change to the graph, if the graph was opened through one.
+    _journal: Journal = None
+
     def __init__(self, start_edges=None):
         """
         Store graph info as adjacency list
@@ -40,6 +62,69 @@ class UndirectedGraph:
             return f'GRAPH: {{{out}}}'
         return f'GRAPH: {{\n  {out}}}'
 
+    def __getstate__(self) -> dict:
+        """Pickle the graph without its journal, which stays with the process that opened it."""
+
+        state: dict = dict(self.__dict__)
+        state.pop("_journal", None)
+
+        return state
+
+    @classmethod
+    def from_edges(cls, edges) -> "UndirectedGraph":
+        """
+        Return a new graph holding the given (u, v) edges.
+
+        Produces the same graph as the constructor, but checks for duplicate edges in bulk.
+        """
+
+        ud_graph: UndirectedGraph = cls()
+        ud_graph.add_edges(edges)
+
+        return ud_graph
+
+    def interned(self) -> "InternedUndirectedGraph":
+        """Return a read-only copy of the graph that stores vertices as dense integer ids."""
+
+        return InternedUndirectedGraph.from_edges(self.get_edges(), vertices=self.adj_list)
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> "InternedUndirectedGraph":
+        """
+        Return a read-only interned graph read from a file written by save().
+
+        If mmap is True, the adjacency arrays are memory-mapped rather than read, so processes that load the same file
+        share its pages. Only the vertex names are decoded up front. Raises ValueError if the file does not hold an
+        undirected graph.
+        """
+
+        return InternedUndirectedGraph.load(path, mmap)
+
+    def save(self, path: str) -> None:
+        """
+        Write the graph to path in the binary graph file format, as the compressed adjacency arrays and vertex names
+        of its interned copy.
+        """
+
+        self.interned().save(path)
+
+    @classmethod
+    def _from_snapshot(cls, path: str, metadata: dict) -> "UndirectedGraph":
+        """Return a graph rebuilt from a snapshot written by _snapshot()."""
+
+        snapshot: InternedUndirectedGraph = InternedUndirectedGraph.load(path, mmap=False)
+        ud_graph: UndirectedGraph = cls.from_edges(snapshot.iter_edges())
+        ud_graph.add_vertices(snapshot.get_vertices())
+
+        return ud_graph
+
+    def _snapshot(self, path: str) -> dict:
+        """Save the graph to path for a journal, and return the metadata needed to rebuild it."""
+
+        self.save(path)
+        return dict()
+
+    @journaled
     def add_vertex(self, v: str) -> None:
         """
         Add new vertex to the graph.
@@ -47,8 +132,23 @@ class UndirectedGraph:
         If vertex with same name already exists, does nothing and returns to caller.
         """
 
-        self.adj_list.setdefault(v, list())
+        if v not in self.adj_list:
+            self.adj_list[v] = _Neighbors()
+            if self._components is not None:
+                self._components.add(v)
 
+    @journaled(iterable="vertices")
+    def add_vertices(self, vertices) -> None:
+        """
+        Add all given vertices to the graph.
+
+        Vertices that already exist are left untouched.
+        """
+
+        for v in vertices:
+            self.add_vertex(v)
+
+    @journaled
     def remove_vertex(self, v: str) -> None:
         """
         Remove vertex and all connected edges.
@@ -56,13 +156,22 @@ class UndirectedGraph:
         If vertex does not exist, does nothing and returns to caller.
         """
 
+        if v not in self.adj_list:
+            return
+
         # Remove vertex from adjacency list.
-        v_edges: list = self.adj_list.pop(v, list())
+        v_edges: _Neighbors = self.adj_list.pop(v)
+        if self._dynamic and self._components is not None:
+            self._components.remove(v)
+        else:
+            self._drop_components()
 
         # Remove all edges incident to vertex.
         for edge in v_edges:
             self.adj_list[edge].remove(v)
+        self._edge_count -= len(v_edges)
 
+    @journaled
     def add_edge(self, u: str, v: str) -> None:
         """
         Add edge to the graph between vertices u and v.
@@ -80,7 +189,43 @@ class UndirectedGraph:
             if not self.are_adjacent(u, v):
                 self.adj_list[u].append(v)
                 self.adj_list[v].append(u)
+                self._edge_count += 1
+                if self._components is not None:
+                    self._components.union(u, v)
+
+    @journaled(iterable="edges")
+    def add_edges(self, edges) -> None:
+        """
+        Add all given (u, v) edges to the graph in one batch.
 
+        Follows the same rules as add_edge(): missing vertices are created, while loops and edges that already exist
+        are skipped.
+        """
+
+        adj_list: dict = self.adj_list
+
+        for u, v in edges:
+            if u == v:
+                continue
+
+            u_edges: _Neighbors = adj_list.get(u)
+            if u_edges is None:
+                self.add_vertex(u)
+                u_edges = adj_list[u]
+            v_edges: _Neighbors = adj_list.get(v)
+            if v_edges is None:
+                self.add_vertex(v)
+                v_edges = adj_list[v]
+
+            # Add edge if vertices are not adjacent.
+            if v not in u_edges:
+                u_edges.append(v)
+                v_edges.append(u)
+                self._edge_count += 1
+                if self._components is not None:
+                    self._components.union(u, v)
+
+    @journaled
     def remove_edge(self, u: str, v: str) -> None:
         """
         Remove edge from the graph that is incident to vertices u and v.
@@ -91,6 +236,11 @@ class UndirectedGraph:
         if u != v and self.are_adjacent(u, v):
             self.adj_list[u].remove(v)
             self.adj_list[v].remove(u)
+            self._edge_count -= 1
+            if self._dynamic and self._components is not None:
+                self._components.remove_edge(u, v)
+            else:
+                self._drop_components()
 
     def get_vertices(self) -> []:
         """Return list of vertices in the graph in lexicographic order."""
@@ -99,27 +249,37 @@ class UndirectedGraph:
 
     def get_edges(self) -> []:
         """
-        Return list of edges in the graph in lexicographic order.
+        Return list of edges in the graph.
 
-        Edges are returned as tuples of vertex endpoints.
+        Edges are returned as tuples of vertex endpoints, with the lexicographically smaller endpoint first.
         """
 
-        edges: set = set()
+        return list(self.iter_edges())
 
-        # Iterate through all vertices.
-        for v in self.get_vertices():
-            v_edges: list = list()
+    def iter_edges(self):
+        """
+        Lazily yield every edge in the graph exactly once.
+
+        Edges are yielded as tuples of vertex endpoints, with the lexicographically smaller endpoint first.
+        """
+
+        for u, u_edges in self.adj_list.items():
+            for v in u_edges:
+                # Each edge is stored at both endpoints, so only yield it from the smaller one.
+                if u < v:
+                    yield u, v
 
-            # Add each vertex pair to edges.
-            for u in self.adj_list[v]:
+    @property
+    def vertex_count(self) -> int:
+        """Number of vertices in the graph."""
 
-                # Only add vertex pair if it is unique (i.e. (u, v) != (v, u)).
-                if (u, v) not in edges:
-                    v_edges.append((v, u))
+        return len(self.adj_list)
 
-            edges.update(v_edges)
+    @property
+    def edge_count(self) -> int:
+        """Number of edges in the graph, kept up to date as edges are added and removed."""
 
-        return list(edges)
+        return self._edge_count
 
     def is_valid_path(self, path: []) -> bool:
         """
@@ -148,6 +308,27 @@ class UndirectedGraph:
 
         return True
 
+    def shortest_path(self, u: str, v: str) -> ([], int):
+        """
+        Return the vertices of a shortest path from vertex u to vertex v, along with its number of edges.
+
+        If v is not reachable from u, or either vertex does not exist, returns an empty path and infinity. Searches
+        from both vertices at once, growing the smaller frontier first. Neighbors are read straight from their hashed
+        sets without sorting, so when several shortest paths exist, which one is returned depends on the order edges
+        were added.
+        """
+
+        if u not in self.adj_list or v not in self.adj_list:
+            return list(), float("inf")
+
+        path: list = bidirectional_path(u, v, self.adj_list.__getitem__)
+        return (path, len(path) - 1) if path else (path, float("inf"))
+
+    def shortest_paths(self, pairs) -> []:
+        """Return a list holding the result of shortest_path(u, v) for each (u, v) pair, in the same order."""
+
+        return [self.shortest_path(u, v) for u, v in pairs]
+
     def dfs(self, v_start: str, v_end: str = None) -> []:
         """
         Return list of vertices visited during DFS search from v_start vertex up to optional v_end vertex.
@@ -169,22 +350,10 @@ class UndirectedGraph:
             v_end = None
 
         # Traverse graph until we either reach v_end or traverse every vertex.
-        vertices: deque = deque()
-        vertices.appendleft(v_start)
-        while len(vertices) > 0:
-            v: str = vertices.popleft()
-            if v not in visited:
-                # Add vertex to visited vertices.
-                visited.append(v)
-
-                # Stop if vertex is equal to v_end.
-                if v == v_end:
-                    break
-
-                # Add all neighbors of vertex in descending lexicographic order so that they are popped in ascending
-                # lexicographic order.
-                for neighbor in reversed(self.neighbors(v)):
-                    vertices.appendleft(neighbor)
+        for v, _, _ in self.iter_dfs(v_start):
+            visited.append(v)
+            if v == v_end:
+                break
 
         return visited
 
@@ -209,70 +378,125 @@ class UndirectedGraph:
             v_end = None
 
         # Traverse graph until we either reach v_end or traverse every vertex.
-        vertices: deque = deque()
-        vertices.appendleft(v_start)
-        while len(vertices) > 0:
-            v: str = vertices.pop()
-            if v not in visited:
-                # Add vertex to visited vertices.
-                visited.append(v)
-
-                # Stop if vertex is equal to v_end.
-                if v == v_end:
-                    break
-
-                # Add all neighbors of vertex in ascending lexicographic order.
-                for neighbor in self.neighbors(v):
-                    vertices.appendleft(neighbor)
+        for v, _, _ in self.iter_bfs(v_start):
+            visited.append(v)
+            if v == v_end:
+                break
 
         return visited
 
+    def iter_dfs(self, v_start: str, max_depth: int = None, prune=None):
+        """
+        Lazily yield (vertex, depth, parent) for every vertex visited during DFS search from v_start vertex.
+
+        If v_start is not in the graph, yields nothing.
+        Vertices deeper than the optional max_depth are not visited. If the optional prune(vertex, depth) callback
+        returns True, the search does not continue past that vertex.
+
+        Vertices are picked in ascending lexicographical order.
+        """
+
+        if v_start not in self.adj_list:
+            return iter(())
+
+        return depth_first(v_start, self._sorted_neighbors, max_depth, prune)
+
+    def iter_bfs(self, v_start: str, max_depth: int = None, prune=None):
+        """
+        Lazily yield (vertex, depth, parent) for every vertex visited during BFS search from v_start vertex.
+
+        If v_start is not in the graph, yields nothing.
+        Vertices deeper than the optional max_depth are not visited. If the optional prune(vertex, depth) callback
+        returns True, the search does not continue past that vertex.
+
+        Vertices are picked in ascending lexicographical order.
+        """
+
+        if v_start not in self.adj_list:
+            return iter(())
+
+        return breadth_first(v_start, self._sorted_neighbors, max_depth, prune)
+
     def count_connected_components(self) -> int:
         """Return number of connected components in the graph."""
 
-        return len(self.connected_components())
+        return self._connectivity().count
 
-    def has_cycle(self):
-        """Return True if graph contains a cycle."""
+    def connected(self, u: str, v: str) -> bool:
+        """
+        Return True if there is a path between vertices u and v.
+
+        If either vertex does not exist, returns False.
+        """
+
+        if u not in self.adj_list or v not in self.adj_list:
+            return False
 
-        # Iterate through all components in graph.
-        components: list = self.connected_components()
-        for component in components:
+        return self._connectivity().connected(u, v)
 
-            # Perform DFS on each component, searching for any cycles.
-            v_start: str = component.pop()
-            visited: list = list()
+    def component_id(self, v: str) -> str:
+        """
+        Return the representative vertex of the connected component containing vertex v.
+
+        Two vertices have the same representative exactly when they are connected. Representatives may change when
+        the graph changes. If vertex does not exist, returns None.
+        """
+
+        if v not in self.adj_list:
+            return None
 
-            # Traverse all vertices in graph.
-            vertices: deque = deque()
-            vertices.appendleft(v_start)
-            while len(vertices) > 0:
-                v: str = vertices.popleft()
-                if v not in visited:
-                    # Add vertex to visited vertices.
-                    visited.append(v)
+        return self._connectivity().find(v)
+
+    def has_cycle(self):
+        """Return True if graph contains a cycle."""
 
-                    # Add all neighbors of vertex in descending lexicographic order so that they are popped in ascending
-                    # lexicographic order.
-                    for neighbor in reversed(self.neighbors(v)):
+        return len(self.find_cycle()) > 0
 
-                        # If neighbor already in vertices stack, then there's a cycle involving that neighbor.
-                        if neighbor in vertices:
-                            return True
+    def find_cycle(self) -> []:
+        """
+        Return the vertices of a cycle in the graph, in path order, or an empty list if the graph is acyclic.
 
-                        vertices.appendleft(neighbor)
+        The last vertex in the list is adjacent to the first one. Uses a DFS that tracks the parent of each vertex and
+        stops at the first edge leading back to a vertex on the current path.
+        """
 
-        return False
+        # Vertices on the current DFS path map to their position in it. Finished vertices stay in visited only.
+        visited: set = set()
+        on_path: dict = dict()
+
+        for v_start in self.adj_list:
+            if v_start in visited:
+                continue
+
+            visited.add(v_start)
+            on_path[v_start] = 0
+            path: list = [v_start]
+            frames: list = [iter(self.adj_list[v_start])]
+            while frames:
+                v: str = path[-1]
+                parent: str = path[-2] if len(path) > 1 else None
+                for neighbor in frames[-1]:
+                    if neighbor not in visited:
+                        visited.add(neighbor)
+                        on_path[neighbor] = len(path)
+                        path.append(neighbor)
+                        frames.append(iter(self.adj_list[neighbor]))
+                        break
+                    elif neighbor != parent and neighbor in on_path:
+                        # Any other edge to a vertex on the current path closes a cycle.
+                        return path[on_path[neighbor]:]
+                else:
+                    del on_path[path.pop()]
+                    frames.pop()
+
+        return []
 
     def are_adjacent(self, u: str, v: str) -> bool:
         """Returns True if two vertices u and v are joined by an edge."""
 
-        # Retrieve edges incident to vertices u and v.
-        u_edges: list = self.adj_list.get(u, list())
-        v_edges: list = self.adj_list.get(v, list())
-
-        # Search for neighboring vertex inside shortest edge list to maintain O(min(deg(u), deg(v))) running time.
-        return v in u_edges if self.degree(u) < self.degree(v) else u in v_edges
+        # Neighbors are hashed, so a single lookup is enough.
+        u_edges: _Neighbors = self.adj_list.get(u)
+        return u_edges is not None and v in u_edges
 
     def degree(self, v: str) -> int:
         """
@@ -281,12 +505,12 @@ class UndirectedGraph:
         Returns -1 if vertex does not exist.
         """
 
-        return len(self.adj_list.get(v, list())) if v in self.adj_list else -1
+        return len(self.adj_list[v]) if v in self.adj_list else -1
 
     def neighbors(self, v: str) -> []:
         """Return the neighbors of a vertex v in lexicographic order."""
 
-        return sorted(self.adj_list.get(v, list()))
+        return list(self._sorted_neighbors(v))
 
     def connected_components(self) -> []:
         """Return a list of list containing all connected components in DFS order."""
@@ -297,16 +521,13 @@ class UndirectedGraph:
         if self.is_empty():
             return components
 
-        # Iterate through vertices, traversing from the start vertex using DFS order.
-        rem_vertices: list = self.get_vertices()
-        while len(rem_vertices) > 0:
-            v_start: str = rem_vertices.pop()
-            component: list = self.dfs(v_start)
-            components.append(component)
-
-            # Compute the set difference between remaining vertices and those just visited to determine if any
-            # components remain that haven't been traversed.
-            rem_vertices = list(set(rem_vertices) - set(component))
+        # Iterate through vertices, traversing from each vertex not yet visited using DFS order.
+        visited: set = set()
+        for v_start in reversed(self.get_vertices()):
+            if v_start not in visited:
+                component: list = self.dfs(v_start)
+                visited.update(component)
+                components.append(component)
 
         return components
 
@@ -314,3 +535,449 @@ class UndirectedGraph:
         """Return True if graph contains no vertices."""
 
         return len(self.adj_list) == 0
+
+    def write_edgelist(self, fp, vertices=None) -> None:
+        """
+        Writes a "u v" line for every edge to the text file fp, in lexicographic order.
+
+        If vertices is given, only edges between those vertices are written. The output can be read back with
+        edge_list.load_edge_list().
+        """
+
+        write_lines(fp, (f"{u} {v}\n" for u, v in self._export_edges(vertices)))
+
+    def write_adjacency(self, fp, vertices=None) -> None:
+        """
+        Writes a "v: u u ..." line for every vertex to the text file fp, in lexicographic order.
+
+        If vertices is given, only those vertices and the edges between them are written.
+        """
+
+        export_vertices, allowed = vertex_subset(self.get_vertices(), vertices)
+        write_lines(fp, (
+            f"{v}:" + "".join(f" {u}" for u in self._sorted_neighbors(v) if allowed is None or u in allowed) + "\n"
+            for v in export_vertices
+        ))
+
+    def write_dot(self, fp, vertices=None) -> None:
+        """
+        Writes the graph to the text file fp in the DOT language of Graphviz.
+
+        If vertices is given, only those vertices and the edges between them are written.
+        """
+
+        export_vertices, _ = vertex_subset(self.get_vertices(), vertices)
+        write_lines(fp, chain(
+            ["graph {\n"],
+            (f"  {dot_id(v)};\n" for v in export_vertices),
+            (f"  {dot_id(u)} -- {dot_id(v)};\n" for u, v in self._export_edges(vertices)),
+            ["}\n"]
+        ))
+
+    def _export_edges(self, vertices):
+        """Yields every edge between the given vertices once, with the lexicographically smaller endpoint first."""
+
+        export_vertices, allowed = vertex_subset(self.get_vertices(), vertices)
+        for u in export_vertices:
+            for v in self._sorted_neighbors(u):
+                if u < v and (allowed is None or v in allowed):
+                    yield u, v
+
+    def _connectivity(self) -> DisjointSet:
+        """Return the index of connected components, building it first if there is none."""
+
+        if self._components is None:
+            components: DisjointSet = (DynamicConnectivity if self._dynamic else DisjointSet)(self.adj_list)
+            for u, v in self.iter_edges():
+                components.union(u, v)
+
+            self._components = components
+
+        return self._components
+
+    def _drop_components(self) -> None:
+        """Drop the index of connected components so that the next query rebuilds it in a form that allows removals."""
+
+        self._components = None
+        self._dynamic = True
+
+    def _sorted_neighbors(self, v: str) -> []:
+        """
+        Return the neighbors of a vertex v in lexicographic order.
+
+        The list is cached until the edges of v change, so it must not be modified.
+        """
+
+        v_edges: _Neighbors = self.adj_list.get(v)
+        return v_edges.sorted() if v_edges is not None else list()
+
+
+class _Neighbors:
+    """
+    Neighbors of a vertex, kept as an insertion-ordered set that reads like a list.
+
+    Membership checks, appends and removals take O(1) time. The lexicographic order of the neighbors is cached until
+    they change. Compares equal to a list holding the same neighbors in the same order.
+    """
+
+    __slots__ = ("_items", "_sorted")
+
+    def __init__(self, items=()):
+        self._items: dict = dict.fromkeys(items)
+        self._sorted: list = None
+
+    def __repr__(self) -> str:
+        return repr(list(self._items))
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, _Neighbors):
+            return list(self._items) == list(other._items)
+        if isinstance(other, list):
+            return list(self._items) == other
+
+        return NotImplemented
+
+    __hash__ = None
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __reversed__(self):
+        return reversed(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, v) -> bool:
+        return v in self._items
+
+    def append(self, v) -> None:
+        """Add neighbor v after all existing neighbors."""
+
+        self._items[v] = None
+        self._sorted = None
+
+    def remove(self, v) -> None:
+        """Remove neighbor v. Raises ValueError if v is not a neighbor."""
+
+        try:
+            del self._items[v]
+        except KeyError:
+            raise ValueError(f"{v!r} is not a neighbor") from None
+
+        self._sorted = None
+
+    def sorted(self) -> []:
+        """Return the neighbors in lexicographic order, cached until they change."""
+
+        if self._sorted is None:
+            self._sorted = sorted(self._items)
+
+        return self._sorted
+
+
+class InternedUndirectedGraph(UndirectedGraph):
+    """
+    Class to implement a read-only undirected graph with interned vertex names
+    - vertex names are mapped to dense integer ids once, in lexicographic order
+    - adjacency is kept as compressed sparse rows of 32-bit ids
+
+    Public methods accept and return vertex names just like UndirectedGraph, but traversals run on the integer ids,
+    and each edge costs two 32-bit ints instead of two references in hashed adjacency sets.
+    """
+
+    def __init__(self, start_edges=None, vertices=None):
+        """Store graph info as interned vertex names and compressed adjacency arrays."""
+
+        # Vertex names sorted in lexicographic order, so that a vertex's id is its position in the list.
+        self.labels: list = list()
+        self.ids: dict = dict()
+
+        # The neighbors of vertex id v are targets[offsets[v]:offsets[v + 1]], sorted in ascending order.
+        self.offsets: array = array("q", [0])
+        self.targets: array = array("i")
+
+        self._build(start_edges if start_edges is not None else (), vertices if vertices is not None else ())
+
+    @classmethod
+    def from_edges(cls, edges, vertices=None) -> "InternedUndirectedGraph":
+        """
+        Return a new graph holding the given (u, v) edges and any extra vertices.
+
+        Follows the same rules as add_edge(): loops and duplicate edges are skipped.
+        """
+
+        return cls(edges, vertices)
+
+    @property
+    def adj_list(self) -> Mapping:
+        """Read-only mapping of each vertex to a list of its neighbors, built on access."""
+
+        return _InternedAdjacency(self)
+
+    def _read_only(self, *args) -> None:
+        raise TypeError("interned graphs are read-only, use UndirectedGraph to modify them")
+
+    add_vertex = add_vertices = remove_vertex = add_edge = add_edges = remove_edge = _read_only
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> "InternedUndirectedGraph":
+        """
+        Return a graph read from a file written by save().
+
+        If mmap is True, the adjacency arrays are memory-mapped rather than read, so processes that load the same file
+        share its pages. Only the vertex names are decoded up front. Raises ValueError if the file does not hold an
+        undirected graph.
+        """
+
+        v_count, (offsets, targets, name_offsets, names) = read_arrays(path, UNDIRECTED, mmap)
+
+        ud_graph: InternedUndirectedGraph = cls()
+        ud_graph.offsets, ud_graph.targets = offsets, targets
+        ud_graph.labels = [bytes(names[name_offsets[v]:name_offsets[v + 1]]).decode("utf-8") for v in range(v_count)]
+        ud_graph.ids = {label: v for v, label in enumerate(ud_graph.labels)}
+
+        return ud_graph
+
+    def save(self, path: str) -> None:
+        """
+        Write the graph to path in the binary graph file format.
+
+        Vertex names must be strings. Raises TypeError before writing anything if one is not.
+        """
+
+        for label in self.labels:
+            if not isinstance(label, str):
+                raise TypeError(f"graph files only hold string vertex names, not {type(label).__name__}")
+
+        # Vertex names are stored UTF-8 encoded back to back, with the offset of each name in a separate array.
+        names: array = array("B")
+        name_offsets: array = array("q", [0])
+        for label in self.labels:
+            names.frombytes(label.encode("utf-8"))
+            name_offsets.append(len(names))
+
+        write_arrays(path, UNDIRECTED, len(self.labels), [self.offsets, self.targets, name_offsets, names])
+
+    def get_vertices(self) -> []:
+        """Return list of vertices in the graph in lexicographic order."""
+
+        return list(self.labels)
+
+    def iter_edges(self):
+        """
+        Lazily yield every edge in the graph exactly once, in lexicographic order.
+
+        Edges are yielded as tuples of vertex endpoints, with the lexicographically smaller endpoint first.
+        """
+
+        labels: list = self.labels
+        for u in range(len(labels)):
+            for v in self._row(u):
+                if u < v:
+                    yield labels[u], labels[v]
+
+    @property
+    def vertex_count(self) -> int:
+        """Number of vertices in the graph."""
+
+        return len(self.labels)
+
+    @property
+    def edge_count(self) -> int:
+        """Number of edges in the graph."""
+
+        return len(self.targets) // 2
+
+    def iter_dfs(self, v_start: str, max_depth: int = None, prune=None):
+        """
+        Lazily yield (vertex, depth, parent) for every vertex visited during DFS search from v_start vertex.
+
+        If v_start is not in the graph, yields nothing.
+        Vertices deeper than the optional max_depth are not visited. If the optional prune(vertex, depth) callback
+        returns True, the search does not continue past that vertex.
+
+        Vertices are picked in ascending lexicographical order.
+        """
+
+        if v_start not in self.ids:
+            return iter(())
+
+        return self._labelled(depth_first(self.ids[v_start], self._row, max_depth, self._id_prune(prune)))
+
+    def iter_bfs(self, v_start: str, max_depth: int = None, prune=None):
+        """
+        Lazily yield (vertex, depth, parent) for every vertex visited during BFS search from v_start vertex.
+
+        If v_start is not in the graph, yields nothing.
+        Vertices deeper than the optional max_depth are not visited. If the optional prune(vertex, depth) callback
+        returns True, the search does not continue past that vertex.
+
+        Vertices are picked in ascending lexicographical order.
+        """
+
+        if v_start not in self.ids:
+            return iter(())
+
+        return self._labelled(breadth_first(self.ids[v_start], self._row, max_depth, self._id_prune(prune)))
+
+    def shortest_path(self, u: str, v: str) -> ([], int):
+        """
+        Return the vertices of a shortest path from vertex u to vertex v, along with its number of edges.
+
+        If v is not reachable from u, or either vertex does not exist, returns an empty path and infinity. The search
+        runs on vertex ids.
+        """
+
+        u_id, v_id = self.ids.get(u), self.ids.get(v)
+        if u_id is None or v_id is None:
+            return list(), float("inf")
+
+        path: list = [self.labels[w] for w in bidirectional_path(u_id, v_id, self._row)]
+        return (path, len(path) - 1) if path else (path, float("inf"))
+
+    def are_adjacent(self, u: str, v: str) -> bool:
+        """Returns True if two vertices u and v are joined by an edge."""
+
+        u_id, v_id = self.ids.get(u), self.ids.get(v)
+        if u_id is None or v_id is None:
+            return False
+
+        # Rows are sorted, so binary search for v.
+        start, end = self.offsets[u_id], self.offsets[u_id + 1]
+        i: int = bisect.bisect_left(self.targets, v_id, start, end)
+        return i < end and self.targets[i] == v_id
+
+    def degree(self, v: str) -> int:
+        """
+        Returns the number of edges incident to a given vertex v.
+
+        Returns -1 if vertex does not exist.
+        """
+
+        v_id: int = self.ids.get(v)
+        return self.offsets[v_id + 1] - self.offsets[v_id] if v_id is not None else -1
+
+    def is_empty(self) -> bool:
+        """Return True if graph contains no vertices."""
+
+        return len(self.labels) == 0
+
+    def _connectivity(self) -> DisjointSet:
+        """Return the disjoint set of connected components, building it on first use."""
+
+        if self._components is None:
+            components: DisjointSet = DisjointSet(self.labels)
+            for u in range(len(self.labels)):
+                for v in self._row(u):
+                    if u < v:
+                        components.union(self.labels[u], self.labels[v])
+
+            self._components = components
+
+        return self._components
+
+    def _sorted_neighbors(self, v: str) -> []:
+        """Return the neighbors of a vertex v in lexicographic order."""
+
+        v_id: int = self.ids.get(v)
+        return [self.labels[u] for u in self._row(v_id)] if v_id is not None else list()
+
+    def _row(self, v: int) -> array:
+        """Return the ids of the neighbors of vertex id v in ascending order."""
+
+        return self.targets[self.offsets[v]:self.offsets[v + 1]]
+
+    def _labelled(self, traversal):
+        """Yield (vertex, depth, parent) with vertex names for a traversal that runs on vertex ids."""
+
+        labels: list = self.labels
+        for v, depth, parent in traversal:
+            yield labels[v], depth, labels[parent] if parent is not None else None
+
+    def _id_prune(self, prune):
+        """Return a prune callback taking vertex ids that calls prune with vertex names."""
+
+        if prune is None:
+            return None
+
+        return lambda v, depth: prune(self.labels[v], depth)
+
+    def _build(self, edges, vertices) -> None:
+        """Intern all vertex names and fill the adjacency arrays from the given edges."""
+
+        # Give every vertex a temporary id in order of appearance, and keep edge endpoints as two id columns.
+        ids: dict = dict()
+        labels: list = list()
+        us: array = array("i")
+        vs: array = array("i")
+        for u, v in edges:
+            if u == v:
+                continue
+
+            for x in (u, v):
+                if x not in ids:
+                    ids[x] = len(labels)
+                    labels.append(x)
+            us.append(ids[u])
+            vs.append(ids[v])
+
+        for x in vertices:
+            if x not in ids:
+                ids[x] = len(labels)
+                labels.append(x)
+
+        # Renumber vertices in lexicographic order so that sorted ids are sorted names.
+        v_count: int = len(labels)
+        order: list = sorted(range(v_count), key=labels.__getitem__)
+        rank: array = array("i", bytes(4 * v_count))
+        for new_id, old_id in enumerate(order):
+            rank[old_id] = new_id
+        self.labels = [labels[old_id] for old_id in order]
+        self.ids = {label: v for v, label in enumerate(self.labels)}
+
+        # Count both directions of each edge, then place them with a counting sort.
+        counts: array = array("q", bytes(8 * (v_count + 1)))
+        for i in range(len(us)):
+            counts[rank[us[i]] + 1] += 1
+            counts[rank[vs[i]] + 1] += 1
+        for v in range(v_count):
+            counts[v + 1] += counts[v]
+
+        slots: array = counts[:-1]
+        targets: array = array("i", bytes(4 * counts[v_count]))
+        for i in range(len(us)):
+            u, v = rank[us[i]], rank[vs[i]]
+            targets[slots[u]] = v
+            slots[u] += 1
+            targets[slots[v]] = u
+            slots[v] += 1
+
+        # Sort each row and drop duplicate edges, compacting the rows as we go.
+        self.offsets = array("q", bytes(8 * (v_count + 1)))
+        self.targets = array("i")
+        for v in range(v_count):
+            self.targets.extend(sorted(set(targets[counts[v]:counts[v + 1]])))
+            self.offsets[v + 1] = len(self.targets)
+
+
+class _InternedAdjacency(Mapping):
+    """Read-only adjacency list view of an InternedUndirectedGraph."""
+
+    def __init__(self, ud_graph: InternedUndirectedGraph):
+        self._graph: InternedUndirectedGraph = ud_graph
+
+    def __getitem__(self, v: str) -> []:
+        if v not in self._graph.ids:
+            raise KeyError(v)
+
+        return self._graph._sorted_neighbors(v)
+
+    def __iter__(self):
+        return iter(self._graph.labels)
+
+    def __len__(self) -> int:
+        return len(self._graph.labels)
+
+    def __contains__(self, v) -> bool:
+        return v in self._graph.ids